@@ -34,14 +34,24 @@ def part2(nums: list) -> int:
     return _n_possible_combos(0)
 
 
+def parse(text: str) -> list:
+    nums = [int(line) for line in text.split()]
+    nums.append(0)  # Voltage starts at 0
+    nums.sort()
+    nums.append(nums[-1]+3) # Ends at the highest voltage + 3
+    return nums
+
+
+def solve(text: str) -> tuple:
+    nums = parse(text)
+    return part1(nums), part2(nums)
+
+
 def main():
     with open(FILENAME) as file:
-        nums = [int(line) for line in file]
-        nums.append(0)  # Voltage starts at 0
-        nums.sort()
-        nums.append(nums[-1]+3) # Ends at the highest voltage + 3
-    print("Part 1:", part1(nums))
-    print("Part 2:", part2(nums))
+        part_1, part_2 = solve(file.read())
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
 if __name__ == "__main__":
     main()
@@ -13,21 +13,30 @@
 
 
 slopes = [ (1,1), (3,1), (5,1), (7,1), (1,2) ]  # move (right, down) each loop
-print(slopes)
-trees_met = [0 for _ in range(len(slopes))]
-with open("day3.in") as file:
-    for i, row in enumerate(file):
-        row = row[:-1]  # Remove the trailing newline
+
+
+def count_trees(text: str) -> list:
+    trees_met = [0 for _ in range(len(slopes))]
+    for i, row in enumerate(text.splitlines()):
         for slope_num, (right, down) in enumerate(slopes):
             if (i % down) == 0:     # Stupid 1-right 2-down condition
                 #i //= down         # 
                 offset = ((i // down) * right) % len(row)
                 if row[offset] == '#':
                     trees_met[slope_num] += 1
-        print(trees_met)
+    return trees_met
+
+
+def solve(text: str) -> int:
+    product = 1
+    for t in count_trees(text):
+        product *= t
+    return product
+
 
-product = 1
-for t in trees_met:
-    product *= t
+def main():
+    with open("day3.in") as file:
+        print(solve(file.read()))
 
-print(i, trees_met, product)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
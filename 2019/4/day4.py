@@ -58,11 +58,10 @@ def populate_passport(line: str, passport: dict) -> None:
         key, val = group.split(':', maxsplit=1)
         passport[key] = val
 
-n_valid = 0
-passport = dict()
-
-with open("day4.in", 'r') as file:
-    for line in file:
+def solve(text: str) -> int:
+    n_valid = 0
+    passport = dict()
+    for line in text.splitlines():
         line = line.strip()
         if len(line) > 0:
             populate_passport(line, passport)
@@ -70,8 +69,15 @@ with open("day4.in", 'r') as file:
             if is_valid_passport(passport):
                 n_valid += 1
             passport.clear()
-# In case it doesn't end in a blankline
-if is_valid_passport(passport):
-    n_valid += 1
+    # In case it doesn't end in a blankline
+    if is_valid_passport(passport):
+        n_valid += 1
+    return n_valid
+
+
+def main():
+    with open("day4.in", 'r') as file:
+        print(solve(file.read()))
 
-print(n_valid)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
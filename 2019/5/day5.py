@@ -26,14 +26,18 @@ def get_seat_id(code: str) -> int:
     row = bsp(code[:7], 0, N_ROWS)
     col = bsp(code[7:], 0, N_COLS)
     seat_id = (row * N_COLS) + col
-    print(f"{row} * {N_COLS} + {col} = {seat_id}")
     return seat_id
 
-with open("day5.in", "r") as file:
-    used_seats = sorted(get_seat_id(line) for line in file)
-    for i in range(len(used_seats)):
-        print(used_seats[i], end=',')
-        assert used_seats[i] == used_seats[i+1] - 1
-        
+def solve(text: str) -> int:
+    """
+    Returns the highest seat ID
+    """
+    return max(get_seat_id(line) for line in text.splitlines())
+
 
+def main():
+    with open("day5.in", "r") as file:
+        print(solve(file.read()))
 
+if __name__ == "__main__":
+    main()
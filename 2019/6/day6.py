@@ -1,8 +1,8 @@
-total_score = 0
-group = set()
-first_line = True
-with open("day6.in", "r") as file:
-    for line in file:
+def solve(text: str) -> int:
+    total_score = 0
+    group = set()
+    first_line = True
+    for line in text.splitlines():
         line = line.strip()
         if len(line) > 0:
             if first_line:
@@ -15,6 +15,13 @@ with open("day6.in", "r") as file:
             group.clear()
             first_line = True
 
-total_score += len(group)
+    total_score += len(group)
+    return total_score
 
-print(total_score)
\ No newline at end of file
+
+def main():
+    with open("day6.in", "r") as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
@@ -25,24 +25,37 @@ def parse_bag_instructions(line: str) -> (str, list):
     return this_bag, can_hold
 
 
-all_bags = defaultdict(list)    # <ThisBag : Bags that can hold ThisBag>
-with open(INPUT_FILE, 'r') as file:
-    for line in file:
+def find_holders(text: str) -> set:
+    """
+    Returns every bag that can (eventually) hold a ROOT_BAG
+    """
+    all_bags = defaultdict(list)    # <ThisBag : Bags that can hold ThisBag>
+    for line in text.splitlines():
         this_bag, can_hold = parse_bag_instructions(line)
         for bag in can_hold:
             all_bags[bag].append(this_bag)
 
-# Plan: Add every bag that can hold shiny gold to a set
-# Add every bag that can hold *those* bags to the set
-# Repeat until the set stops updating
-orig_valid_len = 0
-valid_bags = set(all_bags[ROOT_BAG])
-while orig_valid_len != len(valid_bags):
-    orig_valid_len = len(valid_bags)
-    to_add = set()
-    for bag in valid_bags:
-        to_add.update(all_bags[bag])
-    valid_bags.update(to_add)
-
-print(valid_bags)
-print(len(valid_bags))
\ No newline at end of file
+    # Plan: Add every bag that can hold shiny gold to a set
+    # Add every bag that can hold *those* bags to the set
+    # Repeat until the set stops updating
+    orig_valid_len = 0
+    valid_bags = set(all_bags[ROOT_BAG])
+    while orig_valid_len != len(valid_bags):
+        orig_valid_len = len(valid_bags)
+        to_add = set()
+        for bag in valid_bags:
+            to_add.update(all_bags[bag])
+        valid_bags.update(to_add)
+    return valid_bags
+
+
+def solve(text: str) -> int:
+    return len(find_holders(text))
+
+
+def main():
+    with open(INPUT_FILE, 'r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
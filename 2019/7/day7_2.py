@@ -50,12 +50,19 @@ def number_of_bags(tree: dict, node: str) -> int:
     return total_bags
 
 
-all_bags = dict()       # <ThisBag : Bags it directly contains>
-with open(INPUT_FILE, 'r') as file:
-    for line in file:
+def solve(text: str) -> int:
+    all_bags = dict()       # <ThisBag : Bags it directly contains>
+    for line in text.splitlines():
         this_bag, can_hold = parse_bag_instructions(line)
         all_bags[this_bag] = (can_hold)
 
-# from pprint import pprint; pprint(all_bags);
+    # from pprint import pprint; pprint(all_bags);
+    return number_of_bags(all_bags, ROOT_BAG)
 
-print(number_of_bags(all_bags, ROOT_BAG))
\ No newline at end of file
+
+def main():
+    with open(INPUT_FILE, 'r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
@@ -21,28 +21,36 @@ def execute_instruction(instruction: (str, int), acc: int, pc: int) -> (int, int
     return (acc, pc)
 
 
-def main():
+def parse(text: str) -> list:
+    instructions = []
+    for line in text.splitlines():
+        cmd, val = line.split(' ', maxsplit=1)
+        instructions.append((cmd, int(val)))
+    return instructions
+
+
+def solve(text: str) -> int:
+    """
+    Runs the program until an instruction is about to run twice, returning acc.
+    Raises `ValueError` if it ends cleanly or flies out of bounds
+    """
+    instructions = parse(text)
     acc = 0
     pc = 0
-    instructions = []
-    with open(INPUT_FILE, 'r') as file:
-        for line in file:
-            cmd, val = line.split(' ', maxsplit=1)
-            instructions.append((cmd, int(val)))
-    
     seen_numbers = set()
-    while True:
-        if pc in seen_numbers:
-            raise ValueError(f"{pc} has been executed twice")
+    while pc not in seen_numbers:
+        if pc == len(instructions):
+            raise ValueError("The program ended without looping")
         if not (0 <= pc < len(instructions)):
             raise ValueError(f"{pc} has flown out of bounds [0, {len(instructions)})")
-        if pc == len(instructions):
-            print(pc, "has reached the end cleanly")
-            break
         seen_numbers.add(pc)
-        print(instructions[pc], end=" -> ")
         acc, pc = execute_instruction(instructions[pc], acc, pc)
-        print(instructions[pc], acc, pc)
+    return acc
+
+
+def main():
+    with open(INPUT_FILE, 'r') as file:
+        print(solve(file.read()))
 
 
 if __name__ == "__main__":
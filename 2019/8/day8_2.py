@@ -52,7 +52,6 @@ def execute_program(instructions: list) -> int:
             raise ValueError(
                 f"{pc} has flown out of bounds [0, {len(instructions)})")
         if pc == len(instructions):
-            print(pc, "has reached the end cleanly")
             break
         seen_numbers.add(pc)
         acc, pc = execute_instruction(instructions[pc], acc, pc)
@@ -82,24 +81,27 @@ def part2(commands: list) -> int:
         try:
             acc = execute_program(commands)
             return acc
-        except ValueError as e:
-            print(i, '|', e)
+        except ValueError:
             commands[i] = (cmd, val)
 
     raise ValueError("Valid program not found")
 
 
-def main():
-    acc = 0
-    pc = 0
+def parse(text: str) -> list:
     instructions = []
-    with open(INPUT_FILE, 'r') as file:
-        for line in file:
-            cmd, val = line.split(' ', maxsplit=1)
-            instructions.append((cmd, int(val)))
+    for line in text.splitlines():
+        cmd, val = line.split(' ', maxsplit=1)
+        instructions.append((cmd, int(val)))
+    return instructions
+
 
-    # part1(instructions)
-    print(part2(instructions))
+def solve(text: str) -> int:
+    return part2(parse(text))
+
+
+def main():
+    with open(INPUT_FILE, 'r') as file:
+        print(solve(file.read()))
 
 
 if __name__ == "__main__":
@@ -44,18 +44,22 @@ def part2(nums: list, broken_num: int) -> (int, int):
                 break
 
 
+def solve(text: str) -> tuple:
+    """
+    Returns (the broken number, the sum of the smallest & largest in its window)
+    """
+    nums = [int(line) for line in text.split()]
+    broken_num = part1(nums)
+    i, j = part2(nums, broken_num)
+    window = nums[i:j+1]
+    return broken_num, min(window) + max(window)
+
+
 def main():
     with open(FILENAME, 'r') as file:
-        global nums
-        nums = [int(line) for line in file]
-    broken_num = part1(nums)
+        broken_num, weakness = solve(file.read())
     print(broken_num)
-    i, j =part2(nums, broken_num)
-    window = nums[i:j+1]
-    print(i, j)
-    print(window)
-    print(sum(window))
-    print(min(window), max(window))
+    print(weakness)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,14 +6,22 @@ larger than the last
 from pathlib import Path
 p = Path(__file__).with_name("input")
 
-count = 0
 
-with p.open('r') as file:
-    prev = int(file.readline())
-    for now in file:
+def solve(text: str) -> int:
+    count = 0
+    lines = iter(text.split())
+    prev = int(next(lines))
+    for now in lines:
         now = int(now)
         if now > prev:
             count += 1
         prev = now
+    return count
 
-print(count)
\ No newline at end of file
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
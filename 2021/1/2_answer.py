@@ -4,19 +4,87 @@ Is this sum of 3 larger than the last?
 
 We can change this problem to a window
 of size-4, and check [A, _, _, B]; B > A?
+
+So for any window size k, it's just counting a[i+k] > a[i].
+With NumPy that's one comparison, a[k:] > a[:-k], over the whole array.
+
+For huge depth logs, `count_increases_in_file()` streams the file instead
+of reading it in: it's memory-mapped, and parsed a chunk at a time (cut at
+a newline), carrying the last k depths over to the next chunk so the
+windows that straddle a cut still get compared.
 """
 
+import mmap
 from pathlib import Path
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:     # Chunks are parsed and compared in pure Python instead
+    np = None
+
 p = Path(__file__).with_name("input")
 
-count = 0
+# Vars
+WINDOW = 3
+CHUNK_SIZE = 1 << 24    # Bytes of the file to parse at a time (16 MiB)
+
+
+def parse(text) -> Sequence[int]:
+    """
+    Parses the depths from `text` (str or bytes), as an array if NumPy's installed
+    """
+    if np is not None:
+        # Stripped, as a whitespace-only string would parse as [0]
+        return np.fromstring(text.strip(), dtype=np.int64, sep=' ')
+    return [int(n) for n in text.split()]
+
+
+def count_increases(depths: Sequence[int], window: int) -> int:
+    """
+    Counts how often the sum of `window` depths is larger than the one before it
+    """
+    if len(depths) <= window:
+        return 0
+    if np is not None:
+        return int(np.count_nonzero(depths[window:] > depths[:-window]))
+    return sum(now > before for before, now in zip(depths, depths[window:]))
+
+
+def count_increases_in_file(path: Path, window: int = WINDOW, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    `count_increases()`, streamed from a memory-mapped file
+    """
+    count = 0
+    carried = parse(b'')    # The last `window` depths of the previous chunk
+    with path.open('rb') as file:
+        if path.stat().st_size == 0:
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < len(data):
+                end = start + chunk_size
+                if end < len(data):
+                    # Finish the line the chunk stops in
+                    cut = data.find(b'\n', end - 1)
+                    end = len(data) if cut == -1 else cut + 1
+                depths = parse(data[start:end])
+                if np is not None:
+                    depths = np.concatenate((carried, depths))
+                else:
+                    depths = carried + depths
+                count += count_increases(depths, window)
+                carried = depths[-window:]
+                start = end
+    return count
+
+
+def solve(text: str) -> int:
+    return count_increases(parse(text), WINDOW)
+
 
-with p.open('r') as file:
-    nums = [int(file.readline()) for _ in range(3)]
-    for now in file:
-        nums.append(int(now))
-        if nums[3] > nums[0]:
-            count += 1
-        del nums[0]
+def main():
+    print(count_increases_in_file(p))
 
-print(count)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -54,12 +54,20 @@ def parsed_corrupted_score(line: str) -> int:
 
 
 
-with p.open('r') as file:
-    lines = [line.strip() for line in file]
+def solve(text: str) -> int:
+    lines = [line.strip() for line in text.splitlines()]
 
-total = 0
+    total = 0
+    for line in lines:
+        score = parsed_corrupted_score(line)
+        total += score
+    return total
 
-for line in lines:
-    score = parsed_corrupted_score(line)
-    total += score
-print(f"{total = }")
\ No newline at end of file
+
+def main():
+    with p.open('r') as file:
+        total = solve(file.read())
+    print(f"{total = }")
+
+if __name__ == "__main__":
+    main()
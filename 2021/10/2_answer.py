@@ -20,61 +20,113 @@ For every missing character, score *= 5; score += char's score
 
 Each incomplete line is assigned this score, the question's answer
 is the median of these scores
+
+Rather than a stack per character, every matched pair "()", "[]", "{}", "<>"
+is deleted with `str.replace()`, over and over until nothing changes.
+What's left is:
+  - Corrupted: It has an end bracket in it, and the first one's the culprit
+  - Incomplete: Only start brackets. The completion's score is those, reversed,
+    as base-5 digits ('(' -> 1 ... '<' -> 4), so it's a translate and an int()
+So each line gets both its part 1 and part 2 score in one go.
+Lines can come from a file, streamed, and the median's found with
+quickselect instead of sorting every score.
 """
 
+import random
+import re
 from pathlib import Path
-from statistics import median
+from typing import Iterable, Optional
 p = Path(__file__).with_name("input")
 
 # Vars
-STARTS = {
-    '(': 1,
-    '[': 2,
-    '{': 3,
-    '<': 4
+FIRST_END = re.compile(r"[)\]}>]")
+CORRUPTED_SCORES = {
+    ')': 3,
+    ']': 57,
+    '}': 1197,
+    '>': 25137
 }
-ENDS = ")]}>"
-PAIRS = dict(("()", "<>", "{}", "[]"))
+COMPLETION_DIGITS = str.maketrans("([{<", "1234")
+NOT_BRACKETS = str.maketrans('', '', "()[]{}<>")
+
+
+def check_line(line: str) -> tuple[int, Optional[int]]:
+    """
+    Returns the line's (corrupted score, completion score).
+    Corrupted lines have no completion score (None), and incomplete
+    lines score 0 for being corrupted
+    """
+    while True:
+        reduced = line.replace("()", '').replace("[]", '').replace("{}", '').replace("<>", '')
+        if len(reduced) == len(line):
+            break
+        line = reduced
+    if line.translate(NOT_BRACKETS):
+        raise ValueError(f"I can't handle {line.translate(NOT_BRACKETS)!r} !!!")
+    # Whichever end bracket comes first is the wrong one
+    first_end = FIRST_END.search(line)
+    if first_end is not None:
+        return CORRUPTED_SCORES[first_end.group()], None
+    if not line:
+        return 0, 0
+    return 0, int(line[::-1].translate(COMPLETION_DIGITS), base=5)
+
+
+def check_lines(lines: Iterable[str]) -> tuple[int, list[int]]:
+    """
+    Returns the total corrupted score, and every incomplete line's completion score.
+    `lines` can be a file, to stream it
+    """
+    corrupted_total = 0
+    completion_scores = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        corrupted, completion = check_line(line)
+        corrupted_total += corrupted
+        if completion is not None:
+            completion_scores.append(completion)
+    return corrupted_total, completion_scores
 
 
-def parsed_line_score(line: str) -> int:
+def select(nums: list[int], k: int) -> int:
     """
-    Interprets the given 'chunks'.
-    Returns the 'score' needed to 
+    Returns what would be nums[k] if `nums` were sorted (quickselect)
     """
-    stack = []
-    # Firstly, filter out line if corrupted
-    for c in line:
-        if c in STARTS:
-            # If you're starting a bracket, don't think just add
-            stack.append(c)
-        elif c in ENDS:
-            # Check if a corresponding start exists
-            if len(stack) == 0:
-                return -1
-            head = stack[-1]
-            if head in STARTS and PAIRS[head] == c:
-                stack.pop()
-            else:
-                return -1
-        else:
-            raise ValueError(f"I can't handle {c!r} !!!")
-    # Now, figure out the scores
-    score = 0
-    for c in reversed(stack):
-        score *= 5
-        score += STARTS[c]
-    return score
-
-
-with p.open('r') as file:
-    lines = [line.strip() for line in file]
-
-
-scores = []
-for line in lines:
-    score = parsed_line_score(line)
-    if score != -1:
-        scores.append(score)
-
-print(median(scores))
\ No newline at end of file
+    while True:
+        pivot = random.choice(nums)
+        lower = [n for n in nums if n < pivot]
+        if k < len(lower):
+            nums = lower
+            continue
+        n_equal = nums.count(pivot)
+        if k < len(lower) + n_equal:
+            return pivot
+        k -= len(lower) + n_equal
+        nums = [n for n in nums if n > pivot]
+
+
+def median(nums: list[int]):
+    """
+    Same as `statistics.median()`, but without sorting
+    """
+    middle = len(nums) // 2
+    if len(nums) % 2:
+        return select(nums, middle)
+    return (select(nums, middle - 1) + select(nums, middle)) / 2
+
+
+def solve(text: str) -> int:
+    _, completion_scores = check_lines(text.splitlines())
+    return median(completion_scores)
+
+
+def main():
+    with p.open('r') as file:
+        corrupted_total, completion_scores = check_lines(file)
+    print(f"{corrupted_total = }")
+    print(f"Completion median = {median(completion_scores)}")
+
+if __name__ == "__main__":
+    main()
@@ -12,61 +12,49 @@ blinks until next turn.
 Part 1 question: How many flashes happen in 100 cycles?
 """
 
+import sys
 from collections import deque
-from heapq import heappop, heappush
 from pathlib import Path
-p = Path(__file__).with_name("input")
-
-N_CYCLES = 100
 
-def neighbours(grid, i, j):
-    """
-    Generator.
-    Returns the co-ords of all 8 neighbours
-    """
-    for di in (-1, 0, 1):
-        for dj in (-1, 0, 1):
-            if di == dj == 0:
-                continue
-            ni = i + di
-            nj = j + dj
-            if 0 <= ni < len(grid) and 0 <= nj < len(grid[ni]):
-                yield (ni, nj)
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import BORDER, Grid
 
+p = Path(__file__).with_name("input")
 
+N_CYCLES = 100
 
 
-def main():
-    with p.open('r') as file:
-        grid = [[int(i) for i in line.strip()]
-                for line in file
-                if line.strip()
-                ]
+def solve(text: str) -> int:
+    grid = Grid.parse(text, digits=True)
+    cells = grid.cells
+    indices = list(grid.indices())
 
     frontier = deque()
-    height = len(grid)
-    width = len(grid[0])
     n_flashes = 0
     for _ in range(N_CYCLES):
         # Step 1: Increment all by 1, tracking what's blinked
-        for i in range(height):
-            for j in range(width):
-                grid[i][j] += 1
-                if grid[i][j] > 9:
-                    frontier.append((i, j))
+        for i in indices:
+            cells[i] += 1
+            if cells[i] > 9:
+                frontier.append(i)
         # Step 2: Use BFS to cascade the blinks
         while len(frontier) > 0:
-            i, j = frontier.popleft()
-            if grid[i][j] == 0: # It's already blinked
+            i = frontier.popleft()
+            # It's already blinked, or it's off the grid
+            if cells[i] == 0 or cells[i] == BORDER:
                 continue
-            grid[i][j] += 1
-            if grid[i][j] > 9:
+            cells[i] += 1
+            if cells[i] > 9:
                 # Blink, mark as blinked, and cascade
-                grid[i][j] = 0
+                cells[i] = 0
                 n_flashes += 1
-                frontier.extend(neighbours(grid, i, j))
-    
-    print(n_flashes)
+                frontier.extend(i + offset for offset in grid.adjacent)
+    return n_flashes
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
 if __name__ == "__main__":
     main()
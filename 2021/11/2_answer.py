@@ -11,64 +11,124 @@ blinks until next turn.
 
 Part 2 question: How many cycles does it take until every
 tile flashes at once?
+
+There are two engines:
+  - The flat grid + BFS one, best for the puzzle's 10x10 grid
+  - A NumPy one (if it's installed), which does each cycle as whole-array operations:
+      increment, mask the cells > 9, add each new flash to its 3x3 neighbourhood,
+      and repeat until no new cells flash, then reset the flashed cells.
+    Only the cascade rounds are looped over in Python, so it's the one for
+    large grids (1000x1000+), and it's picked automatically for them.
 """
 
+import sys
 from collections import deque
 from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import BORDER, Grid
+
+try:
+    import numpy as np
+except ImportError:     # Only the grid engine is available
+    np = None
+
 p = Path(__file__).with_name("test_input")
 
+# Vars
+NUMPY_MIN_CELLS = 10_000    # Below this, NumPy's per-call overhead outweighs the savings
+NEIGHBOUR_OFFSETS = tuple((di, dj)
+                          for di in (-1, 0, 1)
+                          for dj in (-1, 0, 1)
+                          if not di == dj == 0)
 
-def neighbours(grid, i, j):
-    """
-    Generator.
-    Returns the co-ords of all 8 neighbours
-    """
-    for di in (-1, 0, 1):
-        for dj in (-1, 0, 1):
-            if di == dj == 0:
-                continue
-            ni = i + di
-            nj = j + dj
-            if 0 <= ni < len(grid) and 0 <= nj < len(grid[ni]):
-                yield (ni, nj)
 
+def parse(text: str) -> Grid:
+    return Grid.parse(text, digits=True)
 
 
+def parse_array(text: str) -> 'np.ndarray':
+    rows = text.split()
+    digits = np.frombuffer(''.join(rows).encode(), dtype=np.uint8)
+    return (digits - ord('0')).reshape(len(rows), -1)
 
-def main():
-    with p.open('r') as file:
-        grid = [[int(i) for i in line.strip()]
-                for line in file
-                if line.strip()
-                ]
 
+def run_until_synced(grid: Grid) -> int:
+    """
+    Steps `grid` in place until every octopus flashes at once,
+    returning how many cycles that took
+    """
+    cells = grid.cells
+    indices = list(grid.indices())
     frontier = deque()
-    height = len(grid)
-    width = len(grid[0])
     n_flashes = 0
     n_cycles = 0
-    while n_flashes != height * width:
+    while n_flashes != len(grid):
         n_flashes = 0
         n_cycles += 1
         # Step 1: Increment all by 1, tracking what's blinked
-        for i in range(height):
-            for j in range(width):
-                grid[i][j] += 1
-                if grid[i][j] > 9:
-                    frontier.append((i, j))
+        for i in indices:
+            cells[i] += 1
+            if cells[i] > 9:
+                frontier.append(i)
         # Step 2: Use BFS to cascade the blinks
         while len(frontier) > 0:
-            i, j = frontier.popleft()
-            if grid[i][j] == 0: # We've already processed it
+            i = frontier.popleft()
+            # We've already processed it, or it's off the grid
+            if cells[i] == 0 or cells[i] == BORDER:
                 continue
-            grid[i][j] += 1
-            if grid[i][j] > 9:
-                grid[i][j] = 0
+            cells[i] += 1
+            if cells[i] > 9:
+                cells[i] = 0
                 n_flashes += 1
-                frontier.extend(neighbours(grid, i, j))
-    
-    print(f"{n_flashes=}, {width=}, {height=}, {n_cycles=}")
-    print(*(''.join(str(n) for n in line) for line in grid), sep='\n')
+                frontier.extend(i + offset for offset in grid.adjacent)
+    return n_cycles
+
+
+def step_array(energy: 'np.ndarray') -> int:
+    """
+    Steps `energy` (a 2D uint8 array) one cycle in place,
+    returning how many octopuses flashed
+    """
+    height, width = energy.shape
+    energy += 1
+    flashed = np.zeros(energy.shape, dtype=bool)
+    new_flashes = energy > 9
+    # The new flashes sit in the middle of a zeroed frame, so that each
+    # neighbour's contribution is just a shifted window over it
+    padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    while new_flashes.any():
+        flashed |= new_flashes
+        padded[1:-1, 1:-1] = new_flashes
+        for di, dj in NEIGHBOUR_OFFSETS:
+            energy += padded[1+di:height+1+di, 1+dj:width+1+dj]
+        new_flashes = (energy > 9) & ~flashed
+    energy[flashed] = 0
+    return int(np.count_nonzero(flashed))
+
+
+def run_until_synced_array(energy: 'np.ndarray') -> int:
+    """
+    NumPy version of `run_until_synced()`
+    """
+    n_cycles = 0
+    while True:
+        n_cycles += 1
+        if step_array(energy) == energy.size:
+            return n_cycles
+
+
+def solve(text: str) -> int:
+    # The input's length is close enough to its number of cells
+    if np is not None and len(text) >= NUMPY_MIN_CELLS:
+        return run_until_synced_array(parse_array(text))
+    return run_until_synced(parse(text))
+
+
+def main():
+    with p.open('r') as file:
+        n_cycles = solve(file.read())
+    print(f"{n_cycles=}")
 
 if __name__ == "__main__":
     main()
@@ -16,35 +16,47 @@ from collections import defaultdict, deque
 from pathlib import Path
 p = Path(__file__).with_name("input")
 
-# Vars
-layout = defaultdict(list)
-frontier = deque()
-complete_paths = []
-
-# Build the connections
-with p.open('r') as file:
-    for line in file:
+def find_paths(text: str) -> list:
+    """
+    Returns every complete path from start->end, as 'start,A,b,end' strings
+    """
+    layout = defaultdict(list)
+    frontier = deque()
+    complete_paths = []
+
+    # Build the connections
+    for line in text.splitlines():
         lhs, _, rhs = line.partition('-')
         lhs = lhs.strip()
         rhs = rhs.strip()
         layout[lhs].append(rhs)
         layout[rhs].append(lhs)
 
-# Now BFS
-frontier.append( ('start',) )
-while len(frontier) > 0:
-    path = frontier.popleft()
-    head = path[-1]
-    # Have we reached the end?
-    if head == 'end':
-        complete_paths.append( ','.join(path) )
-        continue
-    # Prune if a lowercase node repeats
-    if head.islower() and path.count(head) >= 2:
-        continue
-    for neighbour in layout[head]:
-        frontier.append( path + (neighbour,) )
-
-for path in complete_paths:
-    print(path)
-print(f"{len(complete_paths) = }")
\ No newline at end of file
+    # Now BFS
+    frontier.append( ('start',) )
+    while len(frontier) > 0:
+        path = frontier.popleft()
+        head = path[-1]
+        # Have we reached the end?
+        if head == 'end':
+            complete_paths.append( ','.join(path) )
+            continue
+        # Prune if a lowercase node repeats
+        if head.islower() and path.count(head) >= 2:
+            continue
+        for neighbour in layout[head]:
+            frontier.append( path + (neighbour,) )
+    return complete_paths
+
+
+def solve(text: str) -> int:
+    return len(find_paths(text))
+
+
+def main():
+    with p.open('r') as file:
+        n_paths = solve(file.read())
+    print(f"{n_paths = }")
+
+if __name__ == "__main__":
+    main()
@@ -12,74 +12,93 @@ Upper case nodes can be revisited many times
 
 Part 2 question: How many unique paths from start->end are there?
 
-In this, the paths are stored as tuples of nodes.
+Originally the paths were stored (and checked) as tuples of nodes.
+Now they're only counted, with a memoised DFS:
+- Every cave gets a small integer id, so the small caves already on the
+  path fit in a single int bitmask
+- The number of ways to finish a path only depends on
+  (current cave, small caves visited, whether the revisit's been used),
+  so each of those states is only ever expanded once
 """
 
-from collections import defaultdict, deque, Counter
+import dataclasses
+from functools import lru_cache
 from pathlib import Path
 p = Path(__file__).with_name("input")
 
-def path_is_valid(path) -> bool:
-    """
-    Returns if the given path is valid.
-    Current rules: A single lower node can be
-    revisited twice.
+# Vars
+START = 'start'
+END = 'end'
 
-    This function goes off the assumption that everything
-    before the head is valid.
-    """
-    counter = Counter(path)
-    # We can't revisit 'start'
-    if counter['start'] > 1:
-        return False
-    # Now check for repeats
-    has_repeat = False
-    for c, n in counter.most_common():
-        # Ignore uppers
-        if c.isupper():
-            continue
-        # Can't visit more than twice
-        if n > 2:
-            return False
-        # Check it's the only repeat
-        if n == 2:
-            if has_repeat:
-                return False
-            else:
-                has_repeat = True
-    # Passed all checks
-    return True
 
+# Classes
+@dataclasses.dataclass
+class CaveSystem:
+    start: int
+    end: int
+    small_caves: int                # Bitmask of the small (lower case) caves' ids
+    connections: list[list[int]]    # connections[cave] = the caves it leads to
 
-# Vars
-layout = defaultdict(list)
-frontier = deque()
-complete_paths = []
 
-# Build the connections
-with p.open('r') as file:
-    for line in file:
+# Funcs
+def parse(text: str) -> CaveSystem:
+    ids = {}
+    connections = []
+    def cave_id(name: str) -> int:
+        if name not in ids:
+            ids[name] = len(ids)
+            connections.append([])
+        return ids[name]
+
+    # Build the connections
+    for line in text.split():
         lhs, _, rhs = line.partition('-')
-        lhs = lhs.strip()
-        rhs = rhs.strip()
-        layout[lhs].append(rhs)
-        layout[rhs].append(lhs)
-
-# Now BFS
-frontier.append( ('start',) )
-while len(frontier) > 0:
-    path = frontier.popleft()
-    head = path[-1]
-    # Have we reached the end?
-    if head == 'end':
-        complete_paths.append( ','.join(path) )
-        continue
-    # Prune if a lowercase node repeats
-    if not path_is_valid(path):
-        continue
-    for neighbour in layout[head]:
-        frontier.append( path + (neighbour,) )
-
-# for path in complete_paths:
-#     print(path)
-print(f"{len(complete_paths) = }")
\ No newline at end of file
+        a, b = cave_id(lhs), cave_id(rhs)
+        # Nothing leads back into 'start'
+        if rhs != START:
+            connections[a].append(b)
+        if lhs != START:
+            connections[b].append(a)
+
+    small_caves = sum(1 << cave for name, cave in ids.items() if name.islower())
+    return CaveSystem(ids[START], ids[END], small_caves, connections)
+
+
+def count_paths(caves: CaveSystem, allow_revisit: bool = True) -> int:
+    """
+    Returns how many paths there are from start->end.
+    With `allow_revisit`, a single small cave can be visited twice
+    """
+    end = caves.end
+    small_caves = caves.small_caves
+    connections = caves.connections
+
+    @lru_cache(maxsize=None)
+    def paths_from(cave: int, visited: int, revisit_used: bool) -> int:
+        if cave == end:
+            return 1
+        total = 0
+        for next_cave in connections[cave]:
+            bit = 1 << next_cave
+            if not small_caves & bit:       # Big caves can always be revisited
+                total += paths_from(next_cave, visited, revisit_used)
+            elif not visited & bit:
+                total += paths_from(next_cave, visited | bit, revisit_used)
+            elif not revisit_used:
+                total += paths_from(next_cave, visited, True)
+        return total
+
+    return paths_from(caves.start, 1 << caves.start, not allow_revisit)
+
+
+def solve(text: str) -> int:
+    return count_paths(parse(text))
+
+
+def main():
+    with p.open('r') as file:
+        n_paths = solve(file.read())
+    print(f"{n_paths = }")
+
+if __name__ == "__main__":
+    main()
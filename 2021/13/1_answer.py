@@ -22,11 +22,6 @@ from pathlib import Path
 from typing import Tuple
 p = Path(__file__).with_name("input")
 
-# Vars
-dots = set()
-instructions = []
-
-
 def partition(dots: set, axis: str, pos: int) -> Tuple[set, set]:
     """
     Takes a set of co-ordinate pairs (x, y), an axis ('x' or 'y'), and a pos.
@@ -51,24 +46,39 @@ def fold(dots: set, axis: str, pos: int) -> set:
     return lhs
 
 
-with p.open('r') as file:
+def parse(text: str) -> Tuple[set, list]:
+    """
+    Returns (the set of dots, the list of (axis, pos) fold instructions)
+    """
+    dots = set()
+    instructions = []
+    lines = iter(text.splitlines())
     # Parse dots
-    for line in file:
+    for line in lines:
         # Instructions separated by blank line
-        if line.isspace():
+        if not line or line.isspace():
             break
         x, _, y = line.partition(',')
         dots.add((int(x), int(y)))
     # Remaining lines are instructions
-    for line in file:
+    for line in lines:
         axis, _, pos = line.partition('=')
         axis = axis.lstrip('fold along ')
         pos = int(pos)
         instructions.append((axis, pos))
+    return dots, instructions
+
+
+def solve(text: str) -> int:
+    dots, instructions = parse(text)
+    axis, pos = instructions[0]
+    return len(fold(dots, axis, pos))
+
+
+def main():
+    with p.open('r') as file:
+        n_dots = solve(file.read())
+    print(f"{n_dots = }")
 
-axis, pos = instructions[0]
-lhs, rhs = partition(dots, axis, pos)
-folded = fold(dots, axis, pos)
-print(sorted(lhs), sorted(rhs))
-print()
-print(sorted(folded), '=', len(folded))
\ No newline at end of file
+if __name__ == "__main__":
+    main()
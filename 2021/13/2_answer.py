@@ -16,68 +16,140 @@ e.g.
 .....#.    x = 4      ...#
     ^
 Part 2 question: What does the output look like?
+
+A fold along x only ever changes x, and y folds only y, so each axis is
+done on its own: the x coordinates that are used are put through all the
+x folds, giving one mapping of old x -> folded x (same for y), and then
+each dot is just looked up in both. A dot exactly on a fold line is
+destroyed, so it's mapped to nothing.
+With NumPy (and enough dots), each fold of the distinct coordinates is one
+`where(coord > pos, 2*pos - coord, coord)`, and overlapping dots are only
+merged at the very end.
 """
 
 from pathlib import Path
 from typing import Tuple
+
+try:
+    import numpy as np
+except ImportError:     # Only the dict engine is available
+    np = None
+
 p = Path(__file__).with_name("input")
 
 # Vars
-dots = set()
-instructions = []
+NUMPY_MIN_DOTS = 10_000     # Below this, NumPy's per-call overhead outweighs the savings
 
 
-def partition(dots: set, axis: str, pos: int) -> Tuple[set, set]:
+def fold_axis(coords: set, positions: list) -> dict:
     """
-    Takes a set of co-ordinate pairs (x, y), an axis ('x' or 'y'), and a pos.
-    Returns two sets: One of all the co-ords left/above the given line pos,
-    and one to the right/below the line pos.
-    Note: This function will destroy any items on a line
+    Puts coordinates through every fold along their axis, in order.
+    Returns {coord: folded coord}, or None for ones that land on a fold line
     """
-    index = {'x': 0, 'y': 1}[axis]  # x is first index in tuple, y is second index
-    lhs = {pair for pair in dots if pair[index] < pos}
-    rhs = {pair for pair in dots if pair[index] > pos}
-    return lhs, rhs
+    # Fold the distinct values one fold at a time, as they merge
+    # there's fewer left to fold (folding in half halves them)
+    folds = []
+    for pos in positions:
+        fold = {coord: None if coord == pos else pos - (coord - pos) if coord > pos else coord
+                for coord in coords}
+        folds.append(fold)
+        coords = {coord for coord in fold.values() if coord is not None}
+    # Then chain them together from the last fold back
+    folded = {coord: coord for coord in coords}
+    for fold in reversed(folds):
+        folded = {coord: None if to is None else folded[to] for coord, to in fold.items()}
+    return folded
 
 
-def fold(dots: set, axis: str, pos: int) -> set:
-    lhs, rhs = partition(dots, axis, pos)
-    for x, y in rhs:
-        if axis == 'x':
-            pair = (pos - (x - pos), y)
-        else:
-            pair = (x, pos - (y - pos))
-        lhs.add(pair)
-    return lhs
+def fold_all(xs: list, ys: list, instructions: list) -> set:
+    """
+    Returns the set of dots left after every fold
+    """
+    new_x = fold_axis(set(xs), [pos for axis, pos in instructions if axis == 'x'])
+    new_y = fold_axis(set(ys), [pos for axis, pos in instructions if axis == 'y'])
+    return {(new_x[x], new_y[y]) for x, y in zip(xs, ys)
+            if new_x[x] is not None and new_y[y] is not None}
 
 
-with p.open('r') as file:
+def fold_array(coords: 'np.ndarray', positions: list) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    NumPy version of `fold_axis()`, on every coordinate at once.
+    Returns (the folded coordinates, which ones didn't land on a fold line)
+    """
+    # Only the distinct values need folding, `inverse` puts them back
+    coords, inverse = np.unique(coords, return_inverse=True)
+    kept = np.ones(coords.shape, dtype=bool)
+    for pos in positions:
+        kept &= coords != pos
+        coords = np.where(coords > pos, 2*pos - coords, coords)
+    return coords[inverse], kept[inverse]
+
+
+def fold_all_array(xs: list, ys: list, instructions: list) -> set:
+    """
+    NumPy version of `fold_all()`
+    """
+    xs, x_kept = fold_array(np.array(xs), [pos for axis, pos in instructions if axis == 'x'])
+    ys, y_kept = fold_array(np.array(ys), [pos for axis, pos in instructions if axis == 'y'])
+    kept = x_kept & y_kept
+    xs, ys = xs[kept], ys[kept]
+    if len(xs) == 0:
+        return set()
+    # Merge the overlapping dots, as one number each (much faster than unique rows)
+    x_min, y_min = xs.min(), ys.min()
+    height = int(ys.max() - y_min) + 1
+    dots = np.unique((xs - x_min) * height + (ys - y_min))
+    return set(zip((dots // height + x_min).tolist(), (dots % height + y_min).tolist()))
+
+
+def parse(text: str) -> Tuple[list, list, list]:
+    """
+    Returns (the dots' x coords, their y coords, the list of (axis, pos) fold instructions)
+    """
+    xs = []
+    ys = []
+    instructions = []
+    lines = iter(text.splitlines())
     # Parse dots
-    for line in file:
+    for line in lines:
         # Instructions separated by blank line
-        if line.isspace():
+        if not line or line.isspace():
             break
         x, _, y = line.partition(',')
-        dots.add((int(x), int(y)))
+        xs.append(int(x))
+        ys.append(int(y))
     # Remaining lines are instructions
-    for line in file:
+    for line in lines:
         axis, _, pos = line.partition('=')
         axis = axis.lstrip('fold along ')
         pos = int(pos)
         instructions.append((axis, pos))
+    return xs, ys, instructions
+
 
-# Run all instructions
-for axis, pos in instructions:
-    lhs, rhs = partition(dots, axis, pos)
-    dots = fold(dots, axis, pos)
+def render(dots: set) -> str:
+    width = max(coord[0] for coord in dots) + 1
+    height = max(coord[1] for coord in dots) + 1
+
+    output = [[' ' for _ in range(width)] for _ in range(height)]
+    for (x, y) in dots:
+        output[y][x] = '#'
+    return '\n'.join(' '.join(line) for line in output)
+
+
+def solve(text: str) -> str:
+    """
+    Returns the folded paper, drawn as text
+    """
+    xs, ys, instructions = parse(text)
+    if np is not None and len(xs) >= NUMPY_MIN_DOTS:
+        return render(fold_all_array(xs, ys, instructions))
+    return render(fold_all(xs, ys, instructions))
 
-# Print the output
-width = max(coord[0] for coord in dots) + 1
-height = max(coord[1] for coord in dots) + 1
 
-output = [[' ' for _ in range(width)] for _ in range(height)]
-for (x, y) in dots:
-    output[y][x] = '#'
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-for line in output:
-    print(*line)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
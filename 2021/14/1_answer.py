@@ -25,33 +25,42 @@ p = Path(__file__).with_name("input")
 
 # Vars
 N_CYCLES = 10
-rules = {}
 
-with p.open('r') as file:
-    template = file.readline().strip()
-    file.readline() # Skip past the blank line
-    for line in file:
+
+def polymerize(text: str) -> list:
+    """
+    Returns each char's count after N_CYCLES, most common first
+    """
+    rules = {}
+    lines = iter(text.splitlines())
+    template = next(lines).strip()
+    next(lines) # Skip past the blank line
+    for line in lines:
         lhs, _, rhs = line.partition(' -> ')
         lhs = lhs.strip()
         rhs = rhs.strip()
         rules[lhs] = rhs
 
-for _ in range(N_CYCLES):
-    new_template = [template[0]]
-    for i in range(len(template) - 1):
-        pair = template[i] + template[i+1]
-        if pair in rules:
-            new_template.append(rules[pair])
-        new_template.append(pair[1])
-    template = new_template
+    for _ in range(N_CYCLES):
+        new_template = [template[0]]
+        for i in range(len(template) - 1):
+            pair = template[i] + template[i+1]
+            if pair in rules:
+                new_template.append(rules[pair])
+            new_template.append(pair[1])
+        template = new_template
+
+    return Counter(template).most_common()
 
 
-c = Counter(template).most_common()
+def solve(text: str) -> int:
+    c = polymerize(text)
+    return c[0][1] - c[-1][1]
 
-mc_c, mc_n = c[0]
-lc_c, lc_n = c[-1]
 
-print(f"Most common char: {mc_c} with {mc_n} occurences.")
-print(f"Least common char: {lc_c} with {lc_n} occurences.")
-print("Difference:", mc_n - lc_n)
+def main():
+    with p.open('r') as file:
+        print("Difference:", solve(file.read()))
 
+if __name__ == "__main__":
+    main()
@@ -24,53 +24,189 @@ and another tracking the count of each pair.
 If there are 10 'AA' pairs, with an 'AA -> B' rule, then those 10 'AA's are
 destroyed, and replaced by the same number of 'AB' and 'BC' pairs, with
 10 new 'B' chars
+
+There's also a matrix mode. One cycle is a linear map over the pair counts
+(each pair turns into the two pairs its rule makes, or stays put), so it can be
+written as an integer matrix M, and N cycles is M^N, done by repeated squaring
+in O(log N) matrix products instead of N cycles.
+Caveat: The exact counts double every cycle, so for huge N it's the size of the
+numbers, not the number of cycles, that becomes the limit. Pass a modulus to get
+the counts mod m instead, which keeps every product the same (small) size.
 """
 
 from pathlib import Path
 from collections import Counter
+from operator import mul
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:     # Matrix products fall back to pure Python
+    np = None
 
 p = Path(__file__).with_name("input")
 
 # Vars
 N_CYCLES = 40
-rules = {}
+Matrix = list[list[int]]
+
 
-with p.open('r') as file:
-    template = file.readline().strip()
-    file.readline()  # Skip past the blank line
-    for line in file:
+# Funcs
+def parse(text: str) -> tuple[str, dict[str, str]]:
+    """
+    Returns the template, and the rules ('AB' -> 'C')
+    """
+    rules = {}
+    lines = iter(text.splitlines())
+    template = next(lines).strip()
+    next(lines) # Skip past the blank line
+    for line in lines:
         lhs, _, rhs = line.partition(' -> ')
         lhs = lhs.strip()
         rhs = rhs.strip()
         rules[lhs] = rhs
+    return template, rules
+
+
+def count_chars_by_cycling(template: str, rules: dict[str, str], n_cycles: int) -> Counter:
+    """
+    Returns each char's count after `n_cycles`, stepping one cycle at a time
+    """
+    char_counts = Counter(template)
+    pair_counts = Counter(template[i:i+2] for i in range(len(template) - 1))
+    for _ in range(n_cycles):
+        new_pair_counts = pair_counts.copy()
+        for pair in pair_counts:
+            if pair in rules:
+                # Split it up
+                n_occurences = pair_counts[pair]
+                middle = rules[pair]        # .B.
+                l_pair = pair[0] + middle   # AB.
+                r_pair = middle + pair[1]   # .BC
+                # First, destroy all the pair's occurences, because
+                # turning AC -> ABC means AC is no longer a pair
+                new_pair_counts[pair] -= n_occurences
+                # Turn them into an equal amount of AB and AC pairs
+                new_pair_counts[l_pair] += n_occurences
+                new_pair_counts[r_pair] += n_occurences
+                # Track the middle character we just added
+                char_counts[middle] += n_occurences
+        pair_counts = new_pair_counts
+    return char_counts
+
 
+def transition_matrix(template: str, rules: dict[str, str]) -> tuple[list[str], Matrix]:
+    """
+    Returns every pair that can ever appear, and the matrix M where
+    M[new][old] is how many `new` pairs one `old` pair becomes after a cycle
+    """
+    pairs = {template[i:i+2] for i in range(len(template) - 1)}
+    for pair, middle in rules.items():
+        pairs.update((pair, pair[0] + middle, middle + pair[1]))
+    pairs = sorted(pairs)
+    index = {pair: i for i, pair in enumerate(pairs)}
 
-char_counts = Counter(template)
-pair_counts = Counter(template[i:i+2] for i in range(len(template) - 1))
-for _ in range(N_CYCLES):
-    new_pair_counts = pair_counts.copy()
-    for pair in pair_counts:
+    matrix = [[0] * len(pairs) for _ in pairs]
+    for pair, i in index.items():
         if pair in rules:
-            # Split it up
-            n_occurences = pair_counts[pair]
-            middle = rules[pair]        # .B.
-            l_pair = pair[0] + middle   # AB.
-            r_pair = middle + pair[1]   # .BC
-            # First, destroy all the pair's occurences, because
-            # turning AC -> ABC means AC is no longer a pair
-            new_pair_counts[pair] -= n_occurences
-            # Turn them into an equal amount of AB and AC pairs
-            new_pair_counts[l_pair] += n_occurences
-            new_pair_counts[r_pair] += n_occurences
-            # Track the middle character we just added
-            char_counts[middle] += n_occurences
-    pair_counts = new_pair_counts
-
-c = Counter(char_counts).most_common()
-
-mc_c, mc_n = c[0]
-lc_c, lc_n = c[-1]
-
-print(f"Most common char: {mc_c} with {mc_n} occurences.")
-print(f"Least common char: {lc_c} with {lc_n} occurences.")
-print("Difference:", mc_n - lc_n)
\ No newline at end of file
+            middle = rules[pair]
+            matrix[index[pair[0] + middle]][i] += 1
+            matrix[index[middle + pair[1]]][i] += 1
+        else:
+            matrix[i][i] = 1
+    return pairs, matrix
+
+
+def mat_mul(a: Matrix, b: Matrix, modulus: Optional[int] = None) -> Matrix:
+    columns = list(zip(*b))
+    if modulus is None:
+        return [[sum(map(mul, row, col)) for col in columns] for row in a]
+    return [[sum(map(mul, row, col)) % modulus for col in columns] for row in a]
+
+
+def mat_vec(a: Matrix, v: list[int], modulus: Optional[int] = None) -> list[int]:
+    if modulus is None:
+        return [sum(map(mul, row, v)) for row in a]
+    return [sum(map(mul, row, v)) % modulus for row in a]
+
+
+def mat_pow_vec(matrix: Matrix, power: int, vector: list[int],
+                modulus: Optional[int] = None) -> list[int]:
+    """
+    Returns matrix^power @ vector, by repeated squaring.
+    Uses NumPy if it's installed: object arrays for exact counts, or int64
+    arrays when the modulus is small enough for their products not to overflow
+    """
+    if np is not None:
+        # Each entry of a product sums len(matrix) terms of up to (m-1)^2
+        exact = modulus is None or (modulus - 1) ** 2 * len(matrix) >= 2 ** 63
+        dtype = object if exact else np.int64
+        reduce = (lambda x: x) if modulus is None else (lambda x: x % modulus)
+        square = np.array(matrix, dtype=dtype)
+        result = np.array(vector, dtype=dtype)
+        while power:
+            if power & 1:
+                result = reduce(square.dot(result))
+            power >>= 1
+            if power:
+                square = reduce(square.dot(square))
+        return [int(n) for n in result]
+
+    result = vector
+    square = matrix
+    while power:
+        if power & 1:
+            result = mat_vec(square, result, modulus)
+        power >>= 1
+        if power:
+            square = mat_mul(square, square, modulus)
+    return result
+
+
+def count_chars_by_matrix(template: str, rules: dict[str, str], n_cycles: int,
+                          modulus: Optional[int] = None) -> Counter:
+    """
+    Returns each char's count after `n_cycles` (mod `modulus`, if given),
+    using the transition matrix raised to the power of `n_cycles`
+    """
+    pairs, matrix = transition_matrix(template, rules)
+    start = Counter(template[i:i+2] for i in range(len(template) - 1))
+    pair_counts = mat_pow_vec(matrix, n_cycles, [start[pair] for pair in pairs], modulus)
+
+    # Every char is the first of a pair, except for the very last one,
+    # which never changes
+    char_counts = Counter({template[-1]: 1})
+    for pair, count in zip(pairs, pair_counts):
+        char_counts[pair[0]] += count
+    if modulus is None:
+        return +char_counts     # Drop chars whose pairs have all died out
+    # (Mod m, a count of 0 can't be told apart from a multiple of m, so they stay)
+    for char in char_counts:
+        char_counts[char] %= modulus
+    return char_counts
+
+
+def polymerize(text: str, n_cycles: int = N_CYCLES, by_matrix: bool = False) -> list:
+    """
+    Returns each char's count after `n_cycles`, most common first.
+    (At the puzzle's 40 cycles, stepping through them is faster than the matrix)
+    """
+    template, rules = parse(text)
+    if by_matrix:
+        char_counts = count_chars_by_matrix(template, rules, n_cycles)
+    else:
+        char_counts = count_chars_by_cycling(template, rules, n_cycles)
+    return char_counts.most_common()
+
+
+def solve(text: str) -> int:
+    c = polymerize(text)
+    return c[0][1] - c[-1][1]
+
+
+def main():
+    with p.open('r') as file:
+        print("Difference:", solve(file.read()))
+
+if __name__ == "__main__":
+    main()
@@ -12,113 +12,75 @@ digits wrap back to 1.
 
 Part 2 question: What's the shortest path?
 
-Achieving this with the LCFS frontier I learned 4 months ago, it takes around 14s
+Achieving this with the LCFS frontier I learned 4 months ago took around 14s,
+as every path on the heap carried a copy of itself. Now uses the shared
+Dijkstra/A* in `aoc.pathfinding`.
+
+The expanded grid is never built as lists of ints. Each row of the tile is
+kept as its digits, and shifted with `bytes.translate()` into the rows of a
+flat `aoc.grid.Grid`, so every cell costs one byte however large the scale is.
 """
 
+import sys
 from pathlib import Path
-from dataclasses import dataclass, field
-from heapq import heappop, heappush
-from itertools import product
 from time import perf_counter
-p = Path(__file__).with_name("input")
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import Grid
+from aoc.pathfinding import SearchResult, grid_shortest_path
 
-@dataclass(order=True)
-class WeightedPath:
-    cost: int
-    path: tuple = field(compare=False)
-
-    def __iter__(self):
-        return iter((self.cost, self.path))
+p = Path(__file__).with_name("input")
 
+# Vars
+SCALE = 5
+DIGITS = b"123456789"
+# SHIFTS[n] turns a digit into its value n tiles away, e.g. SHIFTS[2][ord('8')] == 1
+SHIFTS = [bytes.maketrans(DIGITS, bytes((d + n - 1) % 9 + 1 for d in range(1, 10)))
+          for n in range(9)]
 
-class LCFSFrontier:
-    def __init__(self, pruning: bool = True):
-        self.paths = []
-        self.pruning = pruning
-        self.discard = set()
 
-    def __iter__(self):
-        return self
+# Funcs
+def parse(text: str) -> list[bytes]:
+    """
+    Returns each row of the tile, as its (ASCII) digits
+    """
+    return [line.encode() for line in text.split()]
 
-    def add(self, path: WeightedPath) -> None:
-        head = path.path[-1]
-        # Prune so we don't double-back
-        if self.pruning and head in self.discard:
-            return
-        heappush(self.paths, path)
 
-    def __next__(self) -> WeightedPath:
-        if len(self.paths) == 0:
-            raise StopIteration
-        path = heappop(self.paths)
-        head = path.path[-1]
-        if self.pruning:
-            if head not in self.discard:
-                self.discard.add(head)
-            else:
-                return next(self)
-        return path
+def expand_grid(tile: list[bytes], scale: int) -> Grid:
+    """
+    Returns the tile repeated `scale` times each way, as a grid of costs.
+    The cost wraps from 9 back to 1, going one higher per tile right/down
+    """
+    return Grid.from_rows(b''.join(row.translate(SHIFTS[(i_tile + j_tile) % 9])
+                                   for j_tile in range(scale))
+                          for i_tile in range(scale)
+                          for row in tile)
 
 
-def neighbours(grid, path: WeightedPath):
+def shortest_path(grid: Grid) -> SearchResult:
     """
-    Generator.
-    Returns the WeightedPaths of the neighbours
+    Returns the cheapest path from the top-left to the bottom-right
     """
-    cost, old_path = path
-    head = old_path[-1]
-    i, j = head
-    COORDS = ((-1, 0), (0, 1), (1, 0), (0, -1))
-    for di, dj in COORDS:
-        ni = i + di
-        nj = j + dj
-        if 0 <= ni < len(grid) and 0 <= nj < len(grid[ni]):
-            new_cost = cost + grid[ni][nj]
-            yield WeightedPath(cost=new_cost,
-                               path=old_path+((ni, nj),)
-                               )
-
-
-def expand_grid(grid, i_scale, j_scale) -> list:
-    i_size = len(grid)
-    j_size = len(grid[0])
-    new_grid = [[0 for x in range(j_size*j_scale)]
-                for y in range(i_size*i_scale)]
-    for i_offset, j_offset in product(range(i_scale), range(j_scale)):
-        pos_cost = i_offset + j_offset
-        for i, row in enumerate(grid):
-            for j, val in enumerate(row):
-                # Funky equation to cycle from [1, 9]
-                new_cost = val + pos_cost
-                new_cost -= 1
-                new_cost %= 9
-                new_cost += 1
-                i_pos = i + i_size*i_offset
-                j_pos = j + j_size*j_offset
-                new_grid[i_pos][j_pos] = new_cost
-    return new_grid
-
-
-with p.open('r') as file:
-    grid = [[int(n) for n in line.strip()] for line in file]
-grid = expand_grid(grid, i_scale=5, j_scale=5)
-
-end_point = (len(grid)-1, len(grid[-1])-1)  # Bottom left of grid
-
-frontier = LCFSFrontier(pruning=True)
-start_node = WeightedPath(cost=0, path=((0, 0),))
-frontier.add(start_node)
-
-start = perf_counter()
-for path in frontier:
-    head = path.path[-1]
-    if head == end_point:
-        print("Path found!")
-        break
-    for new_path in neighbours(grid, path):
-        frontier.add(new_path)
-end = perf_counter()
-
-print(f"Time: {end-start:.3f}s")
-print(f"{path.cost = }")
+    # A* is supported, but the Manhattan distance is too weak a heuristic
+    # here (every step costs 1-9) to pay for computing it
+    return grid_shortest_path(grid)
+
+
+def solve(text: str) -> int:
+    return shortest_path(expand_grid(parse(text), SCALE)).cost
+
+
+def main():
+    with p.open('r') as file:
+        text = file.read()
+
+    start = perf_counter()
+    cost = solve(text)
+    end = perf_counter()
+
+    print(f"Time: {end-start:.3f}s")
+    print(f"{cost = }")
+
+if __name__ == "__main__":
+    main()
@@ -120,13 +120,17 @@ def sum_packet_versions(packet: Packet) -> int:
 
 
 
+def solve(text: str) -> int:
+    packet = parse_packet(BitStream(text.strip()))
+    return sum_packet_versions(packet)
+
+
 p = Path(__file__).with_name("input")
 
-with p.open('r') as file:
-    data = file.read().strip()
 
-stream = BitStream(data)
-packet = parse_packet(stream)
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-print(packet)
-print(sum_packet_versions(packet))
+if __name__ == "__main__":
+    main()
@@ -37,40 +37,47 @@ Any other ID: Represents nested operator packets
   are the number of subpackets.
 
 Part 2 question: What's the output of the equation tree?
+
+Nothing here is recursive, so there's no limit on how deeply packets nest.
+The packets are parsed into a flat list in postfix order, each operator
+coming after its subpackets (e.g. 1 + (2 * 3) => 1, 2, 3, *, +). The parser
+keeps a stack of the operators it's in the middle of, and once an operator's
+subpackets are all read, it's popped and added to the list.
+Then it's evaluated like any postfix: literals are pushed onto a stack, and
+each operator pops its operands and pushes its result, looked up in `OPERATORS`.
 """
 
-from pathlib import Path
 from dataclasses import dataclass
-from typing import Union, List
-
-
-def bit_generator(hexdata):
-    for char in hexdata:
-        num = int(char, base=16)
-        for i in reversed(range(4)):
-            bit = (num >> i) & 1
-            yield bit
+from math import prod
+from pathlib import Path
+from typing import Callable
 
 
 class BitStream:
+    """
+    Reads big-endian bit fields from hex data.
+    The hex is turned into bytes once, and each read only
+    converts the few bytes its bits are in, then shifts & masks them out
+    """
     def __init__(self, hexdata: str):
-        self.stream = bit_generator(hexdata)
+        if len(hexdata) % 2:
+            hexdata += '0'
+        self.data = bytes.fromhex(hexdata)
+        self.n_bits = len(self.data) * 8
         self.n_bits_read = 0
 
-    def read_bit(self) -> int:
-        bit = next(self.stream)
-        self.n_bits_read += 1
-        return bit
-
     def read_int(self, n_bits) -> int:
-        num = 0
-        for i in reversed(range(n_bits)):
-            bit = self.read_bit()
-            num += bit * 2**i
-        return num
+        start = self.n_bits_read
+        end = start + n_bits
+        if end > self.n_bits:
+            raise EOFError(f"Can't read {n_bits} bits, only {self.n_bits - start} are left")
+        last_byte = (end + 7) >> 3
+        chunk = int.from_bytes(self.data[start >> 3:last_byte], 'big')
+        self.n_bits_read = end
+        return (chunk >> (last_byte * 8 - end)) & ((1 << n_bits) - 1)
 
-    def read_str(self, n_bits) -> str:
-        return ''.join(str(self.read_bit()) for _ in range(n_bits))
+    def read_bit(self) -> int:
+        return self.read_int(1)
 
     def read_literal(self) -> int:
         """
@@ -81,96 +88,119 @@ class BitStream:
         Reads the stream upto and including the final segment,
         and turns it into an integer.
         """
-        binary_string = ""
-        terminated = False
-        while not terminated:
-            segment = self.read_str(5)
-            number = segment[1:5]
-            if segment[0] == '0':
-                terminated = True
-            binary_string += number
-        return int(binary_string, base=2)
+        num = 0
+        segment = 0b10000
+        while segment & 0b10000:
+            segment = self.read_int(5)
+            num = (num << 4) | (segment & 0b1111)
+        return num
 
 
 LITERAL_DATA_ID = 4
+# Operator packet ID -> what it does to its operands
+OPERATORS: dict[int, Callable[[list[int]], int]] = {
+    0: sum,
+    1: prod,
+    2: min,
+    3: max,
+    5: lambda operands: int(operands[0] > operands[1]),
+    6: lambda operands: int(operands[0] < operands[1]),
+    7: lambda operands: int(operands[0] == operands[1]),
+}
 
 
 @dataclass
 class Packet:
     id: int
     version: int
-    content: "Union[int, List[Packet]]"
-
-
-def parse_multiple_packets(stream: BitStream) -> List[Packet]:
-    packets = []
-    length_type_id = stream.read_int(1)
-    if length_type_id == 0:
-        total_subpacket_length = stream.read_int(15)
-        start = current = stream.n_bits_read
-        while current - start < total_subpacket_length:
-            packets.append(parse_packet(stream))
-            current = stream.n_bits_read
-    else:
-        n_subpackets = stream.read_int(11)
-        for _ in range(n_subpackets):
-            packets.append(parse_packet(stream))
-    return packets
-
-
-def parse_packet(stream: BitStream) -> Packet:
-    version = stream.read_int(3)
-    id = stream.read_int(3)
-    if id == LITERAL_DATA_ID:
-        content = stream.read_literal()
-    else:
-        content = parse_multiple_packets(stream)
-    return Packet(id, version, content)
-
-
-def sum_packet_versions(packet: Packet) -> int:
-    if type(packet.content) is not list:
-        return packet.version
-    else:
-        return packet.version + sum(sum_packet_versions(sub_packet) for sub_packet in packet.content)
-
-
-def calculate_equation(packet: Packet) -> int:
-    if packet.id == 0:
-        return sum(calculate_equation(p) for p in packet.content)
-    elif packet.id == 1:
-        num = 1
-        for p in packet.content:
-            num *= calculate_equation(p)
-        return num
-    elif packet.id == 2:
-        return min(calculate_equation(p) for p in packet.content)
-    elif packet.id == 3:
-        return max(calculate_equation(p) for p in packet.content)
-    elif packet.id == 4:
-        return packet.content
-    elif packet.id == 5:
-        lhs = calculate_equation(packet.content[0])
-        rhs = calculate_equation(packet.content[1])
-        return int(lhs > rhs)
-    elif packet.id == 6:
-        lhs = calculate_equation(packet.content[0])
-        rhs = calculate_equation(packet.content[1])
-        return int(lhs < rhs)
-    elif packet.id == 7:
-        lhs = calculate_equation(packet.content[0])
-        rhs = calculate_equation(packet.content[1])
-        return int(lhs == rhs)
+    # For literals, the number. For operators, how many subpackets they have
+    content: int
+
+
+@dataclass
+class OpenOperator:
+    """
+    An operator packet whose subpackets are still being parsed
+    """
+    id: int
+    version: int
+    by_length: bool     # If `limit` is where its subpackets end (a bit offset), or how many there are
+    limit: int
+    n_subpackets: int = 0
+
+    def is_complete(self, stream: BitStream) -> bool:
+        if self.by_length:
+            return stream.n_bits_read >= self.limit
+        return self.n_subpackets == self.limit
+
+
+def parse_packets(stream: BitStream) -> list[Packet]:
+    """
+    Parses the outermost packet, and everything in it,
+    into a list in postfix order
+    """
+    program = []
+    open_operators: list[OpenOperator] = []
+    while True:
+        version = stream.read_int(3)
+        id = stream.read_int(3)
+        if open_operators:
+            # Counted when it starts, but the parent isn't checked
+            # until it's back on top (i.e. this packet's been read)
+            open_operators[-1].n_subpackets += 1
+        if id == LITERAL_DATA_ID:
+            program.append(Packet(id, version, stream.read_literal()))
+        else:
+            length_type_id = stream.read_int(1)
+            if length_type_id == 0:
+                total_subpacket_length = stream.read_int(15)
+                open_operators.append(OpenOperator(id, version, True,
+                                                   stream.n_bits_read + total_subpacket_length))
+            else:
+                open_operators.append(OpenOperator(id, version, False, stream.read_int(11)))
+        # Finishing one operator can finish its parent too
+        while open_operators and open_operators[-1].is_complete(stream):
+            operator = open_operators.pop()
+            program.append(Packet(operator.id, operator.version, operator.n_subpackets))
+        if not open_operators:
+            return program
+
+
+def sum_packet_versions(program: list[Packet]) -> int:
+    return sum(packet.version for packet in program)
+
+
+def calculate_equation(program: list[Packet]) -> int:
+    stack = []
+    for packet in program:
+        if packet.id == LITERAL_DATA_ID:
+            stack.append(packet.content)
+        else:
+            split = len(stack) - packet.content
+            operands = stack[split:]
+            del stack[split:]
+            stack.append(OPERATORS[packet.id](operands))
+    return stack.pop()
+
+
+def solve(text: str) -> int:
+    program = parse_packets(BitStream(text.strip()))
+    return calculate_equation(program)
 
 
 p = Path(__file__).with_name("input")
 
-with p.open('r') as file:
-    data = file.read().strip()
 
-stream = BitStream(data)
-packet = parse_packet(stream)
+def main():
+    with p.open('r') as file:
+        data = file.read().strip()
+
+    stream = BitStream(data)
+    program = parse_packets(stream)
+
+    print(f"{len(program)} packets")
+    print("Packet version sum:", sum_packet_versions(program))
+    print("Equation result:", calculate_equation(program))
 
-print(packet)
-print("Packet version sum:", sum_packet_versions(packet))
-print("Equation result:", calculate_equation(packet))
\ No newline at end of file
+if __name__ == "__main__":
+    main()
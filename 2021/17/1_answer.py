@@ -27,11 +27,16 @@ p = Path(__file__).with_name("input")
 
 # Awful code to read the numbers from the file
 pattern = r"target area: x=(-?\d+)\.\.(-?\d+), y=(-?\d+)\.\.(-?\d+)"
-with p.open('r') as file:
-    m = re.match(pattern, file.read().strip())
+
+def read_target(text: str) -> tuple:
+    """
+    Returns the target area as (x_lo, x_hi, y_lo, y_hi)
+    """
+    m = re.match(pattern, text.strip())
     x_lo, x_hi, y_lo, y_hi = map(int, m.groups())
     x_lo, x_hi = (x_lo, x_hi) if x_lo < x_hi else (x_hi, x_lo)
     y_lo, y_hi = (y_lo, y_hi) if y_lo < y_hi else (y_hi, y_lo)
+    return x_lo, x_hi, y_lo, y_hi
 
 
 """
@@ -48,17 +53,17 @@ need to throw precisely so it intersects at just the right time,
 we'll have all the time in the world.
 """
 
-# A throw's distance is a triangle number (4+3+2+1+0)
-# So the good ol' n(n+1)/2 will give it to us
-for i in range(x_hi+1):   # If we throw any harder we overshoot
-    distance = i * (i+1) // 2
-    if x_lo <= distance <= x_hi:
-        print(f"{i} stops right on top at x={distance}")
-        break
-else:
-    print("ERROR: No throw can stop above the target")
-    print("This trick doesn't apply")
-    exit()
+def stopping_throw(x_lo, x_hi) -> tuple:
+    """
+    Returns (x-velocity, x-position) of a throw that stops above the target
+    """
+    # A throw's distance is a triangle number (4+3+2+1+0)
+    # So the good ol' n(n+1)/2 will give it to us
+    for i in range(x_hi+1):   # If we throw any harder we overshoot
+        distance = i * (i+1) // 2
+        if x_lo <= distance <= x_hi:
+            return i, distance
+    raise ValueError("No throw can stop above the target, this trick doesn't apply")
 
 
 """
@@ -82,16 +87,34 @@ If the target's at y=3, the fastest you can throw is y=3, because
 any higher and it'll be moving too fast on the way up/down.
 """
 
-# The point furthest away from y=0 is our target.
-# Because higher throws means the gap on the way down is larger,
-# we want to hit the point furthest from 0 i.e. the biggest gap
-# we can make.
+def highest_throw(y_lo, y_hi) -> tuple:
+    """
+    Returns (y-velocity, highest point) of the highest valid throw
+    """
+    # The point furthest away from y=0 is our target.
+    # Because higher throws means the gap on the way down is larger,
+    # we want to hit the point furthest from 0 i.e. the biggest gap
+    # we can make.
+
+    # Don't forget: It's 1 faster when below 0
+    y_bound_1 = y_hi if y_hi >= 0 else abs(y_hi) - 1
+    y_bound_2 = y_lo if y_lo >= 0 else abs(y_lo) - 1
+
+    highest_speed = max(y_bound_1, y_bound_2)
+    highest_point = highest_speed * (highest_speed+1) // 2
+    return highest_speed, highest_point
+
+
+def solve(text: str) -> int:
+    x_lo, x_hi, y_lo, y_hi = read_target(text)
+    stopping_throw(x_lo, x_hi)
+    return highest_throw(y_lo, y_hi)[1]
+
 
-# Don't forget: It's 1 faster when below 0
-y_bound_1 = y_hi if y_hi >= 0 else abs(y_hi) - 1
-y_bound_2 = y_lo if y_lo >= 0 else abs(y_lo) - 1
+def main():
+    with p.open('r') as file:
+        highest_point = solve(file.read())
+    print("The highest point reached is", highest_point)
 
-highest_speed = max(y_bound_1, y_bound_2)
-highest_point = highest_speed * (highest_speed+1) // 2
-print("The best vertical velocity is", highest_speed)
-print("The highest point reached is", highest_point)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
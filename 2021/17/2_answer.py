@@ -19,7 +19,9 @@ Part 2 question: How many throws are valid?
 """
 
 import re
-from math import inf
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from math import inf, isqrt
 from pathlib import Path
 from typing import Optional, Tuple
 from time import perf_counter
@@ -27,11 +29,16 @@ p = Path(__file__).with_name("input")
 
 # Awful code to read the numbers from the file
 pattern = r"target area: x=(-?\d+)\.\.(-?\d+), y=(-?\d+)\.\.(-?\d+)"
-with p.open('r') as file:
-    m = re.match(pattern, file.read().strip())
+
+def read_target(text: str) -> tuple:
+    """
+    Returns the target area as (x_lo, x_hi, y_lo, y_hi)
+    """
+    m = re.match(pattern, text.strip())
     x_lo, x_hi, y_lo, y_hi = map(int, m.groups())
     x_lo, x_hi = (x_lo, x_hi) if x_lo < x_hi else (x_hi, x_lo)
     y_lo, y_hi = (y_lo, y_hi) if y_lo < y_hi else (y_hi, y_lo)
+    return x_lo, x_hi, y_lo, y_hi
 
 
 """
@@ -156,40 +163,42 @@ def shot_intersects(x_vel, y_vel, left, right, low, high) -> bool:
     return False
 
 
-print(shot_intersects(6, 0, 20, 30, -10, -5))
-
-
-valid_shots = set()
-# The leftmost shot hits the farleft if farleft < 0,
-# or is simply dropped if farleft > 0
-start_x = min(0, x_lo)
-# The rightmost shot either hits the far right if farright > 0,
-# or is dropped if < 0
-end_x = max(x_hi+1, 0)
-# Lowest you can throw is just above where it'd instantly
-# fly below the lower boundary
-start_y = y_lo
-# Highest you can throw, as shown by part 1, is a speed
-# where the ascent/descent doesn't instantly fly past it.
-# a.k.a whichever boundary is furthest from 0.
-# The abs-1 is because it speeds up by -1 when going
-# from   +ve -> 0   to   0 -> -ve
-end_y = 1 + max(
-    y_hi if y_hi >= 0 else abs(y_hi) - 1,
-    y_lo if y_lo >= 0 else abs(y_lo) - 1,
-)
-
-start_time = perf_counter()
-
-for x in range(start_x, end_x):
-    for y in range(start_y, end_y):
-        if shot_intersects(x, y, x_lo, x_hi, y_lo, y_hi):
-            valid_shots.add((x, y))
-
-end_time = perf_counter()
-# print(valid_shots)
-print(f"{len(valid_shots) = }")
-print(f"Took {end_time-start_time:.3f}s")
+def throw_bounds(x_lo, x_hi, y_lo, y_hi) -> tuple:
+    """
+    Returns the (start_x, end_x, start_y, end_y) velocity ranges worth trying
+    """
+    # The leftmost shot hits the farleft if farleft < 0,
+    # or is simply dropped if farleft > 0
+    start_x = min(0, x_lo)
+    # The rightmost shot either hits the far right if farright > 0,
+    # or is dropped if < 0
+    end_x = max(x_hi+1, 0)
+    # Lowest you can throw is just above where it'd instantly
+    # fly below the lower boundary
+    start_y = y_lo
+    # Highest you can throw, as shown by part 1, is a speed
+    # where the ascent/descent doesn't instantly fly past it.
+    # a.k.a whichever boundary is furthest from 0.
+    # The abs-1 is because it speeds up by -1 when going
+    # from   +ve -> 0   to   0 -> -ve
+    end_y = 1 + max(
+        y_hi if y_hi >= 0 else abs(y_hi) - 1,
+        y_lo if y_lo >= 0 else abs(y_lo) - 1,
+    )
+    return start_x, end_x, start_y, end_y
+
+
+def simulated_shots(x_lo, x_hi, y_lo, y_hi) -> set:
+    """
+    Finds every valid shot by simulating every possible throw
+    """
+    start_x, end_x, start_y, end_y = throw_bounds(x_lo, x_hi, y_lo, y_hi)
+    valid_shots = set()
+    for x in range(start_x, end_x):
+        for y in range(start_y, end_y):
+            if shot_intersects(x, y, x_lo, x_hi, y_lo, y_hi):
+                valid_shots.add((x, y))
+    return valid_shots
 
 
 """
@@ -214,33 +223,263 @@ Because x is inside the target at the same time as y, we can
 say that they intersect.
 """
 
-x_times = {}
-y_times = {}
-valid_shots.clear()
+def intersection_times(x_lo, x_hi, y_lo, y_hi) -> tuple:
+    """
+    Returns ({x-vel: (first, last) tick}, {y-vel: [ticks]})
+    for the throws that reach the target on that axis
+    """
+    start_x, end_x, start_y, end_y = throw_bounds(x_lo, x_hi, y_lo, y_hi)
+    x_times = {}
+    y_times = {}
 
-# Include the preprocessing
-start_time = perf_counter()
+    for x in range(start_x, end_x):
+        intersect_times = x_shot_intersects(x, x_lo, x_hi)
+        if intersect_times is not None:
+            x_times[x] = intersect_times
 
-for x in range(start_x, end_x):
-    intersect_times = x_shot_intersects(x, x_lo, x_hi)
-    if intersect_times is not None:
-        x_times[x] = intersect_times
+    for y in range(start_y, end_y):
+        intersect_times = y_shot_intersects(y, y_lo, y_hi)
+        if len(intersect_times) > 0:
+            y_times[y] = intersect_times
+    return x_times, y_times
+
+
+def precomputed_shots(x_times: dict, y_times: dict) -> set:
+    valid_shots = set()
+    for x, (start, end) in x_times.items():
+        for y, times in y_times.items():
+            if any(start <= t <= end for t in times):
+                valid_shots.add((x, y))
+    return valid_shots
+
+
+"""
+Going further: Counting without simulating anything.
+
+Each axis has a closed form for where it is after t ticks:
+    x: t*vx - t(t-1)/2, until it stops at the triangular number vx(vx+1)/2
+    y: t*vy - t(t-1)/2, forever
+so the first/last tick a velocity is inside the target is a quadratic to solve.
+
+Velocities next to each other are inside the target for the same ticks,
+except where some tick's range of velocities starts or ends. There are only
+about sqrt(target) of those ticks, so the velocities are split up at them,
+and each piece is solved once.
+A throw upwards at vy comes back past y=0 after 2vy+1 ticks, going down at
+vy+1, so it's in the target for the same ticks as a throw down at vy+1,
+just 2vy+1 later.
+
+Then, for each y piece, the x velocities whose ticks overlap its ticks are
+counted by bisecting sorted lists of first/last ticks (the x velocities that
+arrive too late, plus the ones that leave too early, are the ones that miss).
+Handles targets in the millions in milliseconds, but only for targets fully
+below and to one side of the start (which every puzzle input is),
+otherwise it falls back to `precomputed_shots()`.
+"""
 
-for y in range(start_y, end_y):
-    intersect_times = y_shot_intersects(y, y_lo, y_hi)
-    if len(intersect_times) > 0:
-        y_times[y] = intersect_times
 
-for x, (start, end) in x_times.items():
-    for y, times in y_times.items():
-        if any(start <= t <= end for t in times):
-            valid_shots.add((x, y))
+def slowing_distance(vel: int, ticks: int) -> int:
+    """
+    How far a throw slowing down from `vel` goes in `ticks` (as long as ticks <= vel+1)
+    """
+    return ticks * vel - ticks * (ticks - 1) // 2
 
-end_time = perf_counter()
-print("x axis:")
-print(f"- We've gone from {end_x-start_x-1} entries to {len(x_times)}")
-print("y axis:")
-print(f"- We've gone from {end_x-start_y-1} entries to {len(y_times)}")
 
-print(f"{len(valid_shots) = }")
-print(f"Took {end_time-start_time:.3f}s")
\ No newline at end of file
+def falling_distance(vel: int, ticks: int) -> int:
+    """
+    How far a throw speeding up from `vel` goes in `ticks`
+    """
+    return ticks * vel + ticks * (ticks - 1) // 2
+
+
+def triangular(n: int) -> int:
+    return n * (n + 1) // 2
+
+
+def x_ticks(x_vel: int, left: int, right: int) -> Optional[Tuple[int, int]]:
+    """
+    `x_shot_intersects()`, solved instead of simulated. Only for 0 < left
+    """
+    if triangular(x_vel) < left:
+        return None
+    # Solving t^2 - (2v+1)t + 2*left <= 0, for the first t
+    b = 2 * x_vel + 1
+    first = max(1, (b - isqrt(b * b - 8 * left)) // 2)
+    while slowing_distance(x_vel, first) < left:
+        first += 1
+    while first > 1 and slowing_distance(x_vel, first - 1) >= left:
+        first -= 1
+    if slowing_distance(x_vel, first) > right:
+        return None     # Flew straight over it
+    if triangular(x_vel) <= right:
+        return first, inf
+    last = (b - isqrt(b * b - 8 * right)) // 2
+    while slowing_distance(x_vel, last + 1) <= right:
+        last += 1
+    while slowing_distance(x_vel, last) > right:
+        last -= 1
+    return first, last
+
+
+def y_ticks_falling(y_vel: int, high: int, low: int) -> Optional[Tuple[int, int]]:
+    """
+    The first and last ticks a throw straight down at speed `y_vel` (>= 0) is
+    between `high` and `low` below the start, or None if it never is
+    """
+    # Solving t^2 + (2v-1)t - 2*depth >= 0
+    b = 2 * y_vel - 1
+    first = max(1, (isqrt(b * b + 8 * high) - b) // 2)
+    while falling_distance(y_vel, first) < high:
+        first += 1
+    while first > 1 and falling_distance(y_vel, first - 1) >= high:
+        first -= 1
+    if falling_distance(y_vel, first) > low:
+        return None     # Fell straight through it
+    last = max(first, (isqrt(b * b + 8 * low) - b) // 2)
+    while falling_distance(y_vel, last + 1) <= low:
+        last += 1
+    while falling_distance(y_vel, last) > low:
+        last -= 1
+    return first, last
+
+
+def pieces(breakpoints: set, start: int, end: int) -> list:
+    """
+    Splits start..end (exclusive) at the breakpoints, into (start, end) pieces
+    """
+    cuts = sorted({b for b in breakpoints if start < b < end} | {start, end})
+    return list(zip(cuts, cuts[1:]))
+
+
+def x_tick_ranges(left: int, right: int) -> list:
+    """
+    Returns [(how many x velocities, first tick, last tick)...] for the
+    x velocities that reach the target, grouped by their ticks
+    """
+    breakpoints = set()
+    t = 1
+    while t * (t - 1) // 2 <= right:
+        # At tick t, the velocities still moving are >= t-1, and those inside are
+        slowed = t * (t - 1) // 2
+        breakpoints.update((-(-(left + slowed) // t), (right + slowed) // t + 1, t - 1))
+        t += 1
+    # The velocities that stop inside it
+    for distance in (left, right + 1):
+        stop_vel = (isqrt(8 * distance + 1) - 1) // 2
+        while triangular(stop_vel) < distance:
+            stop_vel += 1
+        breakpoints.add(stop_vel)
+
+    ranges = []
+    for start, end in pieces(breakpoints, 1, right + 1):
+        ticks = x_ticks(start, left, right)
+        if ticks is not None:
+            ranges.append((end - start, *ticks))
+    return ranges
+
+
+def y_tick_ranges(high: int, low: int) -> list:
+    """
+    Returns [(start, end, first tick, last tick)...] for the velocities
+    start..end (exclusive) thrown downwards that reach the target,
+    `high` to `low` below the start, grouped by their ticks
+    """
+    breakpoints = set()
+    t = 1
+    while t * (t - 1) // 2 <= low:
+        fallen = t * (t - 1) // 2
+        breakpoints.update((-(-(high - fallen) // t), (low - fallen) // t + 1))
+        t += 1
+
+    ranges = []
+    for start, end in pieces(breakpoints, 0, low + 1):
+        ticks = y_ticks_falling(start, high, low)
+        if ticks is not None:
+            ranges.append((start, end, *ticks))
+    return ranges
+
+
+def count_shots(x_lo, x_hi, y_lo, y_hi) -> int:
+    """
+    Counts every valid shot, see above. Only for 0 < x_lo and y_hi < 0
+    """
+    x_ranges = x_tick_ranges(x_lo, x_hi)
+    firsts = sorted((first, n) for n, first, _ in x_ranges)
+    lasts = sorted((last, n) for n, _, last in x_ranges)
+    first_ticks = [first for first, _ in firsts]
+    last_ticks = [last for last, _ in lasts]
+    # n_before[i] = How many velocities the first i entries are
+    n_before_first = [0, *accumulate(n for _, n in firsts)]
+    n_before_last = [0, *accumulate(n for _, n in lasts)]
+    n_x_vels = n_before_first[-1]
+
+    def n_overlapping(first: int, last: int) -> int:
+        arrive_late = n_x_vels - n_before_first[bisect_right(first_ticks, last)]
+        leave_early = n_before_last[bisect_left(last_ticks, first)]
+        return n_x_vels - arrive_late - leave_early
+
+    # After this, the only x velocities in the target are the ones stopped there
+    settled = max(max(first_ticks, default=0),
+                  max((last + 1 for last in last_ticks if last != inf), default=0))
+
+    n_shots = 0
+    for start, end, first, last in y_tick_ranges(-y_hi, -y_lo):
+        # Thrown down (or flat) at -vel
+        n_shots += (end - start) * n_overlapping(first, last)
+        # Thrown up at vel-1, back at y=0 heading down at vel, 2vel-1 ticks later
+        for vel in range(max(start, 2), end):
+            delay = 2 * vel - 1
+            if delay + first >= settled:
+                n_shots += (end - vel) * n_overlapping(settled, settled)
+                break
+            n_shots += n_overlapping(delay + first, delay + last)
+    return n_shots
+
+
+def solve(text: str) -> int:
+    x_lo, x_hi, y_lo, y_hi = read_target(text)
+    if x_hi < 0:
+        # Mirror it, throwing left is the same as throwing right
+        x_lo, x_hi = -x_hi, -x_lo
+    if x_lo > 0 and y_hi < 0:
+        return count_shots(x_lo, x_hi, y_lo, y_hi)
+    x_times, y_times = intersection_times(x_lo, x_hi, y_lo, y_hi)
+    return len(precomputed_shots(x_times, y_times))
+
+
+def main():
+    with p.open('r') as file:
+        text = file.read()
+    x_lo, x_hi, y_lo, y_hi = read_target(text)
+    start_x, end_x, start_y, end_y = throw_bounds(x_lo, x_hi, y_lo, y_hi)
+
+    start_time = perf_counter()
+    n_shots = solve(text)
+    end_time = perf_counter()
+    print(f"{n_shots = }")
+    print(f"Took {end_time-start_time:.3f}s")
+
+    # Compared to simulating them
+    start_time = perf_counter()
+    valid_shots = simulated_shots(x_lo, x_hi, y_lo, y_hi)
+    end_time = perf_counter()
+    # print(valid_shots)
+    print(f"{len(valid_shots) = }")
+    print(f"Took {end_time-start_time:.3f}s")
+
+    # Include the preprocessing
+    start_time = perf_counter()
+    x_times, y_times = intersection_times(x_lo, x_hi, y_lo, y_hi)
+    valid_shots = precomputed_shots(x_times, y_times)
+    end_time = perf_counter()
+
+    print("x axis:")
+    print(f"- We've gone from {end_x-start_x-1} entries to {len(x_times)}")
+    print("y axis:")
+    print(f"- We've gone from {end_x-start_y-1} entries to {len(y_times)}")
+
+    print(f"{len(valid_shots) = }")
+    print(f"Took {end_time-start_time:.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -212,9 +212,10 @@ def magnitude(pair) -> int:
     return 3*magnitude(pair[L]) + 2*magnitude(pair[R])
 
 
-if __name__ == "__main__":
-    with p.open('r') as file:
-        snailfish_numbers = [eval(line) for line in file]
+def add_all(snailfish_numbers: list) -> list:
+    """
+    Adds (and reduces) every number in order, returning the final sum
+    """
     fish_it = iter(snailfish_numbers)
 
     current_pair = next(fish_it)
@@ -223,6 +224,21 @@ if __name__ == "__main__":
         current_pair = [current_pair, to_add]
         snailfish_reduce(current_pair)
         log("===")
+    return current_pair
+
+
+def parse(text: str) -> list:
+    return [eval(line) for line in text.splitlines() if line.strip()]
+
 
-    print("Final snailfish number:", current_pair)
-    print("Magnitude:", magnitude(current_pair))
+def solve(text: str) -> int:
+    return magnitude(add_all(parse(text)))
+
+
+def main():
+    with p.open('r') as file:
+        print("Magnitude:", solve(file.read()))
+
+
+if __name__ == "__main__":
+    main()
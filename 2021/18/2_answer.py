@@ -36,33 +36,35 @@ final snailfish number, which is 3x the LHS + 2x the RHS recursively
 
 Part 2 question: What pair of two numbers has the largest
 magnitude?
+
+The trees are stored flat, as their leaves in order, each with its depth:
+    [[3,4],5] => [(3, 2), (4, 2), (5, 1)]
+Which makes everything local:
+  - Add: Concatenate, and push every leaf 1 deeper
+  - Explode: A leaf deeper than 4 is the left of a pair, and the next leaf
+    is its right. Their neighbours in the list are the nearest numbers
+  - Split: Replace one leaf with two, 1 deeper
+    (Explodes and splits are both done in one pass while adding, see `add()`)
+  - Magnitude: Like evaluating postfix, combine the top two leaves on a
+    stack whenever they're at the same depth
+And since adding builds a new list, the numbers never need copying.
 """
-from copy import deepcopy
-from math import floor, ceil
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
 p = Path(__file__).with_name("input")
 
 
 EXPLODE_THRESHOLD = 4
 SPLIT_THRESHOLD = 10
+PARALLEL_MIN_PAIRS = 40_000    # Below this, starting the processes costs more than it saves
 
 DEBUG = False
 
-
-class Direction(int):
-    def __new__(cls, num):
-        return super(Direction, cls).__new__(cls, num)
-
-    def __repr__(self):
-        return 'L' if self == 0 else 'R'
-
-    def __invert__(self):
-        return L if self == 1 else R
-
-
-L = Direction(0)
-R = Direction(1)
+# [(value, depth)...], the leaves in order
+Number = list[tuple[int, int]]
 
 
 def log(*args, **kwargs):
@@ -72,163 +74,168 @@ def log(*args, **kwargs):
 # ===   Operations   ===
 
 
-def reverse_enumerate(thing):
-    num_iter = reversed(range(len(thing)))
-    item_iter = reversed(thing)
-    return zip(num_iter, item_iter)
-
-
-def item_at_path(nums: list, path: tuple) -> "int | list":
+def add(left: Number, right: Number) -> Number:
     """
-    Returns the item (tree or leaf) at the given path.
+    Returns the reduced sum of two (already reduced) numbers, leaving both untouched.
+
+    Rather than restarting from the left after every action:
+      1. Only the leaves at depth 4 can end up too deep, and exploding one pair
+         never makes another, so they're all exploded as the sum's built.
+         Each pair's RHS is carried over onto whatever leaf comes next.
+      2. Then one pass left to right for the splits. A split at depth 4 would
+         make a pair that explodes straight away, so it goes straight to exploding
+         (and steps back one, in case that made the number to its left too big)
     """
-    for direction in path:
-        nums = nums[direction]
-    return nums
-
-
-def nearest_neighbour(nums: list, path: tuple, direction: int) -> Optional[tuple]:
-    # Logic: If you want, say, the left neighbour; backtrack to the last
-    # right turn you made, replace it with a left, then go hard right.
-    # Vice versa for right turns, undo the last left, then go hard left.
-    # 1. Backtrack
-    for i, turn in reverse_enumerate(path):
-        if turn != direction:
-            # Undo the turn
-            path = path[:i]
-            path += (direction,)
-            break
-    else:
-        # Reached the end of iteration, there is no neighbour number.
-        return None
-
-    # 2. Go hard in the other direction
-    nums = item_at_path(nums, path)
-    while not isinstance(nums, int):
-        path += (~direction,)
-        nums = nums[~direction]
-    return path
-
-
-def explode(nums: list, path: tuple):
-    pair = item_at_path(nums, path)
-    left_path = nearest_neighbour(nums, path, L)
-    right_path = nearest_neighbour(nums, path, R)
-    if left_path is not None:
-        # Cut off the final step, because we need the parent
-        # to actually change the value I love Python :)
-        which_kid = left_path[-1]
-        parent = item_at_path(nums, left_path[:-1])
-        parent[which_kid] += pair[L]
-    if right_path is not None:
-        which_kid = right_path[-1]
-        parent = item_at_path(nums, right_path[:-1])
-        parent[which_kid] += pair[R]
-    # Then replace with 0
-    pair_parent = item_at_path(nums, path[:-1])
-    which_kid = path[-1]
-    pair_parent[which_kid] = 0
-
-
-def split(nums: list, path: tuple):
-    num = item_at_path(nums, path)
-    lhs = floor(num/2)
-    rhs = ceil(num/2)
-    # Get parent because immutable references :)
-    which_kid = path[-1]
-    parent = item_at_path(nums, path[:-1])
-    parent[which_kid] = [lhs, rhs]
-
-
-# ===   Functions for trying and repeating operations   ===
-
-def try_explode(nums: list, path: tuple = ()) -> bool:
+    number = []
+    carry = 0
+    leaves = iter(left + right)
+    for num, depth in leaves:
+        num += carry
+        carry = 0
+        if depth == EXPLODE_THRESHOLD:
+            rhs, _ = next(leaves)
+            if number:
+                lhs_num, lhs_depth = number[-1]
+                number[-1] = (lhs_num + num, lhs_depth)
+            carry = rhs
+            number.append((0, depth))
+        else:
+            number.append((num, depth + 1))
+
+    i = 0
+    while i < len(number):
+        num, depth = number[i]
+        if num < SPLIT_THRESHOLD:
+            i += 1
+        elif depth < EXPLODE_THRESHOLD:
+            number[i:i + 1] = [(num // 2, depth + 1), ((num + 1) // 2, depth + 1)]
+            log("After split:", number)
+        else:
+            # Split, then explode the new pair
+            if i > 0:
+                lhs_num, lhs_depth = number[i - 1]
+                number[i - 1] = (lhs_num + num // 2, lhs_depth)
+            if i + 1 < len(number):
+                rhs_num, rhs_depth = number[i + 1]
+                number[i + 1] = (rhs_num + (num + 1) // 2, rhs_depth)
+            number[i] = (0, depth)
+            log("After split & explode:", number)
+            i = max(i - 1, 0)
+    return number
+
+
+def magnitude(number: Number) -> int:
     """
-    Recursively creeps through the tree in-order,
-    trying to do an explode action.
-
-    If it succeeds to do any action, it'll
-    immediately halt and return True.
-    If it creeps the entire tree without doing
-    anything, return False.
+    Returns the 'magnitude' of a snailfish number.
+    The magnitude is 3x the LHS + 2x the RHS, recusively.
     """
-    pair = item_at_path(nums, path)
-    # Recusive basecase - Can't explode a leaf
-    if isinstance(pair, int):
-        return False
-    if len(path) == EXPLODE_THRESHOLD:
-        explode(nums, path)
-        log("After explode:", nums)
-        return True
-    # Recursion baybeeee
-    go_left = path + (L,)
-    go_right = path + (R,)
-    if try_explode(nums, go_left):
-        return True
-    if try_explode(nums, go_right):
-        return True
-    return False
-
-
-def try_split(nums: list, path: tuple = ()) -> bool:
+    stack = []
+    for num, depth in number:
+        # Both halves of a pair are the same depth, and next to each other
+        while stack and stack[-1][1] == depth:
+            lhs, _ = stack.pop()
+            num = 3*lhs + 2*num
+            depth -= 1
+        stack.append((num, depth))
+    return stack[0][0]
+
+
+def best_with_lefts(snailfish_numbers: list[Number], lefts: range) -> tuple[int, int, int]:
     """
-    Recursively creeps through the tree in-order,
-    trying to do a split actions.
-
-    If it succeeds, it immediately returns True,
-    if it fails, it returns False.
+    Returns (the largest magnitude, left index, right index),
+    out of every pair whose left number is one of `lefts`
     """
-    item = item_at_path(nums, path)
-    if isinstance(item, int):
-        if item >= SPLIT_THRESHOLD:
-            split(nums, path)
-            log("After split:", nums)
-            return True
-        else:
-            return False
-    go_left = path + (L,)
-    go_right = path + (R,)
-    if try_split(nums, go_left):
-        return True
-    if try_split(nums, go_right):
-        return True
-    return False
+    best = (-1, -1, -1)
+    for i in lefts:
+        left = snailfish_numbers[i]
+        for j, right in enumerate(snailfish_numbers):
+            mag = magnitude(add(left, right))
+            if mag > best[0]:
+                best = (mag, i, j)
+    return best
 
 
-def snailfish_reduce(pair: list):
-    """
-    Reduces a snailfish tree by repeatedly exploding and
-    splitting. Halts when no more changes are possible.
-    """
-    while try_explode(pair) or try_split(pair):
-        pass
+def can_use_processes() -> bool:
+    # Worker processes find functions by module name, which they can't
+    # do when this script's been loaded with runpy (e.g. by `python -m aoc`)
+    return __name__ in sys.modules
 
 
-def magnitude(pair) -> int:
+def largest_pair(snailfish_numbers: list[Number], jobs: int = 1) -> tuple:
     """
-    Returns the 'magnitude' of a snailfish number.
-    The magnitude is 3x the LHS + 2x the RHS, recusively.
+    Returns (the largest magnitude, the [left, right] pair that made it).
+    With `jobs` > 1, the left numbers are shared out between that many processes
     """
-    if isinstance(pair, int):
-        return pair
-    return 3*magnitude(pair[L]) + 2*magnitude(pair[R])
+    n = len(snailfish_numbers)
+    if jobs > 1:
+        chunks = [range(start, n, jobs) for start in range(min(jobs, n))]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(partial(best_with_lefts, snailfish_numbers), chunks)
+            # Ties go to the first left, like the serial search
+            max_mag, i, j = max(results, key=lambda best: (best[0], -best[1]))
+    else:
+        max_mag, i, j = best_with_lefts(snailfish_numbers, range(n))
+    return max_mag, [snailfish_numbers[i], snailfish_numbers[j]]
+
+
+def default_jobs(n_numbers: int) -> int:
+    if n_numbers ** 2 < PARALLEL_MIN_PAIRS or not can_use_processes():
+        return 1
+    return os.cpu_count() or 1
+
+
+def parse_number(line: str) -> Number:
+    number = []
+    depth = 0
+    num = None
+    for c in line:
+        if c.isdigit():
+            num = (num or 0) * 10 + int(c)
+            continue
+        if num is not None:
+            number.append((num, depth))
+            num = None
+        if c == '[':
+            depth += 1
+        elif c == ']':
+            depth -= 1
+    return number
+
+
+def to_str(number: Number) -> str:
+    """
+    Turns a flat number back into its nested form, e.g. "[[3,4],5]"
+    """
+    stack = []
+    for num, depth in number:
+        item = str(num)
+        while stack and stack[-1][1] == depth:
+            lhs, _ = stack.pop()
+            item = f"[{lhs},{item}]"
+            depth -= 1
+        stack.append((item, depth))
+    return stack[0][0]
 
 
-if __name__ == "__main__":
+def parse(text: str) -> list[Number]:
+    return [parse_number(line) for line in text.splitlines() if line.strip()]
+
+
+def solve(text: str) -> int:
+    snailfish_numbers = parse(text)
+    return largest_pair(snailfish_numbers, default_jobs(len(snailfish_numbers)))[0]
+
+
+def main():
     with p.open('r') as file:
-        snailfish_numbers = [eval(line) for line in file]
-
-    max_mag = -1
-    max_tree = []
-    for left in snailfish_numbers:
-        for right in snailfish_numbers:
-            current_pair = [deepcopy(left), deepcopy(right)]
-            snailfish_reduce(current_pair)
-            mag = magnitude(current_pair)
-            if mag > max_mag:
-                max_mag = mag
-                max_tree = [left, right]
+        snailfish_numbers = parse(file.read())
+    max_mag, max_tree = largest_pair(snailfish_numbers, default_jobs(len(snailfish_numbers)))
+
     print("Largest pair:")
-    print(' ', max_tree[L])
-    print('+', max_tree[R])
-    print("=", max_mag)
\ No newline at end of file
+    print(' ', to_str(max_tree[0]))
+    print('+', to_str(max_tree[1]))
+    print("=", max_mag)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,10 @@ forward increases our x.
 from pathlib import Path
 p = Path(__file__).with_name("input")
 
-# Vars
-x = y = 0
 
-with p.open('r') as file:
-    for line in file:
+def solve(text: str) -> int:
+    x = y = 0
+    for line in text.splitlines():
         cmd, units = line.split(' ')
         units = int(units)
         if cmd == 'forward':
@@ -23,6 +22,12 @@ with p.open('r') as file:
             y -= units
         else:
             raise ValueError(f'Oh no help {cmd=}, {units=}')
+    return x * y
 
 
-print(x * y)
\ No newline at end of file
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
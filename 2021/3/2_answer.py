@@ -4,46 +4,77 @@ Now you filter numbers down.
 position, and removing numbers that don't have that bit.
 On a tie, '1' wins, repeat until one number remains.
 'CO2' is the same, but filtering the *most* common.
+
+Instead of rebuilding the list for every bit, the numbers are parsed
+and sorted once. Everything still in the running shares the bits
+filtered so far, so they're always one slice [lo:hi] of the sorted list,
+with the 0s at that position before the 1s. One bisect finds where the
+1s start, which gives both counts, and the slice shrinks to one side.
+That's O(bits x log n) per rating, after the sort.
 """
 
+from bisect import bisect_left
 from pathlib import Path
-from collections import Counter
 p = Path(__file__).with_name("input")
 
-def most_common_bit(nums, at_pos):
-    count = {'0': 0, '1': 0}
-    for num in nums:
-        count[num[at_pos]] += 1
-    
-    return '1' if count['1'] >= count['0'] else '0'
-
-# Vars
-with p.open('r') as file:
-    nums = [line.strip() for line in file]
-num_len = len(nums[0])
-
-# Find oxygen
-oxygen_nums = nums.copy()
-for j in range(num_len):
-    most_common = most_common_bit(oxygen_nums, at_pos=j)
-    oxygen_nums = [n for n in oxygen_nums if n[j] == most_common]
-    if len(oxygen_nums) == 1:
-        break
-else:
-    print("Error: The list is", len(oxygen_nums), "long:", oxygen_nums)
-
-o2 = oxygen_nums[0]
-print("Oxygen number is", o2, '|', int(o2, base=2))
-
-# Find CO2
-co2_nums = nums.copy()
-for j in range(num_len):
-    most_common = most_common_bit(co2_nums, at_pos=j)
-    co2_nums = [n for n in co2_nums if n[j] != most_common]
-    if len(co2_nums) == 1:
-        break
-else:
-    print("Error: The list is", len(co2_nums), "long:", co2_nums)
-
-co2 = co2_nums[0]
-print("CO2 number is", co2, '|', int(co2, base=2))
\ No newline at end of file
+
+def parse(text: str) -> tuple[list[int], int]:
+    """
+    Returns the numbers (sorted), and how many bits wide they are
+    """
+    lines = text.split()
+    return sorted(int(line, base=2) for line in lines), len(lines[0])
+
+
+def find_rating(nums: list[int], width: int, keep_most_common: bool) -> int:
+    """
+    Filters the sorted `nums` one bit position at a time, until one remains
+    """
+    lo, hi = 0, len(nums)
+    prefix = 0
+    for bit in reversed(range(width)):
+        if hi - lo == 1:
+            break
+        # Every number in [lo:hi] starts with `prefix`, so the
+        # ones with this bit set start at prefix | bit
+        split = bisect_left(nums, prefix | (1 << bit), lo, hi)
+        n_zeros = split - lo
+        n_ones = hi - split
+        keep_ones = (n_ones >= n_zeros) == keep_most_common
+        # Don't filter out everything, if they all have the same bit
+        if n_zeros == 0:
+            keep_ones = True
+        elif n_ones == 0:
+            keep_ones = False
+        if keep_ones:
+            lo = split
+            prefix |= 1 << bit
+        else:
+            hi = split
+    if hi - lo != 1:
+        raise ValueError(f"The list is {hi - lo} long: {nums[lo:hi]}")
+    return nums[lo]
+
+
+def solve(text: str) -> int:
+    """
+    Returns the life support rating, oxygen * CO2
+    """
+    nums, width = parse(text)
+    o2 = find_rating(nums, width, keep_most_common=True)
+    co2 = find_rating(nums, width, keep_most_common=False)
+    return o2 * co2
+
+
+def main():
+    with p.open('r') as file:
+        nums, width = parse(file.read())
+
+    o2 = find_rating(nums, width, keep_most_common=True)
+    print("Oxygen number is", f"{o2:0{width}b}", '|', o2)
+    co2 = find_rating(nums, width, keep_most_common=False)
+    print("CO2 number is", f"{co2:0{width}b}", '|', co2)
+    print(o2 * co2)
+
+if __name__ == "__main__":
+    main()
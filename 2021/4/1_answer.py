@@ -57,20 +57,27 @@ def apply_num(boards, num):
 SIZE = 5    # 5x5 boards
 
 
-with p.open('r') as file:
-    nums, *boards = file.read().strip().split('\n\n')
-
-nums = map(int, nums.strip().split(','))
-boards = [to_board(board.strip()) for board in boards]
-
-for num in nums:
-    board = apply_num(boards, num)
-    if board is not None:
-        print("Ding")
-        break
-
-sum_of_unmarked = sum(n.num
-                        for row in board for n in row 
-                        if not n.marked
-)
-print(num * sum_of_unmarked)
\ No newline at end of file
+def solve(text: str) -> int:
+    nums, *boards = text.strip().split('\n\n')
+
+    nums = map(int, nums.strip().split(','))
+    boards = [to_board(board.strip()) for board in boards]
+
+    for num in nums:
+        board = apply_num(boards, num)
+        if board is not None:
+            break
+
+    sum_of_unmarked = sum(n.num
+                            for row in board for n in row 
+                            if not n.marked
+    )
+    return num * sum_of_unmarked
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
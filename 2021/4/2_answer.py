@@ -1,81 +1,92 @@
 """
 It's a bingo solver. No diagonals.
 New rule: Pick the board that wins last
+
+Instead of scanning every cell of every board for each number drawn,
+the boards are indexed once, number -> [(board, cell)...].
+Each board's marks are a 25-bit int (bit i = cell i, row by row),
+so a win is just one of the row/column masks being fully set,
+and only the cells that actually get marked are ever touched.
 """
 
+import dataclasses
+from collections import defaultdict
 from pathlib import Path
-from pprint import pprint
+from typing import Iterator
 p = Path(__file__).with_name("input")
 
 
-class Space:
-    def __init__(self, num: str):
-        self.num = int(num)
-        self.marked = False
-
-    def mark(self, num):
-        if self.num == num:
-            self.marked = True
-            return True
-        else:
-            return False
-
-    def __repr__(self):
-        return ('O' if self.marked else 'X') + str(self.num)
-
-    def __bool__(self):
-        return self.marked
-
-
-def to_board(board: str) -> list:
-    rows = board.split('\n')
-    return [[Space(n) for n in row.split()] for row in rows]
-
-
-def mark_number(board, num):
-    for row in board:
-        for space in row:
-            space.mark(num)
-
-
-def check_complete_board(board) -> bool:
-    for row in board:
-        if all(row):
-            return True
-    for col in zip(*board):
-        if all(col):
-            return True
-    return False
-
-
-
-
 # Vars
 SIZE = 5    # 5x5 boards
-latest_num = -1
-latest_board = None
-
-
-with p.open('r') as file:
-    nums, *boards = file.read().strip().split('\n\n')
-
-nums = map(int, nums.strip().split(','))
-boards = [to_board(board.strip()) for board in boards]
-
-for num in nums:
-    print(num)
-    for board in boards:
-        mark_number(board, num)
-    for i in reversed(range(len(boards))):
-        if check_complete_board(boards[i]):
-            pprint(boards[i])
-            latest_num = num
-            latest_board = boards[i]
-            del boards[i]
-
-
-sum_of_unmarked = sum(n.num
-                        for row in latest_board for n in row 
-                        if not n.marked
-)
-print(latest_num * sum_of_unmarked)
\ No newline at end of file
+ROW_MASK = (1 << SIZE) - 1
+COLUMN_MASK = sum(1 << (i * SIZE) for i in range(SIZE))
+# LINE_MASKS[cell] = The row and column masks that `cell` is part of
+LINE_MASKS = [(ROW_MASK << (cell - cell % SIZE), COLUMN_MASK << (cell % SIZE))
+              for cell in range(SIZE * SIZE)]
+
+
+# Classes
+@dataclasses.dataclass
+class Bingo:
+    nums: list[int]
+    boards: list[list[int]]     # Each board's cells, row by row
+    # number -> every (board, cell) it appears in
+    index: dict[int, list[tuple[int, int]]] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.index = defaultdict(list)
+        for i_board, board in enumerate(self.boards):
+            for cell, num in enumerate(board):
+                self.index[num].append((i_board, cell))
+
+    def winners(self) -> Iterator[tuple[int, int]]:
+        """
+        Plays the game, yielding (number, score) for each board as it wins,
+        in the order they win. Boards are ignored once they've won
+        """
+        marks = [0] * len(self.boards)
+        unmarked_sums = [sum(board) for board in self.boards]
+        won = [False] * len(self.boards)
+        for num in self.nums:
+            for i_board, cell in self.index.get(num, ()):
+                if won[i_board]:
+                    continue
+                board_marks = marks[i_board] = marks[i_board] | (1 << cell)
+                unmarked_sums[i_board] -= num
+                row_mask, column_mask = LINE_MASKS[cell]
+                if board_marks & row_mask == row_mask or board_marks & column_mask == column_mask:
+                    won[i_board] = True
+                    yield num, num * unmarked_sums[i_board]
+
+
+# Funcs
+def parse(text: str) -> Bingo:
+    nums, *boards = text.strip().split('\n\n')
+    return Bingo(nums=[int(n) for n in nums.strip().split(',')],
+                 boards=[[int(n) for n in board.split()] for board in boards])
+
+
+def first_winner(bingo: Bingo) -> int:
+    _, score = next(bingo.winners())
+    return score
+
+
+def last_winner(bingo: Bingo) -> int:
+    # Boards that win on the same number are tied, the first one counts
+    last_num = last_score = None
+    for num, score in bingo.winners():
+        if num != last_num:
+            last_num, last_score = num, score
+    return last_score
+
+
+def solve(text: str) -> int:
+    return last_winner(parse(text))
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
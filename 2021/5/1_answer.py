@@ -30,14 +30,12 @@ def inclusive_range(a, b) -> range:
         return range(a, b-1, -1)
 
 
-# Vars
-lines = []
-max_x = 0
-max_y = 0
+def solve(text: str) -> int:
+    lines = []
+    max_x = 0
+    max_y = 0
 
-
-with p.open('r') as file:
-    for line in file:
+    for line in text.splitlines():
         lhs, rhs = line.split(' -> ')
         # Convert to ints
         x1, y1 = map(int, lhs.split(','))
@@ -51,20 +49,28 @@ with p.open('r') as file:
         max_y = max(y1, y2, max_y)
         lines.append((x1, x2, y1, y2))
 
-grid = [[0 for _ in range(max_x+1)] for _ in range(max_y+1)]
-n_overlaps = 0
-
-for (x1, x2, y1, y2) in lines:
-    # Turn into iterators
-    # Account for vertical/horzontal lines, where nums on that axis won't change
-    length = max(abs(x1-x2), abs(y1-y2)) + 1
-    x_iter = inclusive_range(x1, x2) if x1 != x2 else repeat(x1, times=length)
-    y_iter = inclusive_range(y1, y2) if y1 != y2 else repeat(y1, times=length)
-    for x, y in zip(x_iter, y_iter):
-        grid[y][x] += 1
-        if grid[y][x] == 2:
-            n_overlaps += 1
-
-# for row in grid:
-#     print(''.join(str(n) if n > 0 else '.' for n in row))
-print(n_overlaps)
+    grid = [[0 for _ in range(max_x+1)] for _ in range(max_y+1)]
+    n_overlaps = 0
+
+    for (x1, x2, y1, y2) in lines:
+        # Turn into iterators
+        # Account for vertical/horzontal lines, where nums on that axis won't change
+        length = max(abs(x1-x2), abs(y1-y2)) + 1
+        x_iter = inclusive_range(x1, x2) if x1 != x2 else repeat(x1, times=length)
+        y_iter = inclusive_range(y1, y2) if y1 != y2 else repeat(y1, times=length)
+        for x, y in zip(x_iter, y_iter):
+            grid[y][x] += 1
+            if grid[y][x] == 2:
+                n_overlaps += 1
+
+    # for row in grid:
+    #     print(''.join(str(n) if n > 0 else '.' for n in row))
+    return n_overlaps
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
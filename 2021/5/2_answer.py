@@ -9,14 +9,44 @@ point that's greater than 1.
 
 We now consider diagonals which is ez because I already built it
 to consider them
+
+The grid is only built when it's small enough (as a NumPy array if it's
+installed, or a flat bytearray if not). For huge coordinates, there's a sparse
+engine that never touches individual points:
+  - Lines are bucketed by direction (horizontal, vertical, diagonal, anti-diagonal)
+    and by which line they're on (e.g. y for horizontals, x - y for diagonals)
+  - Lines in the same bucket can only overlap along a stretch of it, found by
+    sweeping over where they start and end
+  - Lines in different directions cross at (at most) one point. For each pair of
+    directions, the lines are swept over in order of one direction's key, so
+    only lines whose ranges actually meet get checked, instead of every pair
+Then the overlapping stretches are added up, and the crossing points are
+counted once each (being careful of crossings that sit on those stretches too).
 """
 
 
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from itertools import combinations, repeat
 from pathlib import Path
-from itertools import repeat
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:     # The grid engine falls back to a bytearray
+    np = None
 
 p = Path(__file__).with_name("input")
 
+# Vars
+DENSE_MAX_CELLS = 1 << 22   # Bigger grids than this use the sparse engine
+Line = tuple[int, int, int, int]    # (x1, x2, y1, y2)
+# Directions
+HORIZONTAL = 0  # Keyed by y, and measured along x
+VERTICAL = 1    # Keyed by x, and measured along y
+DIAGONAL = 2    # Keyed by x - y, and measured along x
+ANTI_DIAGONAL = 3   # Keyed by x + y, and measured along x
+
 
 def inclusive_range(a, b) -> range:
     """
@@ -31,38 +61,232 @@ def inclusive_range(a, b) -> range:
         return range(a, b-1, -1)
 
 
-# Vars
-lines = []
-max_x = 0
-max_y = 0
-
-
-with p.open('r') as file:
-    for line in file:
+def parse(text: str) -> list[Line]:
+    lines = []
+    for line in text.splitlines():
         lhs, rhs = line.split(' -> ')
         # Convert to ints
         x1, y1 = map(int, lhs.split(','))
         x2, y2 = map(int, rhs.split(','))
-        # Learn the max x-y range to build the
-        # grid size from
-        max_x = max(x1, x2, max_x)
-        max_y = max(y1, y2, max_y)
         lines.append((x1, x2, y1, y2))
+    return lines
+
+
+# Dense engines
+def count_overlaps_bytearray(lines: list[Line], width: int, height: int) -> int:
+    # Each point only needs counting up to 2
+    grid = bytearray(width * height)
+    n_overlaps = 0
+
+    for (x1, x2, y1, y2) in lines:
+        # Turn into iterators
+        # Account for vertical/horzontal lines, where nums on that axis won't change
+        length = max(abs(x1-x2), abs(y1-y2)) + 1
+        x_iter = inclusive_range(x1, x2) if x1 != x2 else repeat(x1, times=length)
+        y_iter = inclusive_range(y1, y2) if y1 != y2 else repeat(y1, times=length)
+        for x, y in zip(x_iter, y_iter):
+            i = y * width + x
+            if grid[i] < 2:
+                grid[i] += 1
+                if grid[i] == 2:
+                    n_overlaps += 1
+    return n_overlaps
+
+
+def count_overlaps_numpy(lines: list[Line], width: int, height: int) -> int:
+    # Every point of every line, as a flat index, then count how often each appears
+    points = []
+    for (x1, x2, y1, y2) in lines:
+        length = max(abs(x1-x2), abs(y1-y2)) + 1
+        steps = np.arange(length)
+        xs = x1 + np.sign(x2 - x1) * steps
+        ys = y1 + np.sign(y2 - y1) * steps
+        points.append(ys * width + xs)
+    counts = np.bincount(np.concatenate(points), minlength=width * height)
+    return int(np.count_nonzero(counts > 1))
+
+
+# Sparse engine
+def classify(line: Line) -> tuple[int, int, int, int]:
+    """
+    Returns (direction, key, start, end), with start <= end.
+    (Single points are treated as horizontal)
+    """
+    x1, x2, y1, y2 = line
+    if y1 == y2:
+        return HORIZONTAL, y1, min(x1, x2), max(x1, x2)
+    if x1 == x2:
+        return VERTICAL, x1, min(y1, y2), max(y1, y2)
+    if (x2 - x1) == (y2 - y1):
+        return DIAGONAL, x1 - y1, min(x1, x2), max(x1, x2)
+    return ANTI_DIAGONAL, x1 + y1, min(x1, x2), max(x1, x2)
+
+
+def to_point(direction: int, key: int, along: int) -> tuple[int, int]:
+    if direction == HORIZONTAL:
+        return along, key
+    if direction == VERTICAL:
+        return key, along
+    if direction == DIAGONAL:
+        return along, along - key
+    return along, key - along
+
+
+def along(direction: int, x: int, y: int) -> int:
+    return y if direction == VERTICAL else x
+
+
+def key_of(direction: int, x: int, y: int) -> int:
+    return (y, x, x - y, x + y)[direction]
+
+
+def crossing(a: tuple, b: tuple) -> Optional[tuple[int, int]]:
+    """
+    Returns where two lines in different directions cross, if they do
+    """
+    (dir_a, key_a, _, _), (dir_b, key_b, _, _) = a, b
+    if dir_a > dir_b:
+        a, b = b, a
+        dir_a, key_a, dir_b, key_b = dir_b, key_b, dir_a, key_a
+    if dir_a == HORIZONTAL:         # y = key_a
+        y = key_a
+        x = (key_b, key_b + y, key_b - y)[dir_b - 1]
+    elif dir_a == VERTICAL:         # x = key_a
+        x = key_a
+        y = x - key_b if dir_b == DIAGONAL else key_b - x
+    else:                           # x - y = key_a, x + y = key_b
+        if (key_a + key_b) % 2:
+            return None     # They cross between points
+        x = (key_a + key_b) // 2
+        y = (key_b - key_a) // 2
+    for direction, _, start, end in (a, b):
+        if not start <= along(direction, x, y) <= end:
+            return None
+    return x, y
+
+
+def crossings_between(group_a: list[tuple], group_b: list[tuple]):
+    """
+    Yields where lines in group_a cross lines in group_b (each group being one direction).
+    Measured by (key_a, key_b), every line in group_a sits at one key_a over a range of
+    key_b, and vice versa. So sweep over key_a, keeping group_b's lines that are in
+    range sorted by their key_b, and look up each group_a line's key_b range in that
+    """
+    dir_a, dir_b = group_a[0][0], group_b[0][0]
+
+    def key_range(segment: tuple, direction: int) -> tuple[int, int]:
+        seg_dir, key, start, end = segment
+        ends = [key_of(direction, *to_point(seg_dir, key, along)) for along in (start, end)]
+        return min(ends), max(ends)
+
+    # Events at the same key_a: add group_b lines, then look up, then remove
+    events = []
+    for i, segment in enumerate(group_b):
+        lo, hi = key_range(segment, dir_a)
+        events.append((lo, 0, i))
+        events.append((hi, 2, i))
+    for i, segment in enumerate(group_a):
+        events.append((segment[1], 1, i))
+    events.sort()
+
+    active = []     # (key_b, index in group_b), sorted
+    for _, kind, i in events:
+        if kind == 0:
+            insort(active, (group_b[i][1], i))
+        elif kind == 2:
+            del active[bisect_left(active, (group_b[i][1], i))]
+        else:
+            lo, hi = key_range(group_a[i], dir_b)
+            for j in range(bisect_left(active, (lo, -1)), bisect_right(active, (hi, len(group_b)))):
+                point = crossing(group_a[i], group_b[active[j][1]])
+                if point is not None:   # Diagonals can still cross between points
+                    yield point
+
+
+def overlapping_stretches(segments: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Given (start, end) segments on the same line, returns the (start, end)
+    stretches covered by two or more of them, in order
+    """
+    events = sorted([(start, 1) for start, _ in segments]
+                    + [(end + 1, -1) for _, end in segments])
+    stretches = []
+    depth = 0
+    stretch_start = None
+    for position, change in events:
+        depth += change
+        if depth >= 2 and stretch_start is None:
+            stretch_start = position
+        elif depth < 2 and stretch_start is not None:
+            if position > stretch_start:
+                stretches.append((stretch_start, position - 1))
+            stretch_start = None
+    return stretches
+
+
+def count_overlaps_sparse(lines: list[Line]) -> int:
+    segments = [classify(line) for line in lines]
+
+    # Overlaps along the same line
+    buckets = defaultdict(list)
+    for direction, key, start, end in segments:
+        buckets[direction, key].append((start, end))
+    stretches = {}
+    total = 0
+    for bucket, bucket_segments in buckets.items():
+        if len(bucket_segments) > 1:
+            found = overlapping_stretches(bucket_segments)
+            if found:
+                stretches[bucket] = ([start for start, _ in found], [end for _, end in found])
+                total += sum(end - start + 1 for start, end in found)
+
+    def n_stretches_at(x: int, y: int) -> int:
+        n = 0
+        for direction in (HORIZONTAL, VERTICAL, DIAGONAL, ANTI_DIAGONAL):
+            found = stretches.get((direction, key_of(direction, x, y)))
+            if found:
+                starts, ends = found
+                i = bisect_right(starts, along(direction, x, y)) - 1
+                if i >= 0 and along(direction, x, y) <= ends[i]:
+                    n += 1
+        return n
+
+    # Crossings between different directions
+    by_direction = defaultdict(list)
+    for segment in segments:
+        by_direction[segment[0]].append(segment)
+    crossings = set()
+    for dir_a, dir_b in combinations(sorted(by_direction), 2):
+        crossings.update(crossings_between(by_direction[dir_a], by_direction[dir_b]))
+    for x, y in crossings:
+        n = n_stretches_at(x, y)
+        if n == 0:
+            total += 1      # A new point
+        else:
+            total -= n - 1  # Counted on n stretches, but it's only one point
+    return total
+
+
+def count_overlaps(lines: list[Line]) -> int:
+    """
+    Counts the points covered by 2+ lines, picking the engine by how big the grid would be
+    """
+    width = max(max(x1, x2) for x1, x2, _, _ in lines) + 1
+    height = max(max(y1, y2) for _, _, y1, y2 in lines) + 1
+    if min(x for line in lines for x in line) < 0 or width * height > DENSE_MAX_CELLS:
+        return count_overlaps_sparse(lines)
+    if np is not None:
+        return count_overlaps_numpy(lines, width, height)
+    return count_overlaps_bytearray(lines, width, height)
+
+
+def solve(text: str) -> int:
+    return count_overlaps(parse(text))
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-grid = [[0 for _ in range(max_x+1)] for _ in range(max_y+1)]
-n_overlaps = 0
-
-for (x1, x2, y1, y2) in lines:
-    # Turn into iterators
-    # Account for vertical/horzontal lines, where nums on that axis won't change
-    length = max(abs(x1-x2), abs(y1-y2)) + 1
-    x_iter = inclusive_range(x1, x2) if x1 != x2 else repeat(x1, times=length)
-    y_iter = inclusive_range(y1, y2) if y1 != y2 else repeat(y1, times=length)
-    for x, y in zip(x_iter, y_iter):
-        grid[y][x] += 1
-        if grid[y][x] == 2:
-            n_overlaps += 1
-
-# for row in grid:
-#     print(''.join(str(n) if n > 0 else '.' for n in row))
-print(n_overlaps)
+if __name__ == "__main__":
+    main()
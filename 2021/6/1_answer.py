@@ -2,6 +2,13 @@
 Fish population simulation.
 Every fish has a 'timer', a value which goes down by 1 each 'day'.
 If it reaches negative, it spawns a new fish.
+
+Instead of keeping every fish around, this works out how many fish a single
+timer-0 fish becomes after n days, f(n). The next day it's a timer-6 fish and
+a timer-8 fish, which are timer-0 fish 6 and 8 days behind, so:
+    f(n) = f(n-7) + f(n-9)      (and f(n) = 1 for n <= 0)
+A fish with timer t is a timer-0 fish t days behind, so it becomes f(N-t) fish.
+(See part 2 for doing this for huge N)
 """
 
 from pathlib import Path
@@ -16,20 +23,33 @@ p = Path(__file__).with_name("input")
 N_ITERATIONS = 80
 FRESH_CAP = 8       # Freshly spawned fish start at this
 REPEAT_CAP = 6      # After creating a new fish, it's set to this 
-fish = []
 
-with p.open('r') as file:
-    for n in file.read().split(','):
+
+def fish_from_one(n_days: int) -> list[int]:
+    """
+    Returns f(0)..f(n_days), where f(n) is how many fish
+    a single timer-0 fish becomes after n days
+    """
+    f = lambda n: counts[n] if n >= 0 else 1
+    counts = []
+    for n in range(n_days + 1):
+        counts.append(1 if n == 0 else f(n - 1 - REPEAT_CAP) + f(n - 1 - FRESH_CAP))
+    return counts
+
+
+def solve(text: str) -> int:
+    fish = []
+    for n in text.split(','):
         fish.append(int(n))
 
+    counts = fish_from_one(N_ITERATIONS)
+    return sum(counts[N_ITERATIONS - timer] if timer <= N_ITERATIONS else 1
+               for timer in fish)
+
 
-for _ in range(N_ITERATIONS):
-    print(_, ':', len(fish))
-    for i in range(len(fish)):
-        if fish[i] == 0:
-            fish[i] = REPEAT_CAP
-            fish.append(FRESH_CAP)
-        else:
-            fish[i] -= 1
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-print(len(fish))
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -2,46 +2,139 @@
 Fish population simulation.
 
 Oh god this will not scale, have to do smart brain stuff
+
+Every fish with the same timer behaves the same, so it's enough to know how
+many fish a single fish turns into. Call that f(n) for a timer-0 fish after
+n days. The next day it's a timer-6 fish and a timer-8 fish, which are
+timer-0 fish that are 6 and 8 days behind, giving the linear recurrence:
+    f(n) = f(n-7) + f(n-9)      (and f(n) = 1 for n <= 0)
+A fish with timer t is just a timer-0 fish t days behind, so after N days it's
+become f(N-t) fish. Those 9 values are the 'growth table', and any number of
+starting populations can be answered from it with a 9-term dot product each.
+
+f(N) itself is found with the usual trick for linear recurrences: work out
+x^N mod (x^9 - x^2 - 1) by repeated squaring, in O(log N) steps, and its
+coefficients say how much of each of f(0)..f(8) makes up f(N).
+(This is the same as raising the 9x9 day-step matrix to the N,
+but each squaring multiplies 81 pairs of numbers instead of 729)
 """
 
 from pathlib import Path
-from math import ceil, floor
+from typing import Iterable, Optional
 p = Path(__file__).with_name("input")
 
 
 # Vars
-N_ITERATIONS = 256+1
+N_DAYS = 256
 REPEAT_EVERY = 6    # A fish spawns one new fish after this many days
 FRESH_SPAWN = 8     # A fish's first cycle takes this long
+N_TIMERS = FRESH_SPAWN + 1
+Polynomial = list[int]  # Coefficients, lowest power first
+
+
+# Funcs
+def fish_from_one(n_days: int) -> list[int]:
+    """
+    Returns f(0)..f(n_days) by walking the recurrence.
+    f(n) is how many fish a single timer-0 fish becomes after n days
+    """
+    f = lambda n: counts[n] if n >= 0 else 1
+    counts = []
+    for n in range(n_days + 1):
+        counts.append(1 if n == 0 else f(n - 1 - REPEAT_EVERY) + f(n - 1 - FRESH_SPAWN))
+    return counts
+
+
+def mul_mod(a: Polynomial, b: Polynomial) -> Polynomial:
+    """
+    Returns a * b mod (x^9 - x^2 - 1).
+    That is, x^9 is replaced by x^2 + 1, as f(n) = f(n-7) + f(n-9)
+    """
+    product = [0] * (2 * N_TIMERS - 1)
+    if a is b:  # Squaring, so each cross term only needs working out once
+        for i, a_i in enumerate(a):
+            if a_i:
+                product[2 * i] += a_i * a_i
+                for j in range(i + 1, N_TIMERS):
+                    product[i + j] += 2 * a_i * a[j]
+    else:
+        for i, a_i in enumerate(a):
+            if a_i:
+                for j, b_j in enumerate(b):
+                    product[i + j] += a_i * b_j
+    for k in range(len(product) - 1, N_TIMERS - 1, -1):
+        product[k - 1 - REPEAT_EVERY] += product[k]
+        product[k - 1 - FRESH_SPAWN] += product[k]
+    return product[:N_TIMERS]
+
+
+def mul_x(a: Polynomial) -> Polynomial:
+    """
+    Returns a * x mod (x^9 - x^2 - 1), which is just a shift
+    """
+    overflow = a[-1]    # The new x^9 term
+    shifted = [0] + a[:-1]
+    shifted[FRESH_SPAWN - REPEAT_EVERY] += overflow
+    shifted[0] += overflow
+    return shifted
 
 
-def calc_new_fish(all_fish: list, n_days: int) -> int:
+def growth_table(n_days: int) -> list[int]:
     """
-    Calculates the number of children fish generated by
-    a group of fish
+    Returns how many fish a single fish becomes after `n_days`, for each starting timer
     """
-    # A list whose index is the amount of fish with the current timer.
-    # Shifts left to represent a day passing
-    fish = [0] * (FRESH_SPAWN + 1)
-    for f in all_fish:
-        fish[f+1] += 1
-    for day in range(n_days):
-        gave_birth = fish.pop(0)    # Fish who gave birth
-        fish.append(gave_birth)     # Spawn their children
-        fish[REPEAT_EVERY] += gave_birth # Reset the parent's timer
-        print(day, ':', sum(fish))
-    return sum(fish)
+    if n_days < 2 * N_TIMERS:
+        counts = fish_from_one(n_days)
+        return [counts[n_days - timer] if n_days >= timer else 1 for timer in range(N_TIMERS)]
 
+    # x^(n_days - 8), for f(n_days - 8)
+    power = n_days - FRESH_SPAWN
+    poly = [0, 1] + [0] * (N_TIMERS - 2)    # x
+    result = [1] + [0] * (N_TIMERS - 1)     # 1
+    while power:
+        if power & 1:
+            result = mul_mod(result, poly)
+        power >>= 1
+        if power:
+            poly = mul_mod(poly, poly)
 
+    # Then multiply by x for each following day, to get f(n_days - 8)..f(n_days)
+    initial = fish_from_one(FRESH_SPAWN)
+    table = []
+    for _ in range(N_TIMERS):
+        table.append(sum(c * f for c, f in zip(result, initial)))
+        result = mul_x(result)
+    # That's in order of timer 8 -> timer 0
+    table.reverse()
+    return table
+
+
+def population(timers: Iterable[int], n_days: int, table: Optional[list[int]] = None) -> int:
+    """
+    Returns how many fish there are after `n_days`, given every fish's timer.
+    Pass in a `growth_table(n_days)` to reuse it
+    """
+    if table is None:
+        table = growth_table(n_days)
+    return sum(table[timer] for timer in timers)
+
+
+def batch_populations(populations: Iterable[Iterable[int]], n_days: int) -> list[int]:
+    """
+    `population()`, for many starting populations at once
+    """
+    table = growth_table(n_days)
+    return [population(timers, n_days, table) for timers in populations]
 
-fish = []
 
-with p.open('r') as file:
-    for n in file.read().split(','):
-        fish.append(int(n))
-print(calc_new_fish(fish, N_ITERATIONS))
-exit()
+def solve(text: str) -> int:
+    fish = [int(n) for n in text.split(',')]
+    return population(fish, N_DAYS)
 
 
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-print(_+1, ':', len(fish))
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -5,25 +5,74 @@ shortest distance from all the other numbers?
 Note: I misunderstood. I thought the 'centre' had to
 be from the number list, but it's any whole number.
 It still worked with this case however
+
+(That's because the best spot is the median, which is always one of the numbers.
+Moving away from it brings more crabs further away than it brings closer.
+So this sorts once and measures from the median, with prefix sums making each
+spot's total distance O(log n). The old search over every number is kept
+as `find_best_brute_force()`, to check against.)
 """
 
+from bisect import bisect_left
+from itertools import accumulate
 from pathlib import Path
 from math import inf
 p = Path(__file__).with_name("input")
 
-# Vars
-current_best = inf
-best_spot = -1
+
+def parse(text: str) -> list[int]:
+    return sorted(map(int, text.strip().split(',')))
+
+
+def find_best_brute_force(nums: list[int]) -> tuple:
+    """
+    Returns (the shortest total distance, the spot it's measured from)
+    """
+    current_best = inf
+    best_spot = -1
+
+    for align in nums:
+        dist = sum(abs(align-n) for n in nums)
+        if dist < current_best:
+            current_best = dist
+            best_spot = align
+    return current_best, best_spot
+
+
+def total_distance(nums: list[int], sums: list[int], pivot: int) -> int:
+    """
+    sum(|pivot - n|), given the sorted numbers and their prefix sums
+    """
+    n = len(nums)
+    k = bisect_left(nums, pivot)    # nums[:k] are left of the pivot
+    left = k * pivot - sums[k]
+    right = (sums[n] - sums[k]) - (n - k) * pivot
+    return left + right
+
+
+def find_best(text: str, verify: bool = False) -> tuple:
+    """
+    Returns (the shortest total distance, the spot it's measured from).
+    With `verify`, it's checked against the brute force
+    """
+    nums = parse(text)
+    sums = list(accumulate(nums, initial=0))    # sums[k] = sum(nums[:k])
+    median = nums[(len(nums) - 1) // 2]
+    best = total_distance(nums, sums, median), median
+    if verify:
+        expected = find_best_brute_force(nums)
+        assert best[0] == expected[0], f"Got {best}, but the brute force found {expected}"
+    return best
 
 
-with p.open('r') as file:
-    nums = sorted(map(int, file.read().strip().split(',')))
+def solve(text: str) -> int:
+    return find_best(text)[0]
 
 
-for align in nums:
-    dist = sum(abs(align-n) for n in nums)
-    if dist < current_best:
-        current_best = dist
-        best_spot = align
+def main():
+    with p.open('r') as file:
+        current_best, best_spot = find_best(file.read(), verify=True)
+    print(f"{current_best=}, {best_spot=}")
 
-print(f"{current_best=}, {best_spot=}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
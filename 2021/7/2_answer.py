@@ -1,8 +1,23 @@
 """
 Distance calculation. What whole number has the
 shortest distance from all the other numbers?
+
+Part 2: Moving n steps costs the n-th triangle number, n(n+1)/2
+
+The total cost is sum(d^2 + d) / 2 over every crab's distance d. The d^2 part
+is smallest at the mean, and the d part can only pull the best spot half a
+step away from it, so the answer is at either floor(mean) or ceil(mean).
+
+Each of those is costed in O(log n), with the positions sorted once and
+summed as prefix sums:
+  - sum(d^2) = sum(x^2) - 2p*sum(x) + n*p^2        (over every crab)
+  - sum(d)   = the crabs left of p, and right of p (found by bisecting)
+The brute force (try every spot between the left and right-most crabs)
+is kept as `find_best_brute_force()`, to check against.
 """
 
+from bisect import bisect_left
+from itertools import accumulate
 from pathlib import Path
 from math import inf
 p = Path(__file__).with_name("input")
@@ -16,24 +31,79 @@ def calc_dist(nums, pivot):
     return sum(triangle_number(abs(pivot-n)) for n in nums)
 
 
+def parse(text: str) -> list[int]:
+    return [int(n) for n in text.strip().split(',')]
+
+
+def find_best_brute_force(nums: list[int]) -> tuple:
+    """
+    Returns (the cheapest total fuel, the spot it's measured from)
+    """
+    left = min(nums)
+    right = max(nums)
+    current_best = inf
+    best_spot = -1
+    for pivot in range(left, right + 1):
+        dist = calc_dist(nums, pivot)
+        if dist < current_best:
+            current_best = dist
+            best_spot = pivot
+    return current_best, best_spot
+
+
+class FuelCalculator:
+    """
+    Works out the total fuel to move every crab to a spot, in O(log n)
+    """
+    def __init__(self, nums: list[int]):
+        self.nums = sorted(nums)
+        self.sums = list(accumulate(self.nums, initial=0))              # sums[k] = sum(nums[:k])
+        self.squares = list(accumulate((n*n for n in self.nums), initial=0))
+
+    def linear(self, pivot: int) -> int:
+        """
+        sum(|pivot - n|)
+        """
+        n = len(self.nums)
+        k = bisect_left(self.nums, pivot)   # nums[:k] are left of the pivot
+        left = k * pivot - self.sums[k]
+        right = (self.sums[n] - self.sums[k]) - (n - k) * pivot
+        return left + right
+
+    def triangular(self, pivot: int) -> int:
+        """
+        sum(triangle_number(|pivot - n|))
+        """
+        n = len(self.nums)
+        squared = self.squares[n] - 2 * pivot * self.sums[n] + n * pivot * pivot
+        return (squared + self.linear(pivot)) // 2
+
+
+def find_best(text: str, verify: bool = False) -> tuple:
+    """
+    Returns (the cheapest total fuel, the spot it's measured from).
+    With `verify`, it's checked against the brute force
+    """
+    nums = parse(text)
+    fuel = FuelCalculator(nums)
+    total = fuel.sums[-1]
+    floor_mean = total // len(nums)
+    ceil_mean = -(-total // len(nums))
+    best = min((fuel.triangular(pivot), pivot) for pivot in (floor_mean, ceil_mean))
+    if verify:
+        expected = find_best_brute_force(nums)
+        assert best[0] == expected[0], f"Got {best}, but the brute force found {expected}"
+    return best
 
-# Vars
-current_best = inf
-best_spot = -1
 
-with p.open('r') as file:
-    nums = [int(n) for n in file.read().strip().split(',')]
+def solve(text: str) -> int:
+    return find_best(text)[0]
 
-left = min(nums)
-right = max(nums)
-current_best = inf
-best_spot = -1
-for pivot in range(left, right):
-    dist = calc_dist(nums, pivot)
-    if dist < current_best:
-        current_best = dist
-        best_spot = pivot
-    print(f"{pivot} : {dist}")
 
+def main():
+    with p.open('r') as file:
+        current_best, best_spot = find_best(file.read(), verify=True)
+    print(f"{current_best=}, {best_spot=}")
 
-print(f"{current_best=}, {best_spot=}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -33,19 +33,26 @@ VALID_LENGTHS = {
     7,  # '8' light up 7
 }
 
-everything = []
 
-with p.open('r') as file:
-    for line in file:
+def solve(text: str) -> int:
+    everything = []
+    for line in text.splitlines():
         _lhs, rhs = line.split('|')
         everything.extend(rhs.split())
 
-wanted_numbers_found = 0
-for segment in everything:
-    segment = segment.strip()
-    if segment == '|':
-        continue
-    if len(segment) in VALID_LENGTHS:
-        wanted_numbers_found += 1
+    wanted_numbers_found = 0
+    for segment in everything:
+        segment = segment.strip()
+        if segment == '|':
+            continue
+        if len(segment) in VALID_LENGTHS:
+            wanted_numbers_found += 1
+    return wanted_numbers_found
 
-print(wanted_numbers_found)
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
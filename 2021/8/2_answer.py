@@ -19,101 +19,89 @@ b    .  b    .  .    c  b    c  b    c
 
 LHS is the hints to what each number means, RHS is the number.
 Gotta be smart
+
+Each pattern becomes a 7-bit int (bit 0 = 'a' ... bit 6 = 'g'), and every
+digit can be told apart by just three numbers:
+    (how many segments, how many it shares with 1, how many it shares with 4)
+1 and 4 are the only patterns with 2 and 4 segments, so once they're found,
+each output digit is a popcount or two and a lookup in `SIGNATURES`.
+The other patterns in the LHS don't even need decoding.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, FrozenSet, DefaultDict
-from collections import defaultdict
+from typing import Iterable
 p = Path(__file__).with_name("input")
 
 # Vars
-NUM_SEGS = [ # In a 7-segment display
-    6,  # 0
-    2,  # 1
-    5,  # 2
-    5,  # 3
-    4,  # 4
-    5,  # 5
-    6,  # 6
-    3,  # 7
-    7,  # 8
-    6,  # 9
+DIGIT_SEGMENTS = [  # In a 7-segment display
+    "abcefg",   # 0
+    "cf",       # 1
+    "acdeg",    # 2
+    "acdfg",    # 3
+    "bcdf",     # 4
+    "abdfg",    # 5
+    "abdefg",   # 6
+    "acf",      # 7
+    "abcdefg",  # 8
+    "abcdfg",   # 9
 ]
+SEGMENT_BITS = {segment: 1 << i for i, segment in enumerate("abcdefg")}
+POPCOUNT = [bin(mask).count('1') for mask in range(1 << 7)]
+
+
+# Patterns never repeat a segment, so there are only 13,699 possible strings to cache
+@lru_cache(maxsize=None)
+def to_mask(pattern: str) -> int:
+    mask = 0
+    for segment in pattern:
+        mask |= SEGMENT_BITS[segment]
+    return mask
+
+
+def signature(mask: int, one: int, four: int) -> tuple[int, int, int]:
+    return POPCOUNT[mask], POPCOUNT[mask & one], POPCOUNT[mask & four]
+
+
+# (n_segments, shared with 1, shared with 4) -> digit. Every digit's is unique
+SIGNATURES = {signature(to_mask(segments), to_mask(DIGIT_SEGMENTS[1]), to_mask(DIGIT_SEGMENTS[4])): digit
+              for digit, segments in enumerate(DIGIT_SEGMENTS)}
+assert len(SIGNATURES) == 10
 
 
-def associate_nums(_codes: List[FrozenSet[str]]) -> List[FrozenSet[str]]:
+def decode_line(line: str) -> int:
     """
-    Takes a list of unknown 7-segment codes, and maps them to their
-    correct numbers.
+    Given a line of "<all 10 patterns> | <the output's patterns>",
+    returns the output's number
     """
-    # The only distinguishing factor is each code's length
-    unknown: DefaultDict[int, List[FrozenSet]] = defaultdict(list)
-    for code in _codes:
-        unknown[len(code)].append(code)
-    known: List[FrozenSet] = [None] * 10
-    # 1, 4, 7, and 8 have unique lengths
-    known[1] = unknown[NUM_SEGS[1]].pop()
-    known[4] = unknown[NUM_SEGS[4]].pop()
-    known[7] = unknown[NUM_SEGS[7]].pop()
-    known[8] = unknown[NUM_SEGS[8]].pop()
-    # 0, 6, 9 are all 6-len
-    # Whatever *doesn't* superset 1 is 6
-    six_lens = unknown[6]
-    for i in range(len(six_lens)):
-        if not six_lens[i].issuperset(known[1]):
-            known[6] = six_lens.pop(i)
-            break
-    # Whatever supersets 4 is 9
-    for i in range(len(six_lens)):
-        if six_lens[i].issuperset(known[4]):
-            known[9] = six_lens.pop(i)
-            break
-    # Whatever remains must be 0
-    known[0] = six_lens.pop()
-    # 2, 3, 5 are all 5-len.
-    # Of them, only 3 supersets 1.
-    five_lens = unknown[5]
-    for i in range(len(five_lens)):
-        if five_lens[i].issuperset(known[1]):
-            known[3] = five_lens.pop(i)
-            break
-    # Out of 2, 5, only 5 subsets 6
-    for i in range(len(five_lens)):
-        if five_lens[i].issubset(known[6]):
-            known[5] = five_lens.pop(i)
-            break
-    # Whatever remains must be 2
-    known[2] = five_lens.pop()
-
-    return known
-
-
-def decode_numbers(lhs: List[FrozenSet[str]], rhs: List[FrozenSet[str]]) -> int:
+    lhs, rhs = line.split('|')
+    one = four = 0
+    for pattern in lhs.split():
+        if len(pattern) == 2:
+            one = to_mask(pattern)
+        elif len(pattern) == 4:
+            four = to_mask(pattern)
+    number = 0
+    for pattern in rhs.split():
+        mask = to_mask(pattern)
+        number = number * 10 + SIGNATURES[POPCOUNT[mask], POPCOUNT[mask & one], POPCOUNT[mask & four]]
+    return number
+
+
+def sum_outputs(lines: Iterable[str]) -> int:
     """
-    Give a lhs of the 7-segment representation of all numbers,
-    and a rhs of the numbers we want to know,
-    returns the numbers decoded.
+    Sums every line's output. `lines` can be a file, to stream it
     """
-    s_num = 0
-    e = 0
-    mapping = associate_nums(lhs)
-    for to_know in reversed(rhs):
-        for i, code in enumerate(mapping):
-            if code == to_know:
-                s_num += i * 10**e
-                e += 1
-                break
-    return s_num
-
-
-total = 0
-with p.open('r') as file:
-    for line in file:
-        lhs, rhs = line.split('|')
-        # Prep into sets to do set operations
-        lhs = [frozenset(s.strip()) for s in lhs.split()]
-        rhs = [frozenset(s.strip()) for s in rhs.split()]
-        # Decode them
-        number = decode_numbers(lhs, rhs)
-        total += number
-print(total)
+    return sum(decode_line(line) for line in lines if line.strip())
+
+
+def solve(text: str) -> int:
+    return sum_outputs(text.splitlines())
+
+
+def main():
+    with p.open('r') as file:
+        print(sum_outputs(file))
+
+if __name__ == "__main__":
+    main()
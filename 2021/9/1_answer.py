@@ -5,42 +5,35 @@ Out-of-bounds neighbours are ignored, print the sum of all
 'low points' values + the number of low points
 """
 
+import sys
 from pathlib import Path
-p = Path(__file__).with_name("input")
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import Grid
 
-def neighbours(grid, i, j):
-    """
-    Generator.
-    Returns the values above, below, left, and right of
-    the given position, if it's in range
-    """
-    COORDS = ((-1, 0), (0, 1), (1, 0), (0, -1))
-    for di, dj in COORDS:
-        ni = i + di
-        nj = j + dj
-        if 0 <= ni < len(grid) and 0 <= nj < len(grid[ni]):
-            yield grid[ni][nj]
+p = Path(__file__).with_name("input")
 
 # Vars
 ...
 
-def main():
-    with p.open('r') as file:
-        grid = [[int(i) for i in line.strip()]
-                for line in file
-                if line.strip()
-        ]
+def solve(text: str) -> int:
+    grid = Grid.parse(text, digits=True)
+    cells = grid.cells
     
     total = 0
     n_lows = 0
-    for i, line in enumerate(grid):
-        for j, val in enumerate(line):
-            if all(n > val for n in neighbours(grid, i, j)):
-                print(f"{i=}, {j=}, {val=}")
-                total += val
-                n_lows += 1
-    print(f"{total+n_lows=}")
+    for i in grid.indices():
+        val = cells[i]
+        # The border is higher than any digit, so it never gets in the way
+        if all(cells[i + offset] > val for offset in grid.orthogonal):
+            total += val
+            n_lows += 1
+    return total + n_lows
+
+
+def main():
+    with p.open('r') as file:
+        print(f"total+n_lows={solve(file.read())}")
 
 
 if __name__ == "__main__":
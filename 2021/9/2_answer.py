@@ -10,63 +10,95 @@ and all other locations will always be part of exactly one basin.
 The size of a basin is the number of locations within the basin,
 including the low point.
 
-Logic: BFS Flood fill
+Logic: Connected components, in one raster scan.
+Every cell below the waterline is joined (union-find) to the cells left of
+and above it, when they're below the waterline too. That's every edge of
+every basin, so when the scan's done, each basin is one tree, whose root
+holds its size. No frontier, and nothing visited twice.
+If SciPy's installed, `scipy.ndimage.label()` does the same thing in C.
 """
 
-from collections import deque
-from heapq import heappop, heappush
+import sys
+from array import array
+from heapq import nlargest
+from math import prod
 from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import Grid
+
+try:
+    import numpy as np
+    from scipy import ndimage
+except ImportError:     # Only the union-find engine is available
+    ndimage = None
+
 p = Path(__file__).with_name("input")
 
+# Vars
+N_LARGEST = 3
+
+
+def basin_sizes(grid: Grid) -> list[int]:
+    """
+    Returns the size of every basin, in no particular order
+    """
+    cells = grid.cells
+    stride = grid.stride
+    highest = max(cells[i] for i in grid.indices())
+    # Every cell starts as its own tree of size 1
+    parent = array('q', range(len(cells)))
+    size = array('q', bytes(8 * len(cells)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = i = parent[parent[i]]   # Path halving
+        return i
+
+    for i in grid.indices():
+        if cells[i] >= highest:
+            continue
+        size[i] = 1
+        # The border is above the waterline too, so it's never joined
+        for j in (i - 1, i - stride):
+            if cells[j] < highest:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    # Hang the smaller tree off the bigger one
+                    if size[root_i] < size[root_j]:
+                        root_i, root_j = root_j, root_i
+                    parent[root_j] = root_i
+                    size[root_i] += size[root_j]
+    return [size[i] for i in grid.indices() if parent[i] == i and cells[i] < highest]
+
+
+def basin_sizes_scipy(text: str) -> list[int]:
+    """
+    `basin_sizes()`, using `scipy.ndimage.label()` on a NumPy array
+    """
+    rows = text.split()
+    heights = np.frombuffer(''.join(rows).encode(), dtype=np.uint8).reshape(len(rows), -1)
+    # The default structure only connects orthogonal neighbours
+    labels, _ = ndimage.label(heights < heights.max())
+    return np.bincount(labels.ravel())[1:].tolist()
+
 
-def neighbours(grid, i, j):
+def find_basins(text: str) -> list[int]:
     """
-    Generator.
-    Returns the co-ords above, below, left, and right of
-    the given position, if it's in range
+    Returns every basin's size
     """
-    COORDS = ((-1, 0), (0, 1), (1, 0), (0, -1))
-    for di, dj in COORDS:
-        ni = i + di
-        nj = j + dj
-        if 0 <= ni < len(grid) and 0 <= nj < len(grid[ni]):
-            yield (ni, nj)
+    if ndimage is not None:
+        return basin_sizes_scipy(text)
+    return basin_sizes(Grid.parse(text, digits=True))
 
 
+def solve(text: str) -> int:
+    return prod(nlargest(N_LARGEST, find_basins(text)))
 
 
 def main():
     with p.open('r') as file:
-        grid = [[int(i) for i in line.strip()]
-                for line in file
-                if line.strip()
-                ]
-    # Placing 'visited' down here because each tile is part of
-    # only 1 basin (unless it's above the waterline).
-    visited = [[False for _ in line] for line in grid]
-    highest = max(n for line in grid for n in line)
-
-    basins = []
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            basin_size = 0
-            frontier = deque()
-            frontier.append( (i, j) )
-            while len(frontier) > 0:
-                i, j = frontier.popleft()
-                if not visited[i][j]:
-                    visited[i][j] = True
-                    if grid[i][j] < highest:
-                        frontier.extend(neighbours(grid, i, j))
-                        basin_size += 1
-            if basin_size > 0:
-                # Negative basin_size because `heapq` is a min-heap
-                heappush(basins, -basin_size)
-    
-    print("3 largest basins:")
-    best = [heappop(basins) for _ in range(3)]
-    # Correct the negatives
-    print(f"{-best[0]} * {-best[1]} * {-best[2]} =", -best[0]*-best[1]*-best[2])
+        print(f"Product of the {N_LARGEST} largest basins:", solve(file.read()))
 
 
 if __name__ == "__main__":
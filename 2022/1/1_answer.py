@@ -20,16 +20,21 @@ So, return 5
 from pathlib import Path
 p = Path(__file__).with_name("input")
 
-# Vars
-highest_calories = 0
-current_run = 0
-
-with p.open('r') as file:
-    for line in file:
-        if line == '\n': # Blank line, end of group
+def solve(text: str) -> int:
+    highest_calories = 0
+    current_run = 0
+    for line in text.splitlines():
+        if line == '': # Blank line, end of group
             highest_calories = max(highest_calories, current_run)
             current_run = 0
         else:
             current_run += int(line)
+    return highest_calories
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-print(highest_calories)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
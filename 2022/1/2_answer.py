@@ -11,8 +11,6 @@ p = Path(__file__).with_name("input")
 
 # Vars
 MAX_LEN = 3
-highest_calories = []
-current_run = 0
 
 def insert_if_large_enough(sorted_array: list, max_len: int, item: int):
     if len(sorted_array) < max_len:
@@ -23,12 +21,21 @@ def insert_if_large_enough(sorted_array: list, max_len: int, item: int):
     sorted_array.sort()
 
 
-with p.open('r') as file:
-    for line in file:
-        if line == '\n': # Blank line, end of group
+def solve(text: str) -> int:
+    highest_calories = []
+    current_run = 0
+    for line in text.splitlines():
+        if line == '': # Blank line, end of group
             insert_if_large_enough(highest_calories, MAX_LEN, current_run)
             current_run = 0
         else:
             current_run += int(line)
+    return sum(highest_calories)
 
-print(sum(highest_calories))
\ No newline at end of file
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
+
+if __name__ == "__main__":
+    main()
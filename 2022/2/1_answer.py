@@ -18,8 +18,7 @@ def calculate_score(their_move: str, your_move: str) -> int:
     move_score = CHAR_TO_MOVE[your_move]
     # Step 2: The other part is the outcome
     outcome_score = check_outcome(CHAR_TO_MOVE[your_move], CHAR_TO_MOVE[their_move])
-    print(move_score, "+", outcome_score)
-    
+
     return move_score + outcome_score
 
 # Vars
@@ -50,13 +49,18 @@ CHAR_TO_MOVE = {
     'Z': MOVES.SCISSORS,
 }
 
-total_score = 0
-
-with p.open('r') as file:
-    for line in file:
+def solve(text: str) -> int:
+    total_score = 0
+    for line in text.splitlines():
         lhs, rhs = line[0], line[2]
-        print(lhs, rhs, "=> ", end='')
         score = calculate_score(lhs, rhs)
         total_score += score
+    return total_score
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-print(total_score)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
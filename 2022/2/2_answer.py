@@ -16,8 +16,7 @@ def calculate_score(their_move: str, expected_outcome: str) -> int:
     else:
         raise ValueError()
     # Step 2: The other part is the outcome
-    print(your_move, "+", expected_outcome)
-    
+
     return your_move + expected_outcome
 
 # Vars
@@ -53,13 +52,18 @@ CHAR_TO_OUTCOME = {
     'Z': OUTCOME.WIN,
 }
 
-total_score = 0
-
-with p.open('r') as file:
-    for line in file:
+def solve(text: str) -> int:
+    total_score = 0
+    for line in text.splitlines():
         lhs, rhs = line[0], line[2]
-        print(lhs, rhs, "=> ", end='')
         score = calculate_score(lhs, rhs)
         total_score += score
+    return total_score
+
+
+def main():
+    with p.open('r') as file:
+        print(solve(file.read()))
 
-print(total_score)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -37,11 +37,18 @@ def shared_letter(line: str) -> str:
     return shared_character.pop()
 
 
-total_score = 0
-with p.open('r') as file:
-    for line in file:
+def solve(text: str) -> int:
+    total_score = 0
+    for line in text.splitlines():
         line = line.rstrip()    # Remove newline
         char = shared_letter(line)
         total_score += letter_score[char]
+    return total_score
 
-print("total_score =", total_score)
+
+def main():
+    with p.open('r') as file:
+        print("total_score =", solve(file.read()))
+
+if __name__ == "__main__":
+    main()
@@ -38,9 +38,9 @@ def shared_letter(lines: Iterable[str]) -> str:
     return shared_character.pop()
 
 
-total_score = 0
-with p.open('r') as file:
-    file_iter = iter(file)
+def solve(text: str) -> int:
+    total_score = 0
+    file_iter = iter(text.splitlines())
     try:    # Loop until EOF
         while True:
             group = [next(file_iter).rstrip() for _ in range(GROUP_SIZE)]
@@ -48,5 +48,12 @@ with p.open('r') as file:
             total_score += LETTER_SCORE[char]
     except StopIteration:
         pass
+    return total_score
 
-print("total_score =", total_score)
+
+def main():
+    with p.open('r') as file:
+        print("total_score =", solve(file.read()))
+
+if __name__ == "__main__":
+    main()
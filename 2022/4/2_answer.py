@@ -32,13 +32,18 @@ def ranges_overlap(a_1: int, a_2: int, b_1: int, b_2: int) -> bool:
     return (a_1 <= b_1 <= a_2) or (b_1 <= a_1 <= b_2)
 
 
-def main():
+def solve(text: str) -> int:
     total_overlaps = 0
+    for line in text.splitlines():
+        nums = re.match(PATTERN, line).groups()
+        a_1, a_2, b_1, b_2 = (int(d) for d in nums)
+        total_overlaps += ranges_overlap(a_1, a_2, b_1, b_2)
+    return total_overlaps
+
+
+def main():
     with p.open('r') as file:
-        for line in file:
-            nums = re.match(PATTERN, line).groups()
-            a_1, a_2, b_1, b_2 = (int(d) for d in nums)
-            total_overlaps += ranges_overlap(a_1, a_2, b_1, b_2)
+        total_overlaps = solve(file.read())
     
     print("total_overlaps =", total_overlaps)
 
@@ -30,7 +30,7 @@ From left-to-right, print the top value of each stack
 from collections import defaultdict
 from pathlib import Path
 import re
-from typing import Dict, List, TextIO, Tuple
+from typing import Dict, Iterable, List, Tuple
 p = Path(__file__).with_name("input")
 
 # Vars
@@ -39,7 +39,7 @@ MOVE_PATTERN = r"move (\d+) from (\d+) to (\d+)"
 # Funcs
 
 
-def split_crates_and_instructions(file: TextIO) -> Tuple[List[str], List[str]]:
+def split_crates_and_instructions(file: Iterable[str]) -> Tuple[List[str], List[str]]:
     """
     The two sections (Crates and instruction) are separated by a newline
     """
@@ -94,9 +94,11 @@ def parse_crates(crate_lines: List[str]) -> Dict[int, List[str]]:
     return dict(crates)
 
 
-def main():
-    with p.open('r') as file:
-        crates_lines, instruction_lines = split_crates_and_instructions(file)
+def rearrange(text: str) -> Dict[int, List[str]]:
+    """
+    Runs every move instruction, returning the final stacks
+    """
+    crates_lines, instruction_lines = split_crates_and_instructions(text.splitlines())
     # Parse the crate text into a dict
     crates = parse_crates(crates_lines)
     for line in instruction_lines:
@@ -106,9 +108,17 @@ def main():
         for _ in range(count):
             moving_values.append(crates[src].pop())
         crates[dest].extend(reversed(moving_values))
+    return crates
+
 
-    print(crates)
-    print("Final char of each stack:", ''.join(stack[-1] for stack in crates.values()))
+def solve(text: str) -> str:
+    crates = rearrange(text)
+    return ''.join(stack[-1] for stack in crates.values())
+
+
+def main():
+    with p.open('r') as file:
+        print("Final char of each stack:", solve(file.read()))
 
 
 if __name__ == "__main__":
@@ -22,14 +22,22 @@ WINDOW_SIZE = 14
 def contains_repeat_elements(s):
     return len(s) != len(set(s))
 
+def find_marker(line: str) -> int:
+    for i in range(WINDOW_SIZE, len(line)):
+        window = line[i-WINDOW_SIZE:i]
+        if not contains_repeat_elements(window):
+            break
+    return i
+
+def solve(text: str) -> int:
+    """
+    Returns the first line's marker location
+    """
+    return find_marker(text.splitlines()[0])
+
 def main():
     with p.open('r') as file:
-        for (line_num, line) in enumerate(file, start=1):
-            for i in range(WINDOW_SIZE, len(line)):
-                window = line[i-WINDOW_SIZE:i]
-                if not contains_repeat_elements(window):
-                    break
-            print("Line num:", line_num, "| Marker location:", i)
+        print("Marker location:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
@@ -41,7 +41,7 @@ The sum of all directories would be 250 (burger.jpg is counted twice)
 from dataclasses import dataclass
 from pathlib import Path
 import re
-from typing import Dict, List, Optional, TextIO
+from typing import Dict, Iterable, List, Optional
 p = Path(__file__).with_name("input")
 
 # Vars
@@ -144,7 +144,7 @@ class Directory:
 
 
 # Funcs
-def parse_into_commands_and_data(file: TextIO) -> List[Command]:
+def parse_into_commands_and_data(file: Iterable[str]) -> List[Command]:
     commands: List[Command] = []
     for line in file:
         line = line.strip()
@@ -175,10 +175,12 @@ def pt1_size_below_max(directory: Directory) -> int:
         size = 0
     return size + sum(pt1_size_below_max(subdir) for subdir in directory.sub_dirs.values())
 
-def main():
+def build_file_system(lines: Iterable[str]) -> Directory:
+    """
+    Replays the terminal session, returning the root directory
+    """
     file_system = Directory.create_root_node()
-    with p.open('r') as file:
-        commands = parse_into_commands_and_data(file)
+    commands = parse_into_commands_and_data(lines)
 
     for cmd in commands:
         if cmd.name == "cd":
@@ -186,12 +188,14 @@ def main():
         elif cmd.name == "ls":
             file_system.populate_from_ls_output(cmd.data)
 
-    file_system = file_system.cd("/")
-    print("Total size:", file_system.size())
-    print("Size below the 100000 limit:", pt1_size_below_max(file_system))
-
+    return file_system.cd("/")
 
+def solve(text: str) -> int:
+    return pt1_size_below_max(build_file_system(text.splitlines()))
 
+def main():
+    with p.open('r') as file:
+        print("Size below the 100000 limit:", solve(file.read()))
 
 
 if __name__ == "__main__":
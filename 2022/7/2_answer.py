@@ -33,7 +33,7 @@ What is the smallest single directory we can delete to free up enough space?
 from dataclasses import dataclass
 from pathlib import Path
 import re
-from typing import Dict, Iterable, List, Optional, TextIO
+from typing import Dict, Iterable, List, Optional
 p = Path(__file__).with_name("input")
 
 # Vars
@@ -141,7 +141,7 @@ class Directory:
 
 
 # Funcs
-def parse_into_commands_and_data(file: TextIO) -> List[Command]:
+def parse_into_commands_and_data(file: Iterable[str]) -> List[Command]:
     commands: List[Command] = []
     for line in file:
         line = line.strip()
@@ -172,10 +172,12 @@ def pt2_delete_smallest_dir(root: Directory) -> int:
     return min((d for d in root.walk() if d.size() + free_space >= FREE_SPACE_NEEDED), key=Directory.size)
     
 
-def main():
+def build_file_system(lines: Iterable[str]) -> Directory:
+    """
+    Replays the terminal session, returning the root directory
+    """
     file_system = Directory.create_root_node()
-    with p.open('r') as file:
-        commands = parse_into_commands_and_data(file)
+    commands = parse_into_commands_and_data(lines)
 
     for cmd in commands:
         if cmd.name == "cd":
@@ -183,14 +185,14 @@ def main():
         elif cmd.name == "ls":
             file_system.populate_from_ls_output(cmd.data)
 
-    file_system = file_system.cd("/")
-    print("Total size:", file_system.size())
-    smallest_dir = pt2_delete_smallest_dir(file_system)
-    print("Smallest directory that can be deleted:", smallest_dir)
-    print("Size of smallest dir:", smallest_dir.size())
-
+    return file_system.cd("/")
 
+def solve(text: str) -> int:
+    return pt2_delete_smallest_dir(build_file_system(text.splitlines())).size()
 
+def main():
+    with p.open('r') as file:
+        print("Size of smallest dir:", solve(file.read()))
 
 
 if __name__ == "__main__":
@@ -14,91 +14,64 @@ Output:
 How many trees are visible from the outside?
 """
 
+import sys
 from pathlib import Path
-from typing import List
-p = Path(__file__).with_name("input")
-
-# Vars
-
-DIRECTION = {
-    'up': (-1, 0),
-    'down': (1, 0),
-    'left': (0, -1),
-    'right': (0, 1),
-}
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import BORDER, Grid
 
-class VisibleTree:
-    def __init__(self, height: str):
-        self.height = int(height)
-        # Some trees have a height of 0, and they should still be visible from outside the tree if on the edge
-        self.max_direction = {
-            'up': -1,
-            'down': -1,
-            'left': -1,
-            'right': -1,
-        }
+p = Path(__file__).with_name("input")
 
-    def is_visible(self) -> bool:
-        """
-        A tree is 'visible' if it can be viewed from outside the grid.
+# Vars
+...
 
-        This means that from at least one direction (N,E,S,W), all the trees are shorter than itself.
-        """
-        return any(direction < self.height
-                   for direction in self.max_direction.values()
-                   )
 
-    def __repr__(self):
-        return f"T(height={self.height}, {', '.join(f'{a[0]}={b}' for a,b in self.max_direction.items())})"
+# Funcs
+def lines_of_sight(grid: Grid):
+    """
+    Generator.
+    Yields (first index, step) for every row and column, looking in from each edge.
+    e.g. the top row looking left is (index of its right-most tree, -1)
+    """
+    up, right, down, left = grid.orthogonal
+    for row in range(grid.height):
+        yield grid.index(row, 0), right
+        yield grid.index(row, grid.width - 1), left
+    for col in range(grid.width):
+        yield grid.index(0, col), down
+        yield grid.index(grid.height - 1, col), up
 
 
-# Funcs
-def process_grid(grid: List[List[VisibleTree]]) -> None:
+def find_visible_trees(grid: Grid) -> bytearray:
     """
-    Processes the grid in-place, so every tree's largest neighbour is set.
+    Returns a flag for every cell of the grid, set if its tree is visible.
 
-    Logic: You ask your neighbours what the biggest tree on their side is. This height is either
+    Logic: Walk in from every edge, keeping track of the tallest tree so far.
+    Any tree taller than that is visible from that edge.
+    (Walking stops at the border, so there's no bounds checking)
     """
-    # Pass #1, check the top and left.
-    # We update as we go, each tree's maximum from a direction is
-    # based on a previously processed tree's maximum.
-    # Therefore, we can't use down & right, as we read top-left to bottom-right,
-    # and we haven't read them yet.
-    for (i, row) in enumerate(grid):
-        for (j, tree) in enumerate(row):
-            for direction in ("up", "left"):
-                (di, dj) = DIRECTION[direction]
-                ni = i+di
-                nj = j+dj
-                if (0 <= ni < len(grid)) and (0 <= nj < len(row)):
-                    # The tallest tree in any direction is either your neighbour, or their tallest tree in a direction
-                    other_tree = grid[ni][nj]
-                    tree.max_direction[direction] = max(
-                        other_tree.max_direction[direction], other_tree.height)
-    
-    # Pass #2, check the bottom and right.
-    # This time around, we iterate backwards (bottom-right to top-left)
-    for (i, row) in reversed(list(enumerate(grid))):
-        for (j, tree) in reversed(list(enumerate(row))):
-            for direction in ("down", "right"):
-                (di, dj) = DIRECTION[direction]
-                ni = i+di
-                nj = j+dj
-                if (0 <= ni < len(grid)) and (0 <= nj < len(row)):
-                    # The tallest tree in any direction is either your neighbour, or their tallest tree in a direction
-                    other_tree = grid[ni][nj]
-                    tree.max_direction[direction] = max(
-                        other_tree.max_direction[direction], other_tree.height)
+    cells = grid.cells
+    visible = bytearray(len(cells))
+    for index, step in lines_of_sight(grid):
+        # Some trees have a height of 0, and they should still be visible from outside the tree if on the edge
+        tallest = -1
+        while cells[index] != BORDER:
+            if cells[index] > tallest:
+                visible[index] = True
+                tallest = cells[index]
+                if tallest == 9:    # Nothing behind this can be seen
+                    break
+            index += step
+    return visible
+
+
+def solve(text: str) -> int:
+    grid = Grid.parse(text, digits=True)
+    return sum(find_visible_trees(grid))
 
 def main():
     with p.open('r') as file:
-        grid = [[VisibleTree(height) for height in line.strip()]
-                for line in file]
-    
-    process_grid(grid)
-
-    n_visible = sum(tree.is_visible() for row in grid for tree in row)
+        n_visible = solve(file.read())
     print("n_visible:", n_visible)
 
 
@@ -18,7 +18,6 @@ from pathlib import Path
 p = Path(__file__).with_name("test_input")
 
 # Vars
-total = 0
 
 # Funcs
 def extract_number(s: str) -> int:
@@ -32,13 +31,16 @@ def extract_number(s: str) -> int:
     
 
 
+def solve(text: str) -> int:
+    total = 0
+    for line in text.splitlines():
+        total += extract_number(line)
+    return total
+
+
 def main():
-    global total
     with p.open('r') as file:
-        for line in file:
-            calibration_number = extract_number(line)
-            print(calibration_number)
-            total += calibration_number
+        total = solve(file.read())
     
     print("Total:", total)
 
@@ -24,7 +24,6 @@ from operator import lt, gt
 p = Path(__file__).with_name("input")
 
 # Vars
-total = 0
 
 DIGIT_NAMES = [
     ("one",    '1'),
@@ -81,13 +80,16 @@ def extract_number(s: str) -> int:
     
 
 
+def solve(text: str) -> int:
+    total = 0
+    for line in text.splitlines():
+        total += extract_number(line)
+    return total
+
+
 def main():
-    global total
     with p.open('r') as file:
-        for line in file:
-            calibration_number = extract_number(line)
-            print(calibration_number)
-            total += calibration_number
+        total = solve(file.read())
     
     print("Total:", total)
 
@@ -40,18 +40,20 @@ Output:
 """
 
 import dataclasses
+import sys
 from collections import deque
 from pathlib import Path
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import BORDER, Grid
+
 p = Path(__file__).with_name("input")
 
 # Vars
 STARTING_CHAR = 'S'
 
 ## Maps input directions to output directions
-Grid = list[str]
-
 Pos2D = tuple[int, int]
 NORTH: Pos2D    = (-1,0)
 SOUTH: Pos2D    = (1, 0)
@@ -119,15 +121,14 @@ class Route:
         new_i = self.head[0][0] + self.current_direction[0]
         new_j = self.head[0][1] + self.current_direction[1]
         # Bounds check: Ensure we're not lead out of bounds
-        if not( 0 <= new_i < len(grid) and 0 <= new_j < len(grid[new_i]) ):
-            print(f"Reason: {(new_i, new_j)} is out of bounds")
+        # (One step off the grid is its border)
+        if grid[new_i, new_j] == BORDER:
             return False
-        next_pipe = grid[new_i][new_j]
+        next_pipe = chr(grid[new_i, new_j])
 
         # Check if you can reach the pipe from your current direction
         new_direction = PIPE_DIRECTION_MAPPING[next_pipe].get(self.current_direction)
         if new_direction is None:
-            print(f"Reason: Can't enter {next_pipe!r} from {self.current_direction}")
             return False
         
         self.current_direction = new_direction
@@ -139,11 +140,22 @@ class Route:
 
 
 # Funcs
+def find_loop(grid: Grid) -> Route:
+    """
+    Returns the route that loops back around to the starting point
+    """
+    starting_point = find_starting_point(grid, STARTING_CHAR)
+    assert starting_point is not None, f"Character {STARTING_CHAR!r} not in grid"
+    for path in Route.create_starting_positions(starting_point):
+        if run_through_path(path, grid):
+            return path
+    raise ValueError("None of the starting directions form a loop")
+
 def find_starting_point(grid: Grid, needle: str) -> Optional[Pos2D]:
-    for i, line in enumerate(grid):
-        for j, char in enumerate(line):
-            if char == needle:
-                return (i, j)
+    try:
+        return grid.position(grid.find(ord(needle)))
+    except ValueError:
+        return None
 
 def run_through_path(route: Route, grid: Grid) -> bool:
     """
@@ -174,28 +186,20 @@ def render_loop(route: Route):
             print(pos_to_char.get((i,j), '.'), end='')
         print() 
 
+def solve(text: str) -> int:
+    grid = Grid.parse(text)
+    return len(find_loop(grid).path) // 2
+
 
 # =====
 
 def main():
     with p.open('r') as file:
-        grid: Grid = [line.strip() for line in file]
-    starting_point = find_starting_point(grid, STARTING_CHAR)
-    assert starting_point is not None, f"Character {STARTING_CHAR!r} not in grid"
-    print("Starting point:", starting_point)
-    print("\n===\n")
-
-    paths = Route.create_starting_positions(starting_point)
-
-    for path in paths:
-        if run_through_path(path, grid):
-            render_loop(path)
-            print("Took", len(path.path), "steps")
-            print("Furthest point is:", len(path.path) // 2, "steps away")
-            break
-        else:
-            print("Couldn't continue path:", path)
-            print("---")
+        grid = Grid.parse(file.read())
+    loop = find_loop(grid)
+    render_loop(loop)
+    print("Took", len(loop.path), "steps")
+    print("Furthest point is:", len(loop.path) // 2, "steps away")
 
 
 if __name__ == "__main__":
@@ -43,34 +43,33 @@ Output:
   Print the sum of each galaxy pair's distance
 """
 
+import sys
 from itertools import combinations
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import Grid
+
 
 p = Path(__file__).with_name("input")
 
 # Vars
-EMPTY = '.'
-GALAXY = '#'
+GALAXY = ord('#')
 Pos2D = tuple[int, int]
-Grid = list[str]
 
 # Classes
 ...
 
 # Funcs
-def rotate_grid(grid: Grid) -> Grid:
-    return [''.join(column) for column in zip(*grid)]
-
-def cosmic_expansion_1d(grid: Grid) -> Grid:
+def cosmic_expansion_1d(lines: list[bytes]) -> list[bytes]:
     """
     Expands the universe across a single axis.
     Don't forget to rotate and call me again :)
     """
     output = []
-    for line in grid:
+    for line in lines:
         output.append(line)
-        if all(char == EMPTY for char in line):
+        if GALAXY not in line:
             output.append(line)
     return output
 
@@ -79,24 +78,20 @@ def cosmic_expansion(grid: Grid) -> Grid:
     Returns the input grid after "cosmic expansion".
     i.e. any repeated rows & columns are repeated
     """
-    output = cosmic_expansion_1d(grid)
-    # rotate
-    output = rotate_grid(output)
-    output = cosmic_expansion_1d(output)
+    rows = cosmic_expansion_1d(grid.rows())
+    # rotate (the columns of the expanded rows)
+    columns = cosmic_expansion_1d(Grid.from_rows(rows).columns())
     # rotate back
-    return rotate_grid(output)
+    return Grid.from_rows(Grid.from_rows(columns).columns())
 
-def get_all_galaxy_positions(universe: Grid, needle: str = GALAXY) -> list[Pos2D]:
+def get_all_galaxy_positions(universe: Grid, needle: int = GALAXY) -> list[Pos2D]:
     """
     Returns the (i,j) positions of all galaxies in the given universe
     """
-    galaxy_positions = []
-    for i, row in enumerate(universe):
-        for j, char in enumerate(row):
-            if char == needle:
-                galaxy_positions.append((i, j))
-    
-    return galaxy_positions
+    cells = universe.cells
+    return [universe.position(index)
+            for index in universe.indices()
+            if cells[index] == needle]
 
 def manhatten_distance(start: Pos2D, end: Pos2D) -> int:
     """
@@ -108,23 +103,20 @@ def manhatten_distance(start: Pos2D, end: Pos2D) -> int:
     j_dist = abs(start[1] - end[1])
     return i_dist + j_dist
 
-# =====
-
-def main():
-    with p.open('r') as file:
-        grid = [line.strip() for line in file]
-    
+def solve(text: str) -> int:
+    grid = Grid.parse(text)
     expanded_universe = cosmic_expansion(grid)
     all_galaxies = get_all_galaxy_positions(expanded_universe)
-
-    total = sum(
+    return sum(
         manhatten_distance(a, b)
         for a, b in combinations(all_galaxies, 2)
     )
-    
-    print("Sum of all galaxy pair distances:", total)
 
-    
+# =====
+
+def main():
+    with p.open('r') as file:
+        print("Sum of all galaxy pair distances:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
@@ -25,18 +25,20 @@ Output:
   Print the sum of each galaxy pair's distance
 """
 
+import sys
 from itertools import combinations
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import Grid
+
 
 p = Path(__file__).with_name("input")
 
 # Vars
 EXPANSION_SIZE = 1_000_000 - 1
-EMPTY = '.'
-GALAXY = '#'
+GALAXY = ord('#')
 Pos2D = tuple[int, int]
-Grid = list[str]
 
 # Classes
 ...
@@ -52,9 +54,7 @@ def empty_spaces_between(a: int, b: int) -> int:
     return dist
 
 def cosmic_expansion_1d(galaxies: list[Pos2D], index: int) -> list[Pos2D]:
-    print("index = ", index)
     galaxies = sorted(galaxies, key=lambda g: g[index])
-    print(galaxies)
     galaxies.insert(0, (0, 0))      # Insert a galaxy at the very beginning to make
                                     # our calculations easier
     n_empty_spots = 0
@@ -68,7 +68,6 @@ def cosmic_expansion_1d(galaxies: list[Pos2D], index: int) -> list[Pos2D]:
         )
         output.append(new_galaxy)
 
-    print("Out:", output)
     return output
 
 
@@ -82,17 +81,14 @@ def cosmic_expansion(galaxies: list[Pos2D]) -> list[Pos2D]:
     return cosmic_expansion_1d(galaxies_expansion_i_axis, index=1)
 
 
-def get_all_galaxy_positions(universe: Grid, needle: str = GALAXY) -> list[Pos2D]:
+def get_all_galaxy_positions(universe: Grid, needle: int = GALAXY) -> list[Pos2D]:
     """
     Returns the (i,j) positions of all galaxies in the given universe
     """
-    galaxy_positions = []
-    for i, row in enumerate(universe):
-        for j, char in enumerate(row):
-            if char == needle:
-                galaxy_positions.append((i, j))
-    
-    return galaxy_positions
+    cells = universe.cells
+    return [universe.position(index)
+            for index in universe.indices()
+            if cells[index] == needle]
 
 def manhatten_distance(start: Pos2D, end: Pos2D) -> int:
     """
@@ -104,23 +100,20 @@ def manhatten_distance(start: Pos2D, end: Pos2D) -> int:
     j_dist = abs(start[1] - end[1])
     return i_dist + j_dist
 
-# =====
-
-def main():
-    with p.open('r') as file:
-        grid = [line.strip() for line in file]
-    
+def solve(text: str) -> int:
+    grid = Grid.parse(text)
     all_galaxies = get_all_galaxy_positions(grid)
     expanded_universe = cosmic_expansion(all_galaxies)
-
-    total = sum(
+    return sum(
         manhatten_distance(a, b)
         for a, b in combinations(expanded_universe, 2)
     )
-    
-    print("Sum of all galaxy pair distances:", total)
 
-    
+# =====
+
+def main():
+    with p.open('r') as file:
+        print("Sum of all galaxy pair distances:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
@@ -169,21 +169,16 @@ def get_all_valid_combinations(hot_spring: UnknownHotSprings) -> list[str]:
     recursive_get_combination(hot_spring.springs, hot_spring.layout, valid_combinations)
     return valid_combinations
 
+def solve(text: str) -> int:
+    all_springs = [UnknownHotSprings.parse(line) for line in text.splitlines()]
+    return sum(len(get_all_valid_combinations(hot_springs))
+               for hot_springs in all_springs)
+
 # =====
 
 def main():
     with p.open('r') as file:
-        all_springs = [UnknownHotSprings.parse(line) for line in file]
-    
-    total = 0
-    for hot_springs in all_springs:
-        debug_print(hot_springs.layout)
-        all_combinations = get_all_valid_combinations(hot_springs)
-        total += len(all_combinations)
-        debug_print("All combinations:", len(all_combinations), '|', all_combinations)
-        debug_print("=====")
-    
-    print("Total sum of combinations:", total)
+        print("Total sum of combinations:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
@@ -197,19 +197,17 @@ def get_all_valid_combinations(hot_spring: UnknownHotSprings) -> int:
     
     return total_valid_combinations
 
+def solve(text: str) -> int:
+    # ! INCOMPLETE ! - Correct, but far too slow to finish on the real input
+    all_springs = [UnknownHotSprings.parse(line).unfold() for line in text.splitlines()]
+    return sum(get_all_valid_combinations(hot_springs)
+               for hot_springs in all_springs)
+
 # =====
 
 def main():
     with p.open('r') as file:
-        all_springs = [UnknownHotSprings.parse(line).unfold() for line in file]
-    
-    total = 0
-    for i, hot_springs in enumerate(all_springs):
-        print(i)
-        all_combinations = get_all_valid_combinations(hot_springs)
-        total += all_combinations
-    
-    print("Total sum of combinations:", total)
+        print("Total sum of combinations:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
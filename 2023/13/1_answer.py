@@ -13,8 +13,11 @@ Output:
 ...
 """
 
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import Grid
 
 p = Path(__file__).with_name("input")
 
@@ -22,19 +25,17 @@ p = Path(__file__).with_name("input")
 VERTICAL = "VERTICAL"
 HORIZONTAL = "HORIZONTAL"
 
-Grid = list[str]
+Lines = list[bytes]
 
 # Classes
 ...
 
 # Funcs
-def rotate(grid: Grid) -> Grid:
+def find_reflection(grid: Lines) -> int | None:
     """
-    Rotates the given grid
+    Returns the index of the line just before the mirror, if there is one.
+    Pass in the grid's rows for a horizontal mirror, or its columns for a vertical one
     """
-    return list(zip(*grid))
-
-def find_reflection(grid: Grid) -> int | None:
     reflection_index = None
     for i in range(len(grid) - 1):  # minus-one because otherwise our 
         current = grid[i]
@@ -46,7 +47,7 @@ def find_reflection(grid: Grid) -> int | None:
     
     return reflection_index
 
-def is_reflection(grid: Grid, index: int) -> bool:
+def is_reflection(grid: Lines, index: int) -> bool:
     # Iterate forwards and backwards from the split
     back_of_grid = range(index, -1, -1)
     front_of_grid = range(index+1, len(grid), 1)
@@ -62,27 +63,29 @@ def calculate_output(index: int, axis: str) -> int:
     else:
         raise Exception("Unknown axis value:", axis)
 
+def summarize(grid: Grid) -> tuple[int, str, int]:
+    """
+    Returns (the reflection index, its axis, its output value)
+    """
+    axis = HORIZONTAL
+    idx = find_reflection(grid.rows())
+    if idx is None:
+        axis = VERTICAL
+        idx = find_reflection(grid.columns())
+    if idx is None:
+        raise LookupError("Couldn't find reflection point of grid", grid)
+    return idx, axis, calculate_output(idx, axis)
+
+def solve(text: str) -> int:
+    all_grids = [Grid.parse(grid) for grid in text.split("\n\n")]
+    return sum(summarize(grid)[2] for grid in all_grids)
+
 
 # =====
 
 def main():
     with p.open('r') as file:
-        all_grids = [grid.split() for grid in file.read().split("\n\n")]
-    
-    total = 0
-    for grid in all_grids:
-        axis = HORIZONTAL
-        idx = find_reflection(grid)
-        if idx is None:
-            axis = VERTICAL
-            idx = find_reflection(rotate(grid))
-        if idx is None:
-            raise LookupError("Couldn't find reflection point of grid", grid)
-        output = calculate_output(idx, axis)
-        print(idx + 1, axis, "=", output)
-        total += output
-
-    print("Total:", total)
+        print("Total:", solve(file.read()))
 
 
 if __name__ == "__main__":
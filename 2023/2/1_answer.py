@@ -76,17 +76,18 @@ class Game:
                         for view in self.views                  # Ensure every view is valid
                             for (colour, count) in view.items())# Ensure this view is valid
 # Funcs
-...
+def solve(text: str) -> int:
+    total = 0
+    for line in text.splitlines():
+        game = Game.parse(line)
+        if game.is_valid():
+            total += game.id
+    return total
 
 
 def main():
-    total = 0
     with p.open('r') as file:
-        for line in file:
-            game = Game.parse(line)
-            if game.is_valid():
-                total += game.id
-        print("Total:", total)
+        print("Total:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
@@ -69,16 +69,17 @@ class Game:
         )
     
 # Funcs
-...
+def solve(text: str) -> int:
+    total = 0
+    for line in text.splitlines():
+        game = Game.parse(line)
+        total += game.product_of_mins()
+    return total
 
 
 def main():
-    total = 0
     with p.open('r') as file:
-        for line in file:
-            game = Game.parse(line)
-            total += game.product_of_mins()
-        print("Total:", total)
+        print("Total:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
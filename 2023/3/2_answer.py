@@ -22,12 +22,18 @@ Output:
 """
 
 import dataclasses
+import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from aoc.grid import Grid
+
 p = Path(__file__).with_name("input")
 
 # Vars
-GEAR_SYMBOL_CHAR = '*'
+GEAR_SYMBOL_CHAR = ord('*')
+NUMBER_PATTERN = re.compile(rb"\d+")
 
 @dataclasses.dataclass
 class Number:
@@ -37,84 +43,37 @@ class Number:
     end_pos: int
 
 # Funcs
-def extract_nums_from_line(line: str, line_num: int) -> list[Number]:
-    numbers_in_line = []
-
-    current_number_str = ''
-    start_pos = 0
-    is_reading_number = False  # True if we're currently reading a number
-    for i, char in enumerate(line.strip()):
-        is_digit = char.isdigit()
-        if is_reading_number and is_digit:          # Continue reading
-            current_number_str += char
-        elif is_reading_number and not is_digit:    # Reached the end of current number
-            num = Number(
-                num=int(current_number_str),
-                line_num=line_num,
-                start_pos=start_pos,
-                end_pos=i-1
-            )
-            numbers_in_line.append(num)
-            current_number_str = ''
-            is_reading_number = False
-        elif not is_reading_number and is_digit:    # New number, start reading
-            start_pos = i
-            current_number_str += char
-            is_reading_number = True
-        elif not is_reading_number and not is_digit:# Flying over empty space
-            pass
-    
-    # If we were reading a number when we ended, save it
-    if is_reading_number:
-        num = Number(
-            num=int(current_number_str),
-            line_num=line_num,
-            start_pos=start_pos,
-            end_pos=i
-        )
-        numbers_in_line.append(num)
-
-    return numbers_in_line
-
-def is_gear(char: str) -> bool:
+def extract_numbers(grid: Grid) -> list[Number]:
     """
-    Part 2 - We only care about numbers adjacent to gears
+    Returns every number in the grid, with where it is
     """
-    return (char == GEAR_SYMBOL_CHAR)
-
-def is_gear_at_position(grid: list[str], i: int, j: int) -> bool:
-    if 0 <= i < len(grid):
-        if 0 <= j < len(grid[i]):
-            char = grid[i][j]
-            return is_gear(char)
-    return False
+    return [Number(num=int(match[0]), line_num=line_num,
+                   start_pos=match.start(), end_pos=match.end() - 1)
+            for line_num, line in enumerate(grid.rows())
+            for match in NUMBER_PATTERN.finditer(line)]
 
-def number_is_adjacent_to_gear(num: Number, grid: list[str]) -> bool:
-    # We return numbers in the following order:
+def surrounding_cells(num: Number, grid: Grid) -> bytes:
+    """
+    Returns the contents of every cell in the box around the number
+    (including the number itself).
+    The grid's border means this can't go out of bounds,
+    and the border isn't a symbol
+    """
+    # We return the cells in the following order:
     # (Where * is `num`)
-    # 3111114
-    # 7*****8
-    # 5222226
-    
-    # Step 1. Numbers above
-    row = num.line_num - 1
-    for col in range(num.start_pos-1, num.end_pos+1):
-        if is_gear_at_position(grid, row, col):
-            return True
-    # Step 2. Numbers below
-    row = num.line_num + 1
-    for col in range(num.start_pos-1, num.end_pos+1):
-        if is_gear_at_position(grid, row, col):
-            return True
-    # Step 3: Diagonals & sides
-    return (
-        is_gear_at_position(grid, num.line_num-1, num.start_pos-1)    # Top-left
-        or is_gear_at_position(grid, num.line_num-1, num.end_pos+1)   # Top-right
-        or is_gear_at_position(grid, num.line_num+1, num.start_pos-1) # Bottom-left
-        or is_gear_at_position(grid, num.line_num+1, num.end_pos+1)   # Bottom-right
-        or is_gear_at_position(grid, num.line_num, num.start_pos-1)   # Left
-        or is_gear_at_position(grid, num.line_num, num.end_pos+1)     # Right
-    )
+    # 1111111
+    # 2*****2
+    # 3333333
+    start = grid.index(num.line_num - 1, num.start_pos - 1)
+    length = num.end_pos - num.start_pos + 3
+    return b''.join(grid.cells[row_start:row_start + length]
+                    for row_start in range(start, start + 3 * grid.stride, grid.stride))
+
+def number_is_adjacent_to_gear(num: Number, grid: Grid) -> bool:
+    """
+    Part 2 - We only care about numbers adjacent to gears
+    """
+    return GEAR_SYMBOL_CHAR in surrounding_cells(num, grid)
 
 def ranges_overlap(start_a, end_a, start_b, end_b) -> bool:
     return start_a <= end_b and end_a >= start_b
@@ -129,16 +88,11 @@ def find_adjacent_numbers(part_numbers: list[Number], i: int, j: int) -> list[Nu
             ]
 
 
-def main():
-    # We have to read the file multiple times, so save it
-    with p.open('r') as file:
-        grid = [line.rstrip() for line in file]
+def solve(text: str) -> int:
+    grid = Grid.parse(text)
     
     # Extract all numbers from the grid
-    all_numbers: list[Number] = []
-    for line_num, line in enumerate(grid):
-        nums_in_line = extract_nums_from_line(line, line_num)
-        all_numbers.extend(nums_in_line)
+    all_numbers = extract_numbers(grid)
 
     # Only keep the numbers adjacent to gears
     part_numbers = [number
@@ -147,11 +101,9 @@ def main():
                     ]
     
     # Remember all the gear positions
-    gear_positions = [(i, j)
-                      for i, row in enumerate(grid)
-                        for j, char in enumerate(row)
-                      if is_gear(char)]
-    print("Gear positions:", gear_positions)
+    gear_positions = [grid.position(index)
+                      for index in grid.indices()
+                      if grid.cells[index] == GEAR_SYMBOL_CHAR]
 
     # Check the gear ratios, and calculate the total
     total = 0
@@ -160,7 +112,12 @@ def main():
         if len(adjacent_nums) == 2:     # Ratios only work on exactly 2 numbers
             one, two = adjacent_nums
             total += (one.num * two.num)
-    print("Total:", total)
+    return total
+
+
+def main():
+    with p.open('r') as file:
+        print("Total:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
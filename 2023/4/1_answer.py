@@ -55,11 +55,13 @@ def point_value(n_matches: int) -> int:
         return 0
     return 2**(n_matches-1)
 
+def solve(text: str) -> int:
+    cards = [Card.parse(line) for line in text.splitlines()]
+    return sum(card.calc_points() for card in cards)
+
 def main():
     with p.open('r') as file:
-        cards = [Card.parse(line) for line in file]
-    
-    total = sum(card.calc_points() for card in cards)
+        total = solve(file.read())
     print("Total:", total)
 
 if __name__ == "__main__":
@@ -64,23 +64,23 @@ class Card:
     def __hash__(self) -> int:
         return self.id
 # Funcs
-
-
-
-def main():
-    with p.open('r') as file:
-        deck = [Card.parse(line) for line in file]
+def solve(text: str) -> int:
+    deck = [Card.parse(line) for line in text.splitlines()]
     
     # Lets the cards be indexed
     all_cards = {card.id: card for card in deck}
     n_cards_read = 0
     while len(deck) > 0:
         n_cards_read += 1
-        if n_cards_read % 100_000 == 0:
-            print(n_cards_read)
         this_card = deck.pop()
         new_cards = [all_cards[card_id] for card_id in this_card.winning_ticket_ids()]
         deck.extend(new_cards)
+    return n_cards_read
+
+
+def main():
+    with p.open('r') as file:
+        n_cards_read = solve(file.read())
 
     print("Total number of cards read:", n_cards_read)
 
@@ -89,9 +89,8 @@ def calculate_number_of_children(deck: list[Card]) -> dict[int, int]:
     return card_id_to_n_children
 
 
-def main():
-    with p.open('r') as file:
-        deck = [Card.parse(line) for line in file]
+def solve(text: str) -> int:
+    deck = [Card.parse(line) for line in text.splitlines()]
     
     # Lets the cards be indexed
     all_cards = calculate_number_of_children(deck)
@@ -100,6 +99,12 @@ def main():
     n_cards_read = len(deck)
     # Add up the number of children every card has
     n_cards_read += sum(all_cards.values())
+    return n_cards_read
+
+
+def main():
+    with p.open('r') as file:
+        n_cards_read = solve(file.read())
 
     print("Total number of cards read:", n_cards_read)
 
@@ -142,18 +142,22 @@ def follow_the_mapping_chain(
     return value
 
 
-# =====
-
-def main():
+def solve(text: str) -> int:
     # Firstly, parse the file
-    with p.open('r') as file:
-        parsed_file = ParsedFile.parse(file)
+    parsed_file = ParsedFile.parse(text.splitlines())
 
     # Feed every seed through the machine, and get the smallest output
-    smallest_location = min(
+    return min(
         follow_the_mapping_chain(seed, parsed_file.all_mappings, ORDER)
           for seed in parsed_file.seeds
     )
+
+
+# =====
+
+def main():
+    with p.open('r') as file:
+        smallest_location = solve(file.read())
     print("Smallest location:", smallest_location)
 
 if __name__ == "__main__":
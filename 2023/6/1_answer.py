@@ -76,6 +76,12 @@ def number_of_ways_to_win(race: RaceData) -> int:
     lower_end = math.ceil(mid_time-leeway)
     upper_end = math.floor(mid_time+leeway)
     return upper_end-lower_end + 1  # +1 because upper_end is inclusive
+
+def solve(text: str) -> int:
+    product = 1
+    for race in parse_file(text):
+        product *= number_of_ways_to_win(race)
+    return product
     
 
 
@@ -83,16 +89,7 @@ def number_of_ways_to_win(race: RaceData) -> int:
 
 def main():
     with p.open('r') as file:
-        all_races = parse_file(file.read())
-    
-    product = 1
-    for race in all_races:
-        ret = number_of_ways_to_win(race)
-        print(ret)
-        product *= ret
-    
-    print("Product:", product)
-    
+        print("Product:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
@@ -79,6 +79,9 @@ def number_of_ways_to_win(race: RaceData) -> int:
     lower_end = math.ceil(mid_time-leeway)
     upper_end = math.floor(mid_time+leeway)
     return upper_end-lower_end + 1  # +1 because upper_end is inclusive
+
+def solve(text: str) -> int:
+    return number_of_ways_to_win(parse_file(text))
     
 
 
@@ -86,13 +89,7 @@ def number_of_ways_to_win(race: RaceData) -> int:
 
 def main():
     with p.open('r') as file:
-        race = parse_file(file.read())
-    
-    n_ways = number_of_ways_to_win(race)
-    print(n_ways)
-    
-    print("Ways to win:", n_ways)
-    
+        print("Ways to win:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
@@ -138,18 +138,19 @@ class Play:
         )
 
 # Funcs
-...
+def solve(text: str) -> int:
+    all_plays = sorted(Play.parse(line) for line in text.splitlines())
+    return sum(
+        play.bet * rank
+        for rank, play in enumerate(all_plays, start=1)
+    )
 
 
 # =====
 
 def main():
     with p.open('r') as file:
-        all_plays = sorted(Play.parse(line) for line in file)
-    total_winnings = sum(
-        play.bet * rank
-        for rank, play in enumerate(all_plays, start=1)
-    )
+        total_winnings = solve(file.read())
     print(total_winnings)
 
 if __name__ == "__main__":
@@ -59,14 +59,8 @@ class ParsedFile:
 
 
 # Funcs
-...
-
-
-# =====
-
-def main():
-    with p.open('r') as file:
-        parsed_file = ParsedFile.parse(file)
+def solve(text: str) -> int:
+    parsed_file = ParsedFile.parse(iter(text.splitlines()))
     
     graph = parsed_file.nodes
     n_steps_taken = 0
@@ -76,6 +70,14 @@ def main():
             break
         current_node = graph[current_node][DIRECTION[direction]]
         n_steps_taken += 1
+    return n_steps_taken
+
+
+# =====
+
+def main():
+    with p.open('r') as file:
+        n_steps_taken = solve(file.read())
     
     print("Number of steps to reach 'ZZZ':", n_steps_taken)
 
@@ -34,6 +34,7 @@ from itertools import cycle
 p = Path(__file__).with_name("input")
 
 # Vars
+DEBUG = False   # Prints the look at the data that led to using the lcm
 NODE_REGEX = r"(...) = \((...), (...)\)"
 GOAL = "ZZZ"     
 DIRECTION = {
@@ -71,6 +72,28 @@ def is_start(node: str) -> bool:
 def is_goal(node: str) -> bool:
     return node.endswith('Z')
 
+def steps_per_node(parsed_file: ParsedFile) -> list[int]:
+    """
+    Returns how many steps each starting node takes to reach its goal
+    """
+    graph = parsed_file.nodes
+    nodes = list(filter(is_start, graph.keys()))    # We start at every node ending in 'A'
+    n_steps_per_node = []
+    for node in nodes:
+        n_steps_taken = 0
+        for direction in cycle(parsed_file.instructions):
+            if is_goal(node): # Stop once we've run out of nodes
+                n_steps_per_node.append(n_steps_taken)
+                break
+            else:
+                n_steps_taken += 1
+                node = graph[node][DIRECTION[direction]]
+    return n_steps_per_node
+
+def solve(text: str) -> int:
+    parsed_file = ParsedFile.parse(iter(text.splitlines()))
+    return math.lcm(*steps_per_node(parsed_file))
+
 
 # =====
 
@@ -102,28 +125,11 @@ def testing_the_data(parsed_file):
 
 def main():
     with p.open('r') as file:
-        parsed_file = ParsedFile.parse(file)
-    
-    testing_the_data(parsed_file)
-    
-    graph = parsed_file.nodes
-    nodes = list(filter(is_start, graph.keys()))    # We start at every node ending in 'A'
-    print("Starting nodes:", nodes)
-    n_steps_per_node = []
-    for i, node in enumerate(nodes):
-        n_steps_taken = 0
-        for direction in cycle(parsed_file.instructions):
-            if is_goal(node): # Stop once we've run out of nodes
-                print(f"n_steps_per_node[{i}] = {n_steps_taken}")
-                n_steps_per_node.append(n_steps_taken)
-                break
-            else:
-                n_steps_taken += 1
-                node = graph[node][DIRECTION[direction]]
-    
-    print(f"They all terminate after (lcm({n_steps_per_node}) = {math.lcm(*n_steps_per_node)}) runs")
-        
-
+        text = file.read()
+    if DEBUG:
+        testing_the_data(ParsedFile.parse(iter(text.splitlines())))
+    n_steps = solve(text)
+    print(f"They all terminate after {n_steps} steps")
 
 
 if __name__ == "__main__":
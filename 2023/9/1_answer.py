@@ -63,29 +63,22 @@ def predict_next_number(seq: list[int]) -> int:
     Recursively tries to guess the next number
     """
     # Base Case
-    print(seq)
     if all(num == 0 for num in seq):
         return 0
     # Calculate the differences
     differences = calculate_difference(seq)
     return seq[-1] + predict_next_number(differences)
 
+def solve(text: str) -> int:
+    parsed_file = ParsedFile.parse(text.splitlines())
+    return sum(predict_next_number(line) for line in parsed_file.sequences)
+
 
 # =====
 
 def main():
     with p.open('r') as file:
-        parsed_file = ParsedFile.parse(file)
-
-    total = 0
-    for line in parsed_file.sequences:
-        val = predict_next_number(line)
-        total += val
-        print("Next value:", line, "=>", val)
-    
-    print()
-    print("Total:", total)
-    
+        print("Total:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
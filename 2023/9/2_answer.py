@@ -65,29 +65,22 @@ def predict_previous_number(seq: list[int]) -> int:
     Recursively tries to guess the preceeding number
     """
     # Base Case
-    print(seq)
     if all(num == 0 for num in seq):
         return 0
     # Calculate the differences
     differences = calculate_difference(seq)
     return seq[0] - predict_previous_number(differences)
 
+def solve(text: str) -> int:
+    parsed_file = ParsedFile.parse(text.splitlines())
+    return sum(predict_previous_number(line) for line in parsed_file.sequences)
+
 
 # =====
 
 def main():
     with p.open('r') as file:
-        parsed_file = ParsedFile.parse(file)
-
-    total = 0
-    for line in parsed_file.sequences:
-        val = predict_previous_number(line)
-        total += val
-        print("Previous value:", val, "=>", line)
-    
-    print()
-    print("Total:", total)
-    
+        print("Total:", solve(file.read()))
 
 if __name__ == "__main__":
     main()
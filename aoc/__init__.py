@@ -0,0 +1,5 @@
+"""
+Shared tooling for running and benchmarking the Python solutions.
+
+Run `python -m aoc --help` from the repository root for usage.
+"""
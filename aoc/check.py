@@ -0,0 +1,152 @@
+"""
+Answer & time budget checks
+
+Python 3.9+
+
+`answers.json` (in the repository root) records the known-good answer of every
+part, for both `input` and `test_input`, along with a time budget per day:
+  {
+    "budgets": {"2021/15": 25.0, ...},                          # seconds, per part
+    "answers": {"2021/15/2": {"input": "...", "test_input": "315"}, ...},
+    "known_failures": {"2023/5/2/": "Not solved yet", ...}
+  }
+Parts are keyed by year/day/part (0 for legacy files that solve both parts),
+so the extra attempts (e.g. 2_answer_optimized.py) are held to the same answer.
+Known failures are keyed by the solution's own key (see `Solution.key`),
+optionally followed by `:input` or `:test_input` to only cover that input,
+and are reported but don't fail the check.
+
+`python -m aoc --check` fails if any part gives a different answer, errors,
+or runs over its day's budget. Parts without a recorded answer are only timed.
+`--record` fills in the answers (and budgets) that are missing.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from aoc.solutions import REPO_ROOT
+
+if TYPE_CHECKING:
+    from aoc.runner import RunResult
+
+# Vars
+MANIFEST_PATH = REPO_ROOT / "answers.json"
+DEFAULT_BUDGET = 10.0       # seconds, for days that don't have their own
+BUDGET_HEADROOM = 3         # Recorded budgets are this many times the measured time...
+MIN_BUDGET = 1.0            # ...but never less than this, so noise doesn't fail the check
+
+
+# Funcs
+def answer_key(result: 'RunResult') -> str:
+    return f"{result.year}/{result.day}/{result.part or 0}"
+
+
+def day_key(result: 'RunResult') -> str:
+    return f"{result.year}/{result.day}"
+
+
+def known_failure(result: 'RunResult', manifest: dict, input_name: str) -> Optional[str]:
+    """
+    Returns why the result is expected to fail, if it is
+    """
+    known = manifest.get("known_failures", {})
+    return known.get(result.key, known.get(f"{result.key}:{input_name}"))
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict:
+    if not path.exists():
+        return {"budgets": {}, "answers": {}}
+    with path.open('r') as file:
+        return json.load(file)
+
+
+def save_manifest(manifest: dict, path: Path = MANIFEST_PATH):
+    with path.open('w') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def check_result(result: 'RunResult', manifest: dict, input_name: str) -> Optional[str]:
+    """
+    Returns why the result fails its checks, or None if it passes
+    """
+    if result.status == "no-input" or known_failure(result, manifest, input_name):
+        return None
+    if result.status != "ok":
+        return f"{result.status}: {result.error or ''}".rstrip(": ")
+
+    expected = manifest["answers"].get(answer_key(result), {}).get(input_name)
+    if expected is not None and result.answer != expected:
+        return f"wrong answer: got {result.answer!r}, expected {expected!r}"
+
+    budget = manifest["budgets"].get(day_key(result), DEFAULT_BUDGET)
+    if result.wall_time > budget:
+        return f"too slow: {result.wall_time:.2f}s, budget is {budget:.2f}s"
+    return None
+
+
+def check(results: list['RunResult'], manifest: dict, input_name: str) -> list[tuple['RunResult', str]]:
+    """
+    Returns every result that failed its checks, with the reason why
+    """
+    failures = []
+    for result in results:
+        reason = check_result(result, manifest, input_name)
+        if reason is not None:
+            failures.append((result, reason))
+    return failures
+
+
+def render_check(results: list['RunResult'], failures: list[tuple['RunResult', str]],
+                 manifest: dict, input_name: str) -> str:
+    """
+    Summarises the check. Known failures are skipped, and results without a
+    recorded answer are unchecked, so neither counts as passed
+    """
+    skipped = [r for r in results
+               if r.status == "no-input" or known_failure(r, manifest, input_name)]
+    failed = {r.name for r, _ in failures}
+    unchecked = [r.name for r in results
+                 if r.status == "ok" and r.name not in failed
+                 and not known_failure(r, manifest, input_name)
+                 and input_name not in manifest["answers"].get(answer_key(r), {})]
+    n_passed = len(results) - len(failures) - len(skipped) - len(unchecked)
+    lines = [f"  {r.name}: {reason}" for r, reason in failures]
+    lines += [f"  {r.name}: skipped, {known_failure(r, manifest, input_name) or 'no input'}"
+              for r in skipped]
+    if unchecked:
+        lines.append(f"No recorded answer for: {', '.join(unchecked)}")
+    counts = [f"{n_passed} passed"]
+    for n, label in ((len(failures), "failed"), (len(skipped), "skipped"), (len(unchecked), "unchecked")):
+        if n:
+            counts.append(f"{n} {label}")
+    verdict = "FAILED" if failures else "PASSED"
+    summary = f"Check {verdict} ({', '.join(counts)}, out of {len(results)})"
+    return "\n".join([summary, *lines])
+
+
+def record(results: list['RunResult'], manifest: dict, input_name: str) -> int:
+    """
+    Adds the answers (and day budgets) that aren't in the manifest yet.
+    Only the main attempts are recorded, and only if they succeeded.
+    Returns how many answers were added
+    """
+    added = 0
+    slowest = {}
+    for result in results:
+        if result.status != "ok" or result.variant:
+            continue
+        answers = manifest["answers"].setdefault(answer_key(result), {})
+        if input_name not in answers:
+            answers[input_name] = result.answer
+            added += 1
+        slowest[day_key(result)] = max(slowest.get(day_key(result), 0), result.wall_time)
+
+    # Budgets are only worth setting from the real input
+    if input_name == "input":
+        for day, wall_time in slowest.items():
+            if day not in manifest["budgets"]:
+                manifest["budgets"][day] = float(max(MIN_BUDGET, math.ceil(wall_time * BUDGET_HEADROOM)))
+    return added
@@ -0,0 +1,142 @@
+"""
+2D grids, stored flat
+
+Python 3.9+
+
+A `Grid` keeps every cell in one `bytearray`, row by row, surrounded by a
+one-cell border of `BORDER` bytes:
+    ░░░░░
+    ░abc░       "abc\\ndef" is stored as  ░░░░░ ░abc░ ░def░ ░░░░░
+    ░def░       with a stride (stored row length) of width + 2
+    ░░░░░
+Cells are addressed by a single index, and the neighbours of any cell in the
+grid are `index + offset` for each of `grid.orthogonal` (N, E, S, W) or
+`grid.adjacent` (all 8). Thanks to the border, those never run off the grid,
+so instead of bounds checks, neighbours are skipped if they're `BORDER`
+(which, at 0xFF, is neither ASCII nor a digit's value).
+
+Character grids keep their ASCII bytes (compare against e.g. `ord('#')`),
+while `digits=True` stores each digit as its value (0-9).
+"""
+
+from typing import Iterable, Iterator, Union
+
+# Vars
+BORDER = 0xFF
+DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+DIGIT_CHARS = bytes.maketrans(bytes(range(10)), b"0123456789")
+
+
+# Classes
+class Grid:
+    def __init__(self, cells: bytearray, width: int, height: int, digits: bool = False):
+        """
+        `cells` must already be padded, see `Grid.from_rows()`
+        """
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.digits = digits
+        self.stride = stride = width + 2
+        self.orthogonal = (-stride, 1, stride, -1)
+        self.diagonal = (-stride - 1, -stride + 1, stride + 1, stride - 1)
+        self.adjacent = self.orthogonal + self.diagonal
+
+    @staticmethod
+    def from_rows(rows: Iterable[bytes], digits: bool = False) -> 'Grid':
+        """
+        Builds a grid from its rows, which must all be the same length.
+        With `digits`, the rows are ASCII digits, and are stored as their values
+        """
+        rows = list(rows)
+        width = len(rows[0])
+        border = bytes((BORDER,))
+        cells = bytearray(border * (width + 3))     # Top border, and the left of row 0
+        cells += (border * 2).join(rows)            # Right of row i, left of row i+1
+        cells += border * (width + 3)               # Right of the last row, and the bottom border
+        if digits:
+            cells = cells.translate(DIGIT_VALUES)
+        return Grid(cells, width, len(rows), digits)
+
+    @staticmethod
+    def parse(text: Union[str, bytes], digits: bool = False) -> 'Grid':
+        """
+        Parses a grid from the puzzle input, one row per line
+        """
+        if isinstance(text, str):
+            text = text.encode()
+        return Grid.from_rows(text.split(), digits)
+
+    def copy(self) -> 'Grid':
+        return Grid(self.cells[:], self.width, self.height, self.digits)
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """
+        The inverse of `index()`, returns (row, col)
+        """
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def __getitem__(self, pos: tuple[int, int]) -> int:
+        """
+        grid[row, col]. Positions just outside the grid return BORDER
+        """
+        row, col = pos
+        return self.cells[(row + 1) * self.stride + col + 1]
+
+    def __setitem__(self, pos: tuple[int, int], value: int):
+        row, col = pos
+        self.cells[(row + 1) * self.stride + col + 1] = value
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def indices(self) -> Iterator[int]:
+        """
+        Every index inside the grid (i.e. not on the border), row by row
+        """
+        stride = self.stride
+        for start in range(stride + 1, stride * (self.height + 1), stride):
+            yield from range(start, start + self.width)
+
+    def neighbours(self, index: int, diagonal: bool = False) -> list[int]:
+        """
+        The indices of the cells around `index` that are inside the grid.
+        (Hot loops are better off using the offsets and checking for BORDER directly)
+        """
+        cells = self.cells
+        offsets = self.adjacent if diagonal else self.orthogonal
+        return [index + offset for offset in offsets if cells[index + offset] != BORDER]
+
+    def find(self, value: int) -> int:
+        """
+        Returns the index of the first cell holding `value`.
+        Raises ValueError if there isn't one
+        """
+        return self.cells.index(value)
+
+    def row(self, row: int) -> bytes:
+        start = (row + 1) * self.stride + 1
+        return bytes(self.cells[start:start + self.width])
+
+    def column(self, col: int) -> bytes:
+        start = self.stride + col + 1
+        return bytes(self.cells[start:start + self.height * self.stride:self.stride])
+
+    def rows(self) -> list[bytes]:
+        return [self.row(i) for i in range(self.height)]
+
+    def columns(self) -> list[bytes]:
+        return [self.column(j) for j in range(self.width)]
+
+    def __str__(self) -> str:
+        rows = self.rows()
+        if self.digits:
+            rows = [row.translate(DIGIT_CHARS) for row in rows]
+        return '\n'.join(row.decode('latin-1') for row in rows)
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self.width}, height={self.height}, digits={self.digits})"
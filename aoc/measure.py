@@ -0,0 +1,111 @@
+"""
+Measures a single solution, inside its own interpreter.
+
+Python 3.9+
+
+This is the child half of the runner, and isn't meant to be run by hand:
+  python -m aoc.measure <script> <input_file> [--repeat N] [--no-tracemalloc]
+
+Every solution exposes `solve(text) -> answer`, so the script is imported
+(without running its `main()`), the input is read once, and `solve` is timed
+directly. A single line of JSON describing the run is printed to stdout:
+  - answer:           What `solve` returned, as a string
+  - wall_time:        Seconds spent in `solve` (the best of `runs` calls)
+  - runs:             How many timed calls were made
+  - peak_rss:         Peak resident set size of this process, in bytes
+  - tracemalloc_peak: Peak traced memory, in bytes, from a separate traced call
+  - error:            The exception, if the solution raised one
+"""
+
+import argparse
+import json
+import runpy
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+# Vars
+SOLVE_NAME = "solve"
+
+
+# Funcs
+def load_solver(script: Path) -> Callable[[str], object]:
+    """
+    Imports the script (without triggering its `__main__` block),
+    and returns its `solve` function
+    """
+    namespace = runpy.run_path(str(script), run_name=f"aoc_solution_{script.stem}")
+    solve = namespace.get(SOLVE_NAME)
+    if not callable(solve):
+        raise AttributeError(f"{script.name} has no {SOLVE_NAME}(text) function")
+    return solve
+
+
+def peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def measure(script: Path, input_path: Path, repeat: int = 1, trace: bool = True) -> dict:
+    result = {
+        "answer": None,
+        "wall_time": None,
+        "runs": None,
+        "peak_rss": None,
+        "tracemalloc_peak": None,
+        "error": None,
+    }
+    try:
+        solve = load_solver(script)
+        text = input_path.read_text()
+
+        answer = None
+        def run():
+            nonlocal answer
+            answer = solve(text)
+
+        # Each call is timed on its own, and the fastest is kept,
+        # as the slower ones are just noise from the rest of the machine
+        timings = timeit.repeat(run, number=1, repeat=repeat)
+        result["wall_time"] = min(timings)
+        result["runs"] = len(timings)
+        result["answer"] = str(answer)
+        result["peak_rss"] = peak_rss()
+        # tracemalloc slows everything down, so it gets its own call
+        if trace:
+            tracemalloc.start()
+            solve(text)
+            result["tracemalloc_peak"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+# =====
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("script", type=Path)
+    parser.add_argument("input", type=Path)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-tracemalloc", action="store_true")
+    args = parser.parse_args()
+
+    result = measure(args.script.resolve(), args.input.resolve(),
+                     repeat=max(1, args.repeat), trace=not args.no_tracemalloc)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
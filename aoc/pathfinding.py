@@ -0,0 +1,134 @@
+"""
+Shortest paths (Dijkstra & A*)
+
+Python 3.9+
+
+Nodes are plain ints (e.g. a `Grid` index), so the search only
+needs flat lists for its state:
+  - dist[node]:   The cheapest known cost to reach the node
+  - parent[node]: The node it was reached from, for rebuilding the path afterwards
+and the heap only holds `(priority, node)` tuples. Stale heap entries are
+skipped when popped, by checking them against `dist`, instead of being removed.
+
+Two entry points:
+  - shortest_path(): Any graph, given as a `neighbours(node) -> (next, cost)...` function
+  - grid_shortest_path(): A `Grid` of entry costs, with the neighbour
+        lookups inlined (several times faster than the generic version)
+Both can run as A* when given a heuristic, which must never overestimate.
+"""
+
+import dataclasses
+from heapq import heappop, heappush
+from typing import Callable, Iterable, Optional
+
+from aoc.grid import BORDER, Grid
+
+# Vars
+UNREACHED = -1          # parent[] of nodes that were never reached (and of the start)
+INFINITY = float('inf')
+
+
+# Classes
+@dataclasses.dataclass
+class SearchResult:
+    start: int
+    goal: int
+    cost: int
+    parent: list[int] = dataclasses.field(repr=False)
+
+    def path(self) -> list[int]:
+        """
+        Returns every node on the path, from the start to the goal (inclusive)
+        """
+        path = [self.goal]
+        node = self.goal
+        while node != self.start:
+            node = self.parent[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+
+# Funcs
+def shortest_path(n_nodes: int, start: int, goal: int,
+                  neighbours: Callable[[int], Iterable[tuple[int, int]]],
+                  heuristic: Optional[Callable[[int], int]] = None) -> SearchResult:
+    """
+    Finds the cheapest path from `start` to `goal`, for nodes `0..n_nodes-1`.
+    `neighbours(node)` yields `(next_node, step_cost)` pairs, and `heuristic(node)`,
+    if given, estimates the remaining cost to the goal (turning this into A*).
+    Raises ValueError if the goal can't be reached
+    """
+    dist = [INFINITY] * n_nodes
+    parent = [UNREACHED] * n_nodes
+    dist[start] = 0
+    frontier = [(heuristic(start) if heuristic else 0, start)]
+    while frontier:
+        priority, node = heappop(frontier)
+        cost = dist[node]
+        if node == goal:
+            return SearchResult(start, goal, cost, parent)
+        if priority > cost + (heuristic(node) if heuristic else 0):
+            continue    # Stale, the node was reached more cheaply since
+        for next_node, step in neighbours(node):
+            new_cost = cost + step
+            if new_cost < dist[next_node]:
+                dist[next_node] = new_cost
+                parent[next_node] = node
+                priority = new_cost + heuristic(next_node) if heuristic else new_cost
+                heappush(frontier, (priority, next_node))
+    raise ValueError("No path found")
+
+
+def grid_shortest_path(grid: Grid, start: Optional[int] = None, goal: Optional[int] = None,
+                       astar: bool = False) -> SearchResult:
+    """
+    Finds the cheapest path across a grid (see `aoc.grid`), moving up/down/left/right.
+    Entering a cell costs its value (leaving the start is free).
+    The start and goal are grid indices, and default to the top-left and
+    bottom-right corners.
+
+    With `astar`, the Manhattan distance to the goal is used as the heuristic,
+    which is only admissible when every cost is at least 1.
+    Raises ValueError if the goal can't be reached
+    """
+    costs = grid.cells
+    stride = grid.stride
+    offsets = grid.orthogonal
+    if start is None:
+        start = grid.index(0, 0)
+    if goal is None:
+        goal = grid.index(grid.height - 1, grid.width - 1)
+    goal_row, goal_col = divmod(goal, stride)
+
+    dist = [INFINITY] * len(costs)
+    parent = [UNREACHED] * len(costs)
+    dist[start] = 0
+    frontier = [(0, start)]
+    while frontier:
+        priority, node = heappop(frontier)
+        cost = dist[node]
+        if node == goal:
+            return SearchResult(start, goal, cost, parent)
+        if astar:
+            row, col = divmod(node, stride)
+            if priority > cost + abs(goal_row - row) + abs(goal_col - col):
+                continue    # Stale, the node was reached more cheaply since
+        elif priority > cost:
+            continue
+
+        for offset in offsets:
+            next_node = node + offset
+            step = costs[next_node]
+            if step == BORDER:
+                continue
+            new_cost = cost + step
+            if new_cost < dist[next_node]:
+                dist[next_node] = new_cost
+                parent[next_node] = node
+                if astar:
+                    row, col = divmod(next_node, stride)
+                    heappush(frontier, (new_cost + abs(goal_row - row) + abs(goal_col - col), next_node))
+                else:
+                    heappush(frontier, (new_cost, next_node))
+    raise ValueError("No path found")
@@ -0,0 +1,325 @@
+"""
+Solution runner & benchmarker
+
+Python 3.9+
+
+Runs every solution (see `aoc.solutions`) against its `input` or `test_input`,
+each in a fresh interpreter, and reports per part:
+  - Wall time         (time spent in `solve(text)`, the best of `--repeat` calls)
+  - Peak RSS          (peak resident memory of the solution's process)
+  - tracemalloc peak  (peak memory allocated by Python objects)
+as a table, and optionally as JSON.
+
+Usage (from the repository root):
+  python -m aoc                           # Everything, against `input`
+  python -m aoc --year 2021 --day 15      # Filter by year/day/part
+  python -m aoc --test                    # Against `test_input`
+  python -m aoc --repeat 20               # Best-of-20 timings, for the quick solutions
+  python -m aoc --jobs 0                  # In parallel, one worker per core
+  python -m aoc --json results.json       # Save the results as JSON ('-' for stdout)
+  python -m aoc --baseline results.json   # Compare timings against a previous run
+  python -m aoc --check                   # Verify the answers and time budgets (see `aoc.check`)
+
+In parallel, the slowest parts are started first, going by the timings of the
+previous run (kept in `.aoc-timings.json`), so one slow day doesn't end up
+holding the whole run back. Timings taken side by side are noisier,
+so stick to serial runs when comparing against a baseline.
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+from aoc import check
+from aoc.solutions import REPO_ROOT, Solution, discover, select
+
+# Vars
+DEFAULT_TIMEOUT = 60.0      # seconds
+TIMINGS_PATH = REPO_ROOT / ".aoc-timings.json"
+
+
+# Classes
+@dataclasses.dataclass
+class RunResult:
+    name: str
+    key: str
+    year: int
+    day: int
+    part: Optional[int]
+    variant: str
+    path: str
+    input: str
+    status: str             # "ok", "error", "timeout", or "no-input"
+    answer: Optional[str] = None
+    wall_time: Optional[float] = None       # seconds
+    runs: Optional[int] = None              # How many timed calls wall_time is the best of
+    peak_rss: Optional[int] = None          # bytes
+    tracemalloc_peak: Optional[int] = None  # bytes
+    error: Optional[str] = None
+
+    @staticmethod
+    def for_solution(solution: Solution, input_path: Path, status: str, **kwargs) -> 'RunResult':
+        return RunResult(
+            name=solution.name,
+            key=solution.key,
+            year=solution.year,
+            day=solution.day,
+            part=solution.part,
+            variant=solution.variant,
+            path=solution.path.relative_to(REPO_ROOT).as_posix(),
+            input=input_path.name,
+            status=status,
+            **kwargs,
+        )
+
+
+# Funcs
+def run_solution(solution: Solution, test: bool = False,
+                 timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 trace: bool = True, repeat: int = 1) -> RunResult:
+    """
+    Runs a single solution in a child interpreter, and collects its measurements
+    """
+    input_path = solution.input_path(test)
+    if not input_path.exists():
+        return RunResult.for_solution(solution, input_path, "no-input")
+
+    cmd = [sys.executable, "-m", "aoc.measure", str(solution.path), str(input_path),
+           "--repeat", str(repeat)]
+    if not trace:
+        cmd.append("--no-tracemalloc")
+    try:
+        proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return RunResult.for_solution(solution, input_path, "timeout", wall_time=timeout)
+
+    try:
+        measured = json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError):
+        # The child itself fell over, so the reason is in stderr
+        stderr = proc.stderr.strip().splitlines()
+        error = stderr[-1] if stderr else f"exit code {proc.returncode}"
+        return RunResult.for_solution(solution, input_path, "error", error=error)
+
+    status = "ok" if measured["error"] is None else "error"
+    return RunResult.for_solution(solution, input_path, status, **measured)
+
+
+def load_timings(path: Path = TIMINGS_PATH) -> dict[str, float]:
+    """
+    Returns how long each part took last time it was run, by key
+    """
+    try:
+        with path.open('r') as file:
+            return json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(results: list[RunResult], path: Path = TIMINGS_PATH):
+    """
+    Merges this run's timings into the saved ones. Timeouts are saved as the
+    timeout, so they're still scheduled first next time
+    """
+    timings = load_timings(path)
+    for r in results:
+        if r.wall_time is not None:
+            timings[r.key] = r.wall_time
+    with path.open('w') as file:
+        json.dump(timings, file, indent=2, sort_keys=True)
+
+
+def longest_first(solutions: list[Solution], timings: dict[str, float]) -> list[Solution]:
+    """
+    Orders the solutions by their expected runtime, slowest first.
+    Parts that have never been timed could be anything, so they go first too
+    """
+    return sorted(solutions, key=lambda s: timings.get(s.key, float('inf')), reverse=True)
+
+
+def run_all(solutions: list[Solution], jobs: int = 1, **kwargs) -> list[RunResult]:
+    """
+    Runs every solution, either one after the other or across `jobs` worker
+    processes. The results are always in the same order as `solutions`
+    """
+    if jobs <= 1:
+        results = []
+        for solution in solutions:
+            print(f"Running {solution.name}...", file=sys.stderr)
+            results.append(run_solution(solution, **kwargs))
+        return results
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_solution, solution, **kwargs): solution
+                   for solution in longest_first(solutions, load_timings())}
+        for future in as_completed(futures):
+            solution = futures[future]
+            results[solution] = future.result()
+            print(f"Finished {solution.name} ({results[solution].status}) "
+                  f"[{len(results)}/{len(solutions)}]", file=sys.stderr)
+    return [results[solution] for solution in solutions]
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds*1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_bytes(n_bytes: Optional[int]) -> str:
+    if n_bytes is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if n_bytes < 1024:
+            return f"{n_bytes:.0f}{unit}" if unit == "B" else f"{n_bytes:.1f}{unit}"
+        n_bytes /= 1024
+    return f"{n_bytes:.1f}GiB"
+
+
+def load_baseline(path: Path) -> dict[tuple[str, str], float]:
+    """
+    Reads a previous `--json` dump, returning each part's wall time
+    """
+    with path.open('r') as file:
+        data = json.load(file)
+    return {(r["key"], r["input"]): r["wall_time"]
+            for r in data["results"]
+            if r["status"] == "ok"}
+
+
+def render_table(results: list[RunResult], baseline: Optional[dict] = None) -> str:
+    total_time = sum(r.wall_time or 0 for r in results)
+    headers = ["Solution", "Status", "Time", "% total", "Peak RSS", "Traced peak", "Answer"]
+    if baseline is not None:
+        headers.insert(4, "vs. baseline")
+
+    rows = []
+    for r in results:
+        share = f"{100 * r.wall_time / total_time:.1f}%" if r.wall_time and total_time else "-"
+        answer = r.answer if r.status == "ok" else (r.error or "")
+        if answer:
+            answer = answer.replace("\n", "\\n")    # e.g. answers drawn as ASCII art
+        if answer and len(answer) > 40:
+            answer = answer[:37] + "..."
+        row = [r.name, r.status, format_seconds(r.wall_time), share,
+               format_bytes(r.peak_rss), format_bytes(r.tracemalloc_peak), answer or ""]
+        if baseline is not None:
+            previous = baseline.get((r.key, r.input))
+            if previous and r.wall_time and r.status == "ok":
+                row.insert(4, f"{r.wall_time / previous:.2f}x")
+            else:
+                row.insert(4, "-")
+        rows.append(row)
+
+    footer = ["Total", f"{sum(r.status == 'ok' for r in results)}/{len(results)} ok",
+              format_seconds(total_time), "100%", "", "", ""]
+    if baseline is not None:
+        footer.insert(4, "")
+
+    widths = [max(len(str(row[i])) for row in [headers, *rows, footer])
+              for i in range(len(headers))]
+    def fmt(row):
+        return "  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)).rstrip()
+    separator = "  ".join('-' * width for width in widths)
+    return "\n".join([fmt(headers), separator, *map(fmt, rows), separator, fmt(footer)])
+
+
+def render_failures(results: list[RunResult]) -> str:
+    """
+    Lists every part that didn't pass, with its full error
+    """
+    lines = [f"  {r.name}: {r.status}" + (f" - {r.error}" if r.error else "")
+             for r in results if r.status != "ok"]
+    if not lines:
+        return "All passed"
+    return "\n".join([f"{len(lines)} didn't pass:", *lines])
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Runs and benchmarks the solutions")
+    parser.add_argument("--year", type=int, nargs='+', help="Only run these years")
+    parser.add_argument("--day", type=int, nargs='+', help="Only run these days")
+    parser.add_argument("--part", type=int, nargs='+', choices=(1, 2), help="Only run these parts")
+    parser.add_argument("--no-variants", action="store_true",
+                        help="Skip the extra attempts (e.g. 2_answer_optimized.py)")
+    parser.add_argument("--test", action="store_true", help="Run against `test_input` instead of `input`")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Per-part timeout in seconds (default: {DEFAULT_TIMEOUT:.0f})")
+    parser.add_argument("--repeat", type=int, default=1, metavar="N",
+                        help="Time N calls to solve() per part, keeping the fastest (default: 1)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="Run N parts at once, slowest first (0 for one per core, default: 1)")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="Skip the second, traced run (halves the runtime)")
+    parser.add_argument("--json", metavar="FILE", help="Write the results as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="FILE", type=Path,
+                        help="A previous --json dump to compare timings against")
+    parser.add_argument("--check", action="store_true",
+                        help="Fail if any answer differs from answers.json, or a day runs over its budget")
+    parser.add_argument("--record", action="store_true",
+                        help="Add any answers (and budgets) missing from answers.json")
+    return parser.parse_args(argv)
+
+
+# =====
+
+def main(argv: Optional[list[str]] = None):
+    args = parse_args(argv)
+    solutions = select(discover(), years=args.year, days=args.day, parts=args.part,
+                       include_variants=not args.no_variants)
+    baseline = load_baseline(args.baseline) if args.baseline else None
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    results = run_all(solutions, jobs=jobs, test=args.test, timeout=args.timeout,
+                      trace=not args.no_tracemalloc, repeat=args.repeat)
+    elapsed = time.perf_counter() - start
+    print(f"Ran {len(results)} parts in {format_seconds(elapsed)} "
+          f"({jobs} worker{'s' * (jobs != 1)})", file=sys.stderr)
+    if not args.test:
+        save_timings(results)
+
+    input_name = "test_input" if args.test else "input"
+    report = {
+        "input": input_name,
+        "total_time": sum(r.wall_time or 0 for r in results),
+        "elapsed": elapsed,
+        "jobs": jobs,
+        "results": [dataclasses.asdict(r) for r in results],
+    }
+    if args.json == '-':
+        print(json.dumps(report, indent=2))
+    else:
+        print(render_table(results, baseline))
+        print()
+        print(render_failures(results))
+        if args.json:
+            with open(args.json, 'w') as file:
+                json.dump(report, file, indent=2)
+
+    if args.record:
+        manifest = check.load_manifest()
+        added = check.record(results, manifest, input_name)
+        check.save_manifest(manifest)
+        print(f"Recorded {added} new answer(s) in {check.MANIFEST_PATH.name}", file=sys.stderr)
+    if args.check:
+        manifest = check.load_manifest()
+        failures = check.check(results, manifest, input_name)
+        print(check.render_check(results, failures, manifest, input_name), file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
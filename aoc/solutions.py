@@ -0,0 +1,111 @@
+"""
+Solution discovery
+
+Python 3.9+
+
+Finds every Python solution in the repository. There are two layouts:
+  - {year}/{day}/{part}_answer.py       e.g. 2021/15/2_answer.py
+      Extra attempts have a suffix      e.g. 2023/4/2_answer_optimized.py
+      Inputs are `input` and `test_input`
+  - 2019/{day}/day{day}[_{part}].py     e.g. 2019/7/day7_2.py, 2019/9/day9.py
+      (The legacy layout. Files without a part solve both parts)
+      Inputs are `day{day}.in` and `day{day}test.in`
+"""
+
+import dataclasses
+import re
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Vars
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+MODERN_PATTERN = re.compile(r"(?P<part>[12])_answer(?:_(?P<variant>\w+))?\.py")
+LEGACY_PATTERN = re.compile(r"day(?P<day>\d+)(?:_(?P<part>[12]))?\.py")
+LEGACY_YEARS = {2019}
+
+INPUT_NAME = "input"
+TEST_INPUT_NAME = "test_input"
+
+
+# Classes
+@dataclasses.dataclass(frozen=True)
+class Solution:
+    year: int
+    day: int
+    part: Optional[int]     # None if the file solves both parts (legacy only)
+    variant: str            # e.g. "optimized", "INCOMPLETE". Empty for the main answer
+    path: Path
+    legacy: bool = False
+
+    @property
+    def name(self) -> str:
+        """
+        Human readable name, e.g. "2021/15.2" or "2023/4.2 (optimized)"
+        """
+        name = f"{self.year}/{self.day}"
+        if self.part is not None:
+            name += f".{self.part}"
+        if self.variant:
+            name += f" ({self.variant})"
+        return name
+
+    @property
+    def key(self) -> str:
+        """
+        Stable identifier, used to match results across runs
+        """
+        return f"{self.year}/{self.day}/{self.part or 0}/{self.variant}"
+
+    def input_path(self, test: bool = False) -> Path:
+        if self.legacy:
+            name = f"day{self.day}test.in" if test else f"day{self.day}.in"
+        else:
+            name = TEST_INPUT_NAME if test else INPUT_NAME
+        return self.path.with_name(name)
+
+
+# Funcs
+def _numbered_dirs(parent: Path) -> Iterator[tuple[int, Path]]:
+    for child in parent.iterdir():
+        if child.is_dir() and child.name.isdigit():
+            yield int(child.name), child
+
+
+def discover(root: Path = REPO_ROOT) -> list[Solution]:
+    """
+    Returns every solution under `root`, sorted by year/day/part
+    """
+    solutions = []
+    for year, year_dir in _numbered_dirs(root):
+        for day, day_dir in _numbered_dirs(year_dir):
+            for path in day_dir.glob("*.py"):
+                if year in LEGACY_YEARS:
+                    m = LEGACY_PATTERN.fullmatch(path.name)
+                    if m is None:
+                        continue
+                    part = int(m["part"]) if m["part"] else None
+                    solutions.append(Solution(year, day, part, "", path, legacy=True))
+                else:
+                    m = MODERN_PATTERN.fullmatch(path.name)
+                    if m is None:
+                        continue
+                    solutions.append(Solution(year, day, int(m["part"]), m["variant"] or "", path))
+
+    solutions.sort(key=lambda s: (s.year, s.day, s.part or 0, s.variant))
+    return solutions
+
+
+def select(solutions: list[Solution],
+           years: Optional[list[int]] = None,
+           days: Optional[list[int]] = None,
+           parts: Optional[list[int]] = None,
+           include_variants: bool = True) -> list[Solution]:
+    """
+    Filters the solutions down. `None` means "don't filter on this"
+    """
+    return [s for s in solutions
+            if (years is None or s.year in years)
+            and (days is None or s.day in days)
+            and (parts is None or s.part is None or s.part in parts)
+            and (include_variants or not s.variant)]
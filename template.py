@@ -30,12 +30,18 @@ class ParsedFile:
 # Funcs
 ...
 
+def solve(text: str):
+    """
+    Returns the answer for the given input text (no printing, no file access)
+    """
+    ...
+
 
 # =====
 
 def main():
     with p.open('r') as file:
-        ...
+        print(solve(file.read()))
 
 if __name__ == "__main__":
     main()